@@ -25,14 +25,26 @@ Requires https://github.com/MagicStack/immutables
 #
 
 # stdlib
+import pickle
 import timeit
+import tracemalloc
 import uuid
+from collections import OrderedDict
 
 # 3rd party
 import immutables
 
 # this package
-from cawdrey import frozendict
+from cawdrey import (
+		AlphaDict,
+		FrozenOrderedDict,
+		NonelessDict,
+		PersistentFrozenDict,
+		bdict,
+		bmultidict,
+		fastfrozendict,
+		frozendict
+		)
 
 dictionary_sizes = (8, 1000)
 max_size = max(dictionary_sizes)
@@ -158,6 +170,374 @@ for n in dictionary_sizes:
 					)
 
 			print(
-					"Dictionary size: {: >4}; Type: {: >10}; Statement: {: <25} time: {:.3f}; iterations: {: >8}"
+					"Dictionary size: {: >4}; Type: {: >14}; Statement: {: <25} time: {:.3f}; iterations: {: >8}"
 					.format(n, type(x).__name__, "`{}`;".format(statement["name"]), t, iterations),
 					)
+
+# Deriving a new mapping with a single key changed.
+# For the persistent types this should stay flat as the size grows.
+
+derivation_sizes = (8, 1000, 100000)
+derivation_statements = (
+		("frozendict", "x + {key: 'value'}"),
+		("PersistentFrozenDict", "x.set(key, 'value')"),
+		("Map", "x.set(key, 'value')"),
+		)
+
+for n in derivation_sizes:
+	print('#' * 80)
+	d = {getUuid(): getUuid() for i in range(n)}
+	key = next(iter(d))
+
+	for x in (frozendict(d), PersistentFrozenDict(d), immutables.Map(d)):
+		code = dict(derivation_statements)[type(x).__name__]
+		iterations = 100
+		t = timeit.timeit(stmt=code, globals={'x': x, "key": key}, number=iterations)
+
+		print(
+				"Dictionary size: {: >6}; Type: {: >20}; Statement: {: <25} time: {:.3f}; iterations: {: >8}"
+				.format(n, type(x).__name__, "`{}`;".format("derive one key"), t, iterations),
+				)
+
+# Building a frozendict key by key, via a temporary dict or via an evolver.
+
+build_statements = (
+		("dict + constructor", "tmp = {}\nfor k, v in items: tmp[k] = v\nfrozendict(tmp)"),
+		("evolver", "e = empty.evolver()\nfor k, v in items: e[k] = v\ne.persistent()"),
+		("dict.update + constructor", "tmp = {}\ntmp.update(items)\nfrozendict(tmp)"),
+		("evolver.update", "e = empty.evolver()\ne.update(items)\ne.persistent()"),
+		)
+
+for n in dictionary_sizes:
+	print('#' * 80)
+	items = [(getUuid(), getUuid()) for i in range(n)]
+	iterations = int(10000 * max_size / n)
+
+	for name, code in build_statements:
+		t = timeit.timeit(
+				stmt=code,
+				globals={"items": items, "frozendict": frozendict, "empty": frozendict()},
+				number=iterations,
+				)
+
+		print(
+				"Dictionary size: {: >4}; Statement: {: <30} time: {:.3f}; iterations: {: >8}".format(
+						n, "`{}`;".format(name), t, iterations
+						),
+				)
+
+# Compact small-map storage versus a dict-backed frozendict of the same size.
+
+
+class SmallFrozendict(frozendict):
+	__slots__ = ()
+	small_map_threshold = 8
+
+
+small_statements = (
+		("d[key]", "x[key]"),
+		("key in d", "key in x"),
+		("missing in d", "missing in x"),
+		("d.get(key)", "x.get(key)"),
+		("iter(d)", "for _ in x: pass"),
+		)
+
+print('#' * 80)
+d = {getUuid(): getUuid() for i in range(8)}
+key = list(d)[-1]
+
+for klass in (SmallFrozendict, frozendict):
+	tracemalloc.start()
+	before = tracemalloc.get_traced_memory()[0]
+	instances = [klass(d) for _ in range(10000)]
+	size = (tracemalloc.get_traced_memory()[0] - before - instances.__sizeof__()) / len(instances)
+	tracemalloc.stop()
+	del instances
+
+	print(f"Dictionary size:    8; Type: {klass.__name__: >20}; bytes per instance: {size:.1f}")
+
+	x = klass(d)
+	for name, code in small_statements:
+		iterations = 1000000
+		t = timeit.timeit(stmt=code, globals={'x': x, "key": key, "missing": getUuid()}, number=iterations)
+
+		print(
+				"Dictionary size:    8; Type: {: >20}; Statement: {: <25} time: {:.3f}; iterations: {: >8}"
+				.format(klass.__name__, "`{}`;".format(name), t, iterations),
+				)
+
+# Set algebra between two frozendicts which share half of their items,
+# and against a list of half of the keys.
+
+algebra_statements = (
+		("x & y", "x & y"),
+		("x - y", "x - y"),
+		("x + y", "x + y"),
+		("x & keys", "x & keys"),
+		("x - keys", "x - keys"),
+		)
+
+for n in derivation_sizes:
+	print('#' * 80)
+	d = {getUuid(): getUuid() for i in range(n)}
+	shared = dict(list(d.items())[:n // 2])
+	x = frozendict(d)
+	y = frozendict({**shared, **{getUuid(): getUuid() for i in range(n - len(shared))}})
+	keys = list(shared)
+	iterations = max(10, int(100000 / n))
+
+	for name, code in algebra_statements:
+		t = timeit.timeit(stmt=code, globals={'x': x, 'y': y, "keys": keys}, number=iterations)
+
+		print(
+				"Dictionary size: {: >6}; Statement: {: <25} time: {:.3f}; iterations: {: >8}".format(
+						n, "`{}`;".format(name), t, iterations
+						),
+				)
+
+# Looking up a batch of keys at once, versus a Python loop of single lookups.
+
+batch_statements = (
+		("[x.get(k) for k in keys]", "[x.get(k) for k in keys]"),
+		("x.getmany(keys)", "x.getmany(keys)"),
+		("[k in x for k in keys]", "[k in x for k in keys]"),
+		("x.contains_many(keys)", "x.contains_many(keys)"),
+		("x.pick(keys)", "x.pick(keys)"),
+		)
+
+for batch_size in (50, 500):
+	print('#' * 80)
+	d = {getUuid(): getUuid() for i in range(1000)}
+	keys = list(d)[:batch_size // 2] + [getUuid() for i in range(batch_size // 2)]
+
+	for x in (frozendict(d), PersistentFrozenDict(d)):
+		iterations = 2000
+
+		for name, code in batch_statements:
+			t = timeit.timeit(stmt=code, globals={'x': x, "keys": keys}, number=iterations)
+
+			print(
+					"Batch size: {: >4}; Type: {: >20}; Statement: {: <30} time: {:.3f}; iterations: {: >8}"
+					.format(batch_size, type(x).__name__, "`{}`;".format(name), t, iterations),
+					)
+
+# Pickling round trips, compared with a plain dict.
+
+for n in derivation_sizes:
+	print('#' * 80)
+	d = {getUuid(): getUuid() for i in range(n)}
+	iterations = max(10, int(100000 / n))
+
+	for x in (d, frozendict(d), FrozenOrderedDict(d), AlphaDict(d)):
+		data = pickle.dumps(x, pickle.HIGHEST_PROTOCOL)
+		dumps = timeit.timeit(
+				stmt="pickle.dumps(x, pickle.HIGHEST_PROTOCOL)",
+				globals={'x': x, "pickle": pickle},
+				number=iterations,
+				)
+		loads = timeit.timeit(stmt="pickle.loads(data)", globals={"data": data, "pickle": pickle}, number=iterations)
+
+		print(
+				"Dictionary size: {: >6}; Type: {: >20}; pickle size: {: >9}; dumps: {:.3f}; loads: {:.3f}; iterations: {: >8}"
+				.format(n, type(x).__name__, len(data), dumps, loads, iterations),
+				)
+
+# Reading from a frozendict versus from its C-level read-only proxy and the dict subclass.
+
+proxy_statements = (
+		("d.get(key)", "x.get(key)"),
+		("key in d", "key in x"),
+		("len(d)", "len(x)"),
+		("d[key]", "x[key]"),
+		("iter(d)", "for _ in x: pass"),
+		)
+
+for n in dictionary_sizes:
+	print('#' * 80)
+	d = {getUuid(): getUuid() for i in range(n)}
+	key = next(iter(d))
+	fd = frozendict(d)
+
+	for name, x in (("dict", d), ("frozendict", fd), ("proxy", fd.proxy()), ("fastfrozendict", fastfrozendict(d))):
+		for statement, code in proxy_statements:
+			iterations = 100000 if statement != "iter(d)" else int(100000 * 8 / n)
+			t = timeit.timeit(stmt=code, globals={'x': x, "key": key}, number=iterations)
+
+			print(
+					"Dictionary size: {: >4}; Type: {: >14}; Statement: {: <25} time: {:.3f}; iterations: {: >8}"
+					.format(n, name, "`{}`;".format(statement), t, iterations),
+					)
+
+# Adding a few items to an AlphaDict: rebuilding it from scratch versus merging the new items in.
+
+for n in derivation_sizes:
+	print('#' * 80)
+	alpha = AlphaDict((getUuid(), getUuid()) for i in range(n))
+	changes = {getUuid(): getUuid() for i in range(5)}
+	iterations = 1000 if n <= 1000 else 10
+
+	rebuild = timeit.timeit(
+			stmt="AlphaDict(dict(alpha, **changes))",
+			globals={"alpha": alpha, "changes": changes, "AlphaDict": AlphaDict},
+			number=iterations,
+			)
+	merge = timeit.timeit(
+			stmt="alpha.merge(changes)",
+			globals={"alpha": alpha, "changes": changes},
+			number=iterations,
+			)
+
+	print(
+			"Dictionary size: {: >6}; rebuild: {:.3f}; merge: {:.3f}; iterations: {: >5}".format(
+					n, rebuild, merge, iterations
+					),
+			)
+
+# Prefix and range lookups in a large AlphaDict, versus scanning every key.
+
+print('#' * 80)
+alpha = AlphaDict((getUuid(), i) for i in range(200000))
+key = next(alpha.islice(5000, 5001))  # also builds the sorted key list
+iterations = 1000
+
+for statement in (
+		"[k for k in alpha if k.startswith('abc')]",
+		"list(alpha.prefix('abc'))",
+		"list(alpha.irange('abc', 'abd', inclusive=(True, False)))",
+		"list(alpha.islice(100000, 100010))",
+		"alpha.index(key)",
+		):
+	n = 10 if statement.startswith("[k") else iterations
+	t = timeit.timeit(stmt=statement, globals={"alpha": alpha, "key": key}, number=n)
+
+	print(
+			"Dictionary size: 200000; Statement: {: <60} time per call: {:.6f}s".format(
+					"`{}`;".format(statement), t / n
+					),
+			)
+
+# FrozenOrderedDict backed by a plain dict, versus the OrderedDict it used previously.
+
+
+class _OrderedDictBacked(FrozenOrderedDict):
+	__slots__ = ()
+	dict_cls = OrderedDict
+
+
+for n in (1000, 1000000):
+	print('#' * 80)
+	items = [(getUuid(), i) for i in range(n)]
+	iterations = 100 if n <= 1000 else 1
+
+	for cls in (FrozenOrderedDict, _OrderedDictBacked):
+		tracemalloc.start()
+		fod = cls(items)
+		memory = tracemalloc.get_traced_memory()[0]
+		tracemalloc.stop()
+
+		build = timeit.timeit(stmt="cls(items)", globals={"cls": cls, "items": items}, number=iterations)
+		iterate = timeit.timeit(stmt="for _ in x.items(): pass", globals={'x': fod}, number=iterations)
+
+		print(
+				"Dictionary size: {: >7}; Backing store: {: >11}; memory: {: >10} bytes; build: {:.3f}; iterate: {:.3f}; iterations: {: >3}"
+				.format(n, cls.dict_cls.__name__, memory, build, iterate, iterations),
+				)
+
+		del fod
+
+# Lookups in a bdict, in each direction, versus a dict.
+
+for n in derivation_sizes:
+	print('#' * 80)
+	d = {getUuid(): getUuid() for i in range(n)}
+	key, value = next(iter(d.items()))
+	bd = bdict(d)
+	iterations = 1000000
+
+	for name, statement in (
+			("dict", "d[key]"),
+			("bdict", "bd[key]"),
+			("bdict", "bd[value]"),
+			("bdict.inverse", "inverse[value]"),
+			):
+		t = timeit.timeit(
+				stmt=statement,
+				globals={'d': d, "bd": bd, "inverse": bd.inverse, "key": key, "value": value},
+				number=iterations,
+				)
+
+		print(
+				"Dictionary size: {: >6}; Type: {: >13}; Statement: {: <17} time: {:.3f}; iterations: {: >8}".format(
+						n, name, "`{}`;".format(statement), t, iterations
+						),
+				)
+
+# Loading pairs into a bdict: one __setitem__ call per pair, versus the bulk update.
+
+for n in (1000, 1000000):
+	print('#' * 80)
+	pairs = [(getUuid(), getUuid()) for i in range(n)]
+	iterations = 100 if n <= 1000 else 1
+
+	for name, statement in (
+			("__setitem__", "bd = bdict()\nfor k, v in pairs: bd[k] = v"),
+			("update()", "bdict().update(pairs)"),
+			("from_pairs()", "bdict.from_pairs(pairs)"),
+			("update() overlapping", "bd = bdict(pairs[::2])\nbd.update(pairs)"),
+			):
+		t = timeit.timeit(stmt=statement, globals={"bdict": bdict, "pairs": pairs}, number=iterations)
+
+		print(
+				"Pairs: {: >7}; Method: {: >20}; time: {:.3f}; iterations: {: >3}".format(n, name, t, iterations),
+				)
+
+# A one-to-many index: bmultidict versus two hand-synchronised dicts of sets, and the cost of a snapshot.
+
+print('#' * 80)
+pairs = [(getUuid()[:3], getUuid()) for i in range(100000)]
+
+
+def _add_by_hand(pairs):
+	fwd, inv = {}, {}
+	for key, value in pairs:
+		fwd.setdefault(key, set()).add(value)
+		inv.setdefault(value, set()).add(key)
+	return fwd, inv
+
+
+for name, statement in (
+		("dicts of sets", "_add_by_hand(pairs)"),
+		("bmultidict", "bmultidict(pairs)"),
+		):
+	t = timeit.timeit(
+			stmt=statement,
+			globals={"bmultidict": bmultidict, "_add_by_hand": _add_by_hand, "pairs": pairs},
+			number=10,
+			)
+	print("Pairs: 100000; Type: {: >13}; build time: {:.3f}; iterations: 10".format(name, t))
+
+index = bmultidict(pairs)
+t = timeit.timeit(
+		stmt="index.add(key, getUuid())\nindex.snapshot()",
+		globals={"index": index, "key": pairs[0][0], "getUuid": getUuid},
+		number=100,
+		)
+print("Pairs: 100000; snapshot after each add: {:.3f}; iterations: 100".format(t))
+
+# Building a NonelessDict from a sparse payload: one __setitem__ call per item, versus filtering in bulk.
+
+print('#' * 80)
+payload = {getUuid(): (None if i % 3 == 0 else ('' if i % 3 == 1 else i)) for i in range(20)}
+iterations = 100000
+
+for name, statement in (
+		("__setitem__", "nd = NonelessDict()\nfor k, v in payload.items(): nd[k] = v"),
+		("constructor", "NonelessDict(payload)"),
+		("update()", "NonelessDict().update(payload)"),
+		("from_items(strict_none=True)", "NonelessDict.from_items(payload, strict_none=True)"),
+		):
+	t = timeit.timeit(stmt=statement, globals={"NonelessDict": NonelessDict, "payload": payload}, number=iterations)
+
+	print(
+			"Payload size: 20; Method: {: >28}; time: {:.3f}; iterations: {: >6}".format(name, t, iterations),
+			)
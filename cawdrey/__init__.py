@@ -27,12 +27,18 @@ Provides several useful custom dictionaries.
 #
 
 # this package
-from ._bdict import bdict
+from ._bdict import bdict, frozenbdict
+from ._bmultidict import bmultidict, frozenbmultidict
 from ._frozendict import frozendict
 from .alphadict import AlphaDict, alphabetical_dict
 from .base import FrozenBase, MutableBase
+from .fastfrozendict import FastFrozenOrderedDict, fastfrozendict
 from .frozenordereddict import FrozenOrderedDict
+from .intern import InternedFrozenDict, InternedFrozenOrderedDict
+from .mappedfrozendict import MappedFrozenDict
 from .nonelessdict import NonelessDict, NonelessOrderedDict
+from .persistentfrozendict import PersistentFrozenDict
+from .sharedfrozendict import SharedFrozenDict
 from .tally import Tally
 
 __author__: str = "Dominic Davis-Foster"
@@ -46,11 +52,21 @@ __all__ = [
 		"alphabetical_dict",
 		"AlphaDict",
 		"bdict",
+		"bmultidict",
+		"fastfrozendict",
+		"FastFrozenOrderedDict",
+		"frozenbdict",
+		"frozenbmultidict",
 		"FrozenBase",
 		"frozendict",
 		"FrozenOrderedDict",
+		"InternedFrozenDict",
+		"InternedFrozenOrderedDict",
+		"MappedFrozenDict",
 		"MutableBase",
 		"NonelessDict",
 		"NonelessOrderedDict",
+		"PersistentFrozenDict",
+		"SharedFrozenDict",
 		"Tally",
 		]
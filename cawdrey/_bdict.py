@@ -2,7 +2,8 @@
 #
 #  bdict.py
 """
-Provides bdict, a dictionary where keys and values are also stored the other way round.
+Provides bdict, a dictionary where keys and values are also stored the other way round,
+and its immutable counterpart frozenbdict.
 """
 #
 #  Copyright © 2019-2020 Dominic Davis-Foster <dominic@davis-foster.co.uk>
@@ -27,12 +28,35 @@ Provides bdict, a dictionary where keys and values are also stored the other way
 
 # stdlib
 from collections import UserDict
-from typing import AbstractSet, Iterable, Optional, Tuple, Union, ValuesView, overload
+from typing import (
+		AbstractSet,
+		Dict,
+		Iterable,
+		List,
+		Mapping,
+		Optional,
+		Tuple,
+		Type,
+		TypeVar,
+		Union,
+		ValuesView,
+		overload
+		)
+
+# 3rd party
+from domdf_python_tools.doctools import prettify_docstrings
 
 # this package
-from cawdrey.base import KT, VT, T
+from cawdrey.base import KT, VT, FrozenBase, T
 
-__all__ = ["bdict"]
+__all__ = ["bdict", "frozenbdict"]
+
+_B = TypeVar("_B", bound="bdict")
+_FB = TypeVar("_FB", bound="frozenbdict")
+
+_MISSING = object()
+
+_POLICIES = ("raise", "overwrite", "keep")
 
 
 class bdict(UserDict):
@@ -55,11 +79,20 @@ class bdict(UserDict):
 	If keyword arguments are given, the keyword arguments and their values are
 	added to the dictionary created from the positional argument.
 
-	If an attempt is made to add a key or value that already exists in the
-	dictionary a :exc:`ValueError` will be raised.
+	Setting a key which is already present, or a value which is already present,
+	replaces the existing pair containing that key or value.
 
-	Keys or values of :py:obj:`None`, :py:obj:`True` and :py:obj:`False` will be stored internally as
-	``"_None"``, ``"_True"`` and ``"_False"`` respectively
+	.. versionchanged:: 0.6.0
+
+		The pairs are stored in two dictionaries, one in each direction.
+		``self.data`` only contains the forward (``key: value``) direction,
+		so iterating over the :class:`~.bdict` and :func:`len` only count each pair once,
+		and the reverse direction is available from :attr:`~.bdict.inverse`.
+		Indexing with ``self[value]`` still works, but only after the lookup by key fails.
+
+		:py:obj:`None`, :py:obj:`True` and :py:obj:`False` are no longer stored as
+		``"_None"``, ``"_True"`` and ``"_False"``. As with :class:`dict`, values which compare equal
+		(such as ``1`` and :py:obj:`True`) are treated as the same key.
 
 	:param seq: Iterable to construct dict from.
 	:param \*\*kwargs: Keyword values to construct dict from.
@@ -70,17 +103,36 @@ class bdict(UserDict):
 	# Improved May 2020 with suggestions from
 	# https://treyhunner.com/2019/04/why-you-shouldnt-inherit-from-list-and-dict-in-python/
 
-	def __init__(self, seq: Optional[Iterable] = None, **kwargs):
-		# if seq and kwargs:
-		# 	raise TypeError(f'expected at most 1 arguments, got {len(kwargs)-1:d}')
+	data: Dict[KT, VT]
+	_inverse: Dict[VT, KT]
+	_inverse_view: Optional["bdict"]
 
+	def __init__(self, seq: Optional[Iterable] = None, **kwargs):
+		self._inverse = {}
+		self._inverse_view = None
 		super().__init__(seq, **kwargs)
-		# if seq:
-		# 	for key, value in dict(seq).items():
-		# 		self.__setitem__(key, value)
-		# else:
-		# 	for key, value in kwargs.items():
-		# 		self.__setitem__(key, value)
+
+	@property
+	def inverse(self) -> "bdict":
+		"""
+		A :class:`~.bdict` mapping each value to its key.
+
+		It shares its storage with this dictionary, so changes to either are reflected in the other,
+		and ``self.inverse.inverse is self``.
+
+		.. versionadded:: 0.6.0
+		"""
+
+		view = self._inverse_view
+
+		if view is None:
+			view = self.__class__.__new__(self.__class__)
+			view.data = self._inverse
+			view._inverse = self.data
+			view._inverse_view = self
+			self._inverse_view = view
+
+		return view
 
 	def __setitem__(self, key, val) -> None:  # noqa: MAN001
 		"""
@@ -90,73 +142,52 @@ class bdict(UserDict):
 		:param val:
 		"""
 
-		if key in self:
-			del self[self[key]]
-		if val in self:
-			del self[val]
-		#
-		# if key in self or val in self:
-		# 	if key in self and self[key] != val:
-		# 		raise ValueError(f"The key '{key}' is already present in the dictionary")
-		# 	if val in self and self[val] != key:
-		# 		raise ValueError(f"The key '{val}' is already present in the dictionary")
-
-		if key is None:
-			key = "_None"
-		if val is None:
-			val = "_None"
-
-		if isinstance(key, bool):
-			if key:
-				key = "_True"
-			else:
-				key = "_False"
-
-		if isinstance(val, bool):
-			if val:
-				val = "_True"
-			else:
-				val = "_False"
-
-		self.data[key] = val
-		self.data[val] = key
+		data, inverse = self.data, self._inverse
+
+		if key in data:
+			del inverse[data[key]]
+		if val in inverse:
+			del data[inverse.pop(val)]
+
+		data[key] = val
+		inverse[val] = key
 
 	def __delitem__(self, key: KT) -> None:
 		"""
 		Delete ``self[key]``.
 
+		``key`` may also be the value of a pair, in which case that pair is deleted.
+
 		:param key:
 		"""
 
-		value = self.data.pop(key)
-		self.data.pop(value, None)
+		data, inverse = self.data, self._inverse
+
+		if key in data:
+			del inverse[data.pop(key)]
+		elif key in inverse:
+			del data[inverse.pop(key)]
+		else:
+			raise KeyError(key)
 
 	def __getitem__(self, key: KT) -> VT:
 		"""
 		Return ``self[key]``.
 
+		If ``key`` is not a key of the dictionary but is one of its values, the corresponding key is returned.
+
 		:param key:
 		"""
 
-		if key is None:
-			key = "_None"
+		val = self.data.get(key, _MISSING)
 
-		if isinstance(key, bool):
-			if key:
-				key = "_True"
-			else:
-				key = "_False"
+		if val is _MISSING:
+			val = self._inverse.get(key, _MISSING)
 
-		val = super().__getitem__(key)
+			if val is _MISSING:
+				raise KeyError(key)
 
-		if val == "_None":
-			return None
-		elif val == "_True":
-			return True
-		elif val == "_False":
-			return False
-		else:
-			return val
+		return val  # type: ignore[return-value]
 
 	def __contains__(self, key: object) -> bool:
 		"""
@@ -165,16 +196,7 @@ class bdict(UserDict):
 		:param key:
 		"""
 
-		if key is None:
-			key = "_None"
-
-		if isinstance(key, bool):
-			if key:
-				key = "_True"
-			else:
-				key = "_False"
-
-		return super().__contains__(key)
+		return key in self.data or key in self._inverse
 
 	@overload
 	def get(self, k: KT) -> Optional[VT]: ...  # pragma: no cover
@@ -190,32 +212,335 @@ class bdict(UserDict):
 		:param default: The value to return if ``key`` is not in the dictionary.
 		"""
 
-		return super().get(k, default)
+		val = self.data.get(k, _MISSING)
+
+		if val is _MISSING:
+			return self._inverse.get(k, default)
+
+		return val
 
 	def items(self) -> AbstractSet[Tuple[KT, VT]]:
 		r"""
 		Returns a set-like object providing a view on the :class:`~.bdict`\'s items.
 		"""
 
-		return super().items()
+		return self.data.items()
 
 	def keys(self) -> AbstractSet[KT]:
 		r"""
 		Returns a set-like object providing a view on the :class:`~.bdict`\'s keys.
 		"""
 
-		return super().keys()
+		return self.data.keys()
 
 	def values(self) -> ValuesView[VT]:
 		r"""
 		Returns an object providing a view on the :class:`~.bdict`\'s values.
 		"""
 
-		return super().values()
+		return self.data.values()
+
+	def update(  # type: ignore[override]
+			self,
+			*args,
+			on_conflict: str = "overwrite",
+			**kwargs,
+			) -> List[Tuple[KT, VT]]:
+		r"""
+		Add the pairs from a mapping or iterable of pairs, and/or keyword arguments.
+
+		The pairs are added in order, as with :meth:`dict.update`.
+		``on_conflict`` controls what happens when a new pair has the same key or the same value as a pair
+		already in the :class:`~.bdict` (or added earlier in the same batch):
+
+		* ``'overwrite'`` (the default) replaces the existing pairs, as :meth:`~.bdict.__setitem__` does.
+		* ``'keep'`` keeps the existing pairs, and skips the new pair.
+		* ``'raise'`` raises a :exc:`ValueError`, without adding any of the pairs.
+
+		Batches which do not conflict with the existing pairs are added without a Python-level loop.
+
+		.. versionadded:: 0.6.0
+
+		:param \*args:
+		:param on_conflict:
+		:param \*\*kwargs:
+
+		:returns: The pairs which were removed (for ``'overwrite'``), or which were skipped (for ``'keep'``).
+		"""
+
+		if on_conflict not in _POLICIES:
+			raise ValueError(f"Unexpected value for parameter `on_conflict`: {on_conflict}")
+
+		pairs = _as_pairs(args, kwargs)
+		batch = dict(pairs)
+		data, inverse = self.data, self._inverse
+		batch_inverse = {value: key for key, value in batch.items()}
+
+		if (
+				len(batch) == len(pairs) and len(batch_inverse) == len(batch)
+				and batch.keys().isdisjoint(data.keys()) and batch_inverse.keys().isdisjoint(inverse.keys())
+				):
+			# No conflicts, either within the batch or with the existing pairs.
+			data.update(batch)
+			inverse.update(batch_inverse)
+			return []
+
+		if on_conflict == "raise":
+			_check_conflicts(pairs, data, inverse)
+
+		keep = on_conflict == "keep"
+		changed: List[Tuple[KT, VT]] = []
+
+		# Resolve the pairs one at a time, as an earlier pair for a key may evict a pair which a later one would not.
+		for key, value in pairs:
+			old_value = data.get(key, _MISSING)
+			old_key = inverse.get(value, _MISSING)
+
+			if old_key is not _MISSING and old_key == key:
+				# The pair is already present.
+				continue
+
+			if old_value is not _MISSING or old_key is not _MISSING:
+				if keep:
+					changed.append((key, value))
+					continue
+
+				if old_value is not _MISSING:
+					del inverse[old_value]
+					changed.append((key, old_value))  # type: ignore[arg-type]
+				if old_key is not _MISSING:
+					del data[old_key]
+					changed.append((old_key, value))  # type: ignore[arg-type]
+
+			data[key] = value
+			inverse[value] = key
+
+		return changed
+
+	@classmethod
+	def from_pairs(cls: Type[_B], pairs: Union[Mapping, Iterable[Tuple]], on_conflict: str = "raise") -> _B:
+		"""
+		Construct a new :class:`~.bdict` from a mapping or iterable of pairs.
+
+		Unlike the constructor, by default a :exc:`ValueError` is raised if two pairs have the same value.
+
+		.. versionadded:: 0.6.0
+
+		:param pairs:
+		:param on_conflict: What to do when two pairs have the same value. See :meth:`~.bdict.update`.
+		"""
+
+		new = cls()
+		new.update(pairs, on_conflict=on_conflict)
+		return new
 
 	def clear(self) -> None:
 		"""
 		Removes all items from the :class:`~.bdict`.
 		"""
 
-		return super().clear()
+		self.data.clear()
+		self._inverse.clear()
+
+	def copy(self: _B) -> _B:
+		"""
+		Return a shallow copy of the :class:`~.bdict`.
+		"""
+
+		new = self.__class__.__new__(self.__class__)
+		new.__dict__.update(self.__dict__)
+		new.data = self.data.copy()
+		new._inverse = self._inverse.copy()
+		new._inverse_view = None
+		return new
+
+	__copy__ = copy
+
+	def __ior__(self: _B, other) -> _B:  # noqa: MAN001
+		self.update(other)
+		return self
+
+
+@prettify_docstrings
+class frozenbdict(FrozenBase[KT, VT]):  # noqa: PRM002
+	r"""
+	An immutable, hashable one-to-one mapping, with constant-time lookups in both directions.
+
+	It is constructed in the same way as a :class:`dict`.
+	Lookups by value are performed on :attr:`~.frozenbdict.inverse`,
+	which is itself a :class:`~.frozenbdict` from values to keys.
+	Unlike :class:`~.bdict`, indexing the :class:`~.frozenbdict` directly only looks up keys,
+	so it behaves exactly like any other :class:`~collections.abc.Mapping`.
+
+	Constructing a :class:`~.frozenbdict` from a :class:`~.bdict` copies both of its tables directly,
+	since the pairs are already known to be one-to-one.
+
+	.. versionadded:: 0.6.0
+
+	:raises ValueError: If two keys have the same value.
+	"""
+
+	__slots__ = ("_inverse", "_inverse_view")
+
+	dict_cls = dict
+	_inverse: Dict[VT, KT]
+	_inverse_view: Optional["frozenbdict[VT, KT]"]
+	_transient_slots = FrozenBase._transient_slots | {"_inverse", "_inverse_view"}
+
+	def __init__(self, *args, **kwargs):
+		if hasattr(self, "_dict"):
+			raise TypeError(f"`{self.__class__}` can only be initialised once.")
+
+		self._hash = None
+		self._inverse_view = None
+
+		if len(args) == 1 and not kwargs:
+			other = args[0]
+
+			if isinstance(other, frozenbdict):
+				# Both are immutable, so the tables can be shared.
+				self._dict = other._dict
+				self._inverse = other._inverse
+				self._hash = other._hash if type(other).__hash__ is type(self).__hash__ else None
+				return
+
+			if isinstance(other, bdict):
+				# A bdict is always one-to-one, so there is nothing to check.
+				self._dict = other.data.copy()
+				self._inverse = other._inverse.copy()
+				return
+
+		self._dict = dict(*args, **kwargs)
+		self._inverse = _invert(self._dict)
+
+	@classmethod
+	def _from_tables(cls: Type[_FB], forward: dict, inverse: dict) -> _FB:
+		new = cls.__new__(cls)
+		new._dict = forward
+		new._inverse = inverse
+		new._hash = None
+		new._inverse_view = None
+		return new
+
+	@classmethod
+	def adopt(cls: Type[_FB], d: dict) -> _FB:
+		"""
+		Construct a new :class:`~.frozenbdict` which takes ownership of ``d`` without copying it.
+
+		The caller must not modify ``d`` afterwards.
+		The inverse table is still built from ``d``.
+
+		:param d:
+
+		:raises ValueError: If two keys have the same value.
+		"""
+
+		if type(d) is not dict:
+			d = dict(d)
+
+		return cls._from_tables(d, _invert(d))
+
+	@property
+	def inverse(self) -> "frozenbdict[VT, KT]":
+		"""
+		A :class:`~.frozenbdict` mapping each value to its key.
+
+		It shares its tables with this dictionary, and ``self.inverse.inverse is self``.
+		"""
+
+		view = self._inverse_view
+
+		if view is None:
+			view = self._from_tables(self._inverse, self._dict)
+			view._inverse_view = self
+			self._inverse_view = view
+
+		return view
+
+	def copy(self: _FB, *args, **kwargs) -> _FB:  # noqa: PRM002
+		"""
+		Return a copy of the dictionary, updated with the given items.
+
+		:raises ValueError: If the result would contain two keys with the same value.
+		"""
+
+		changes = dict(*args, **kwargs)
+		d = self._dict.copy()
+		d.update(changes)
+
+		new = self.adopt(d)
+		new._hash = self._derived_hash(
+				removed=((k, self._dict[k]) for k in changes if k in self._dict),
+				added=changes.items(),
+				)
+		return new
+
+	def __hash__(self) -> int:
+		if self._hash is None:
+			h = 0
+			for key, value in self._dict.items():
+				h ^= hash((key, value))
+			self._hash = h
+		return self._hash
+
+
+def _as_pairs(args: tuple, kwargs: Dict) -> List[Tuple]:
+	# Returns the pairs given to :meth:`bdict.update`, in the order :meth:`dict.update` would add them.
+
+	if len(args) > 1:
+		raise TypeError(f"update expected at most 1 positional argument, got {len(args)}")
+
+	pairs: List[Tuple] = []
+
+	if args:
+		other = args[0]
+		if isinstance(other, Mapping):
+			pairs.extend(other.items())
+		elif hasattr(other, "keys"):
+			pairs.extend((key, other[key]) for key in other.keys())
+		else:
+			pairs.extend(other)
+
+	pairs.extend(kwargs.items())
+	return pairs
+
+
+def _check_conflicts(pairs: Iterable[Tuple], data: Dict, inverse: Dict) -> None:
+	# Raises :exc:`ValueError` if adding ``pairs`` would replace any pairs, including those earlier in ``pairs``.
+
+	seen: Dict = {}
+	seen_keys: Dict = {}
+
+	for key, value in pairs:
+		if key in seen_keys:
+			if seen_keys[key] != value:
+				raise ValueError(f"The key {key!r} is given twice, with the values {seen_keys[key]!r} and {value!r}.")
+			continue
+
+		old_value = data.get(key, _MISSING)
+		old_key = inverse.get(value, _MISSING)
+
+		if old_value is not _MISSING and old_value != value:
+			raise ValueError(f"The key {key!r} is already present in the dictionary, with the value {old_value!r}.")
+		if old_key is not _MISSING and old_key != key:
+			raise ValueError(f"The value {value!r} is already present in the dictionary, with the key {old_key!r}.")
+		if value in seen:
+			raise ValueError(f"The keys {seen[value]!r} and {key!r} have the same value {value!r}.")
+
+		seen[value] = key
+		seen_keys[key] = value
+
+
+def _invert(d: Mapping) -> Dict:
+	# Returns the inverse of ``d``, raising :exc:`ValueError` if two keys have the same value.
+
+	inverse = {value: key for key, value in d.items()}
+
+	if len(inverse) != len(d):
+		seen: Dict = {}
+		for key, value in d.items():
+			if value in seen:
+				raise ValueError(f"The keys {seen[value]!r} and {key!r} have the same value {value!r}.")
+			seen[value] = key
+
+	return inverse
@@ -1,9 +1,27 @@
 # stdlib
 from collections import UserDict
-from typing import Iterable, Optional
+from typing import Iterable, List, Mapping, Optional, Tuple, Type, TypeVar, Union
 
 # this package
-from cawdrey.base import KT, VT
+from cawdrey.base import KT, VT, FrozenBase
+
+_B = TypeVar("_B", bound=bdict)
+_FB = TypeVar("_FB", bound=frozenbdict)
 
 class bdict(UserDict[KT, VT]):
 	def __init__(self, seq: Optional[Iterable] = ..., **kwargs): ...
+	@property
+	def inverse(self) -> bdict[VT, KT]: ...
+	def copy(self: _B) -> _B: ...
+	def update(self, *args, on_conflict: str = ..., **kwargs) -> List[Tuple[KT, VT]]: ...  # type: ignore[override]
+	@classmethod
+	def from_pairs(cls: Type[_B], pairs: Union[Mapping, Iterable[Tuple]], on_conflict: str = ...) -> _B: ...
+
+class frozenbdict(FrozenBase[KT, VT]):
+	def __init__(self, *args, **kwargs): ...
+	@classmethod
+	def adopt(cls: Type[_FB], d: dict) -> _FB: ...
+	@property
+	def inverse(self) -> frozenbdict[VT, KT]: ...
+	def copy(self: _FB, *args, **kwargs) -> _FB: ...
+	def __hash__(self) -> int: ...
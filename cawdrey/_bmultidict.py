@@ -0,0 +1,541 @@
+#!/usr/bin/env python
+#
+#  _bmultidict.py
+"""
+Provides bmultidict, a one-to-many mapping which is indexed in both directions,
+and frozenbmultidict, an immutable snapshot of one.
+
+.. versionadded:: 0.6.0
+"""
+#
+#  Copyright © 2022 Dominic Davis-Foster <dominic@davis-foster.co.uk>
+#
+#  This program is free software; you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published by
+#  the Free Software Foundation; either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with this program; if not, write to the Free Software
+#  Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+#  MA 02110-1301, USA.
+#
+
+# stdlib
+from typing import (
+		AbstractSet,
+		Any,
+		Dict,
+		FrozenSet,
+		Iterable,
+		Iterator,
+		Mapping,
+		MutableMapping,
+		Optional,
+		Set,
+		Tuple,
+		TypeVar
+		)
+
+# 3rd party
+from domdf_python_tools.doctools import prettify_docstrings
+
+# this package
+from cawdrey.base import KT, VT
+
+__all__ = ["bmultidict", "frozenbmultidict"]
+
+_BM = TypeVar("_BM", bound="bmultidict")
+
+
+def _add(table: Dict, owned: Optional[Set], a: Any, b: Any) -> None:
+	# Add ``b`` to the set for ``a``, copying the set first if it is shared with a snapshot.
+
+	members = table.get(a)
+
+	if members is None:
+		table[a] = {b}
+		if owned is not None:
+			owned.add(a)
+		return
+
+	if owned is not None and a not in owned:
+		table[a] = members = set(members)
+		owned.add(a)
+
+	members.add(b)
+
+
+def _discard(table: Dict, owned: Optional[Set], a: Any, b: Any) -> None:
+	# Remove ``b`` from the set for ``a``, which must contain it.
+
+	members = table[a]
+
+	if len(members) == 1:
+		del table[a]
+		if owned is not None:
+			owned.discard(a)
+		return
+
+	if owned is not None and a not in owned:
+		table[a] = members = set(members)
+		owned.add(a)
+
+	members.discard(b)
+
+
+def _iter_pairs(table: Dict) -> Iterator[Tuple[Any, Any]]:
+	for key, members in table.items():
+		for value in members:
+			yield key, value
+
+
+@prettify_docstrings
+class bmultidict(MutableMapping[KT, FrozenSet[VT]]):
+	"""
+	A one-to-many mapping from keys to sets of values, which is also indexed from each value to its keys.
+
+	Pairs are added with :meth:`~.bmultidict.add` and removed with :meth:`~.bmultidict.discard`,
+	in amortised constant time, and both indexes are always kept in sync.
+	``self[key]`` returns the values for ``key``, and ``self.inverse[value]`` the keys for ``value``,
+	in both cases as a :class:`frozenset`. Keys with no values are not stored.
+
+	:meth:`~.bmultidict.snapshot` returns an immutable :class:`~.frozenbmultidict` with the current contents.
+	Snapshots share the sets of values with the live index,
+	which only copies a set when it is next modified.
+
+	.. versionadded:: 0.6.0
+
+	:param pairs: An iterable of ``(key, value)`` pairs,
+		or a mapping of keys to iterables of values, to populate the index from.
+	"""
+
+	__slots__ = ("_fwd", "_inv", "_owned_fwd", "_owned_inv", "_snapshot")
+
+	_fwd: Dict[KT, Set[VT]]
+	_inv: Dict[VT, Set[KT]]
+
+	# The keys of the sets which are not shared with a snapshot, or None if no snapshot has been taken.
+	_owned_fwd: Optional[Set[KT]]
+	_owned_inv: Optional[Set[VT]]
+
+	_snapshot: Optional["frozenbmultidict[KT, VT]"]
+
+	def __init__(self, pairs: Any = ()):
+		self._fwd = {}
+		self._inv = {}
+		self._owned_fwd = None
+		self._owned_inv = None
+		self._snapshot = None
+
+		if isinstance(pairs, Mapping):
+			for key, values in pairs.items():
+				self.add_many((key, value) for value in values)
+		else:
+			self.add_many(pairs)
+
+	def add(self, key: KT, value: VT) -> None:
+		"""
+		Add the pair ``(key, value)``, if it is not already present.
+
+		:param key:
+		:param value:
+		"""
+
+		members = self._fwd.get(key)
+
+		if members is not None and value in members:
+			return
+
+		_add(self._fwd, self._owned_fwd, key, value)
+		_add(self._inv, self._owned_inv, value, key)
+		self._snapshot = None
+
+	def discard(self, key: KT, value: VT) -> None:
+		"""
+		Remove the pair ``(key, value)``, if it is present.
+
+		:param key:
+		:param value:
+		"""
+
+		members = self._fwd.get(key)
+
+		if members is None or value not in members:
+			return
+
+		_discard(self._fwd, self._owned_fwd, key, value)
+		_discard(self._inv, self._owned_inv, value, key)
+		self._snapshot = None
+
+	def remove(self, key: KT, value: VT) -> None:
+		"""
+		Remove the pair ``(key, value)``.
+
+		:param key:
+		:param value:
+
+		:raises KeyError: If the pair is not present.
+		"""
+
+		if not self.has(key, value):
+			raise KeyError((key, value))
+
+		self.discard(key, value)
+
+	def add_many(self, pairs: Iterable[Tuple[KT, VT]]) -> None:
+		"""
+		Add each of the ``(key, value)`` pairs in ``pairs``.
+
+		:param pairs:
+		"""
+
+		fwd, inv = self._fwd, self._inv
+		owned_fwd, owned_inv = self._owned_fwd, self._owned_inv
+
+		changed = False
+
+		if owned_fwd is None and owned_inv is None:
+			# No snapshot has been taken, so none of the sets are shared and they can be modified in place.
+			for key, value in pairs:
+				members = fwd.get(key)
+
+				if members is None:
+					fwd[key] = {value}
+				elif value in members:
+					continue
+				else:
+					members.add(value)
+
+				keys = inv.get(value)
+
+				if keys is None:
+					inv[value] = {key}
+				else:
+					keys.add(key)
+
+				changed = True
+
+		else:
+			for key, value in pairs:
+				members = fwd.get(key)
+
+				if members is not None and value in members:
+					continue
+
+				_add(fwd, owned_fwd, key, value)
+				_add(inv, owned_inv, value, key)
+				changed = True
+
+		if changed:
+			self._snapshot = None
+
+	def discard_many(self, pairs: Iterable[Tuple[KT, VT]]) -> None:
+		"""
+		Remove each of the ``(key, value)`` pairs in ``pairs``. Pairs which are not present are ignored.
+
+		:param pairs:
+		"""
+
+		fwd, inv = self._fwd, self._inv
+		owned_fwd, owned_inv = self._owned_fwd, self._owned_inv
+
+		changed = False
+
+		for key, value in pairs:
+			members = fwd.get(key)
+
+			if members is None or value not in members:
+				continue
+
+			_discard(fwd, owned_fwd, key, value)
+			_discard(inv, owned_inv, value, key)
+			changed = True
+
+		if changed:
+			self._snapshot = None
+
+	def has(self, key: KT, value: VT) -> bool:
+		"""
+		Returns whether the pair ``(key, value)`` is present.
+
+		:param key:
+		:param value:
+		"""
+
+		members = self._fwd.get(key)
+		return members is not None and value in members
+
+	def pairs(self) -> Iterator[Tuple[KT, VT]]:
+		"""
+		Returns an iterator over the ``(key, value)`` pairs.
+		"""
+
+		return _iter_pairs(self._fwd)
+
+	@property
+	def inverse(self) -> Mapping[VT, FrozenSet[KT]]:
+		"""
+		A read-only mapping of each value to the set of its keys, which reflects later changes.
+		"""
+
+		return _InverseView(self)
+
+	def snapshot(self) -> "frozenbmultidict[KT, VT]":
+		"""
+		Returns an immutable :class:`~.frozenbmultidict` with the current contents.
+
+		Taking a snapshot only copies the top level of the two indexes.
+		The sets of values are shared, and the live index copies a set before it next modifies it.
+		If nothing has changed since the previous snapshot, the same snapshot is returned.
+		"""
+
+		if self._snapshot is None:
+			self._snapshot = frozenbmultidict._from_tables(self._fwd.copy(), self._inv.copy())
+			self._owned_fwd = set()
+			self._owned_inv = set()
+
+		return self._snapshot
+
+	def copy(self: _BM) -> _BM:
+		"""
+		Return a copy of the :class:`~.bmultidict`.
+		"""
+
+		new = self.__class__()
+		new._fwd = {key: set(members) for key, members in self._fwd.items()}
+		new._inv = {value: set(members) for value, members in self._inv.items()}
+		return new
+
+	def __getitem__(self, key: KT) -> FrozenSet[VT]:
+		"""
+		Return the values for ``key``.
+
+		:param key:
+		"""
+
+		return frozenset(self._fwd[key])
+
+	def __setitem__(self, key: KT, values: Iterable[VT]) -> None:
+		"""
+		Replace the values for ``key`` with ``values``.
+
+		:param key:
+		:param values:
+		"""
+
+		values = set(values)
+		old = self._fwd.get(key, ())
+
+		self.discard_many([(key, value) for value in old if value not in values])
+		self.add_many((key, value) for value in values)
+
+	def __delitem__(self, key: KT) -> None:
+		"""
+		Remove ``key`` and all of its values.
+
+		:param key:
+		"""
+
+		self.discard_many([(key, value) for value in self._fwd[key]])
+
+	def __contains__(self, key: object) -> bool:
+		"""
+		Return ``key in self``.
+
+		:param key:
+		"""
+
+		return key in self._fwd
+
+	def __iter__(self) -> Iterator[KT]:
+		return iter(self._fwd)
+
+	def __len__(self) -> int:
+		return len(self._fwd)
+
+	def clear(self) -> None:
+		"""
+		Removes all pairs from the :class:`~.bmultidict`.
+		"""
+
+		# Any snapshot keeps the old tables.
+		self._fwd = {}
+		self._inv = {}
+		self._owned_fwd = None
+		self._owned_inv = None
+		self._snapshot = None
+
+	def __repr__(self) -> str:
+		return f"{self.__class__.__name__}({self._fwd!r})"
+
+	def __reduce__(self):  # noqa: MAN002
+		return self.__class__, (list(self.pairs()), )
+
+
+class _InverseView(Mapping[VT, FrozenSet[KT]]):
+
+	__slots__ = ("_owner", )
+
+	def __init__(self, owner: bmultidict):
+		self._owner = owner
+
+	def __getitem__(self, value: VT) -> FrozenSet[KT]:
+		return frozenset(self._owner._inv[value])
+
+	def __contains__(self, value: object) -> bool:
+		return value in self._owner._inv
+
+	def __iter__(self) -> Iterator[VT]:
+		return iter(self._owner._inv)
+
+	def __len__(self) -> int:
+		return len(self._owner._inv)
+
+	def __repr__(self) -> str:
+		return f"<{self._owner.__class__.__name__} inverse {self._owner._inv!r}>"
+
+
+@prettify_docstrings
+class frozenbmultidict(Mapping[KT, FrozenSet[VT]]):
+	"""
+	An immutable, hashable one-to-many mapping from keys to sets of values,
+	which is also indexed from each value to its keys.
+
+	Usually obtained from :meth:`bmultidict.snapshot() <.bmultidict.snapshot>`,
+	in which case it shares the sets of values with the live index.
+
+	.. versionadded:: 0.6.0
+
+	:param pairs: An iterable of ``(key, value)`` pairs,
+		or a mapping of keys to iterables of values.
+	"""
+
+	__slots__ = ("_fwd", "_inv", "_hash", "_inverse_view", "__weakref__")
+
+	# The values are sets, which are never modified.
+	# They are replaced with frozensets the first time they are looked up.
+	_fwd: Dict[KT, AbstractSet[VT]]
+	_inv: Dict[VT, AbstractSet[KT]]
+	_hash: Optional[int]
+	_inverse_view: Optional["frozenbmultidict[VT, KT]"]
+
+	def __init__(self, pairs: Any = ()):
+		if hasattr(self, "_fwd"):
+			raise TypeError(f"`{self.__class__}` can only be initialised once.")
+
+		live: bmultidict = bmultidict(pairs)
+		self._fwd = live._fwd
+		self._inv = live._inv
+		self._hash = None
+		self._inverse_view = None
+
+	@classmethod
+	def _from_tables(cls, fwd: Dict, inv: Dict) -> "frozenbmultidict":
+		new = cls.__new__(cls)
+		new._fwd = fwd
+		new._inv = inv
+		new._hash = None
+		new._inverse_view = None
+		return new
+
+	def __getitem__(self, key: KT) -> FrozenSet[VT]:
+		"""
+		Return the values for ``key``.
+
+		:param key:
+		"""
+
+		members = self._fwd[key]
+
+		if type(members) is not frozenset:
+			self._fwd[key] = members = frozenset(members)
+
+		return members  # type: ignore[return-value]
+
+	def __contains__(self, key: object) -> bool:
+		"""
+		Return ``key in self``.
+
+		:param key:
+		"""
+
+		return key in self._fwd
+
+	def __iter__(self) -> Iterator[KT]:
+		return iter(self._fwd)
+
+	def __len__(self) -> int:
+		return len(self._fwd)
+
+	@property
+	def inverse(self) -> "frozenbmultidict[VT, KT]":
+		"""
+		A :class:`~.frozenbmultidict` mapping each value to the set of its keys.
+
+		It shares its indexes with this snapshot, and ``self.inverse.inverse is self``.
+		"""
+
+		view = self._inverse_view
+
+		if view is None:
+			view = self._from_tables(self._inv, self._fwd)
+			view._inverse_view = self
+			self._inverse_view = view
+
+		return view
+
+	def has(self, key: KT, value: VT) -> bool:
+		"""
+		Returns whether the pair ``(key, value)`` is present.
+
+		:param key:
+		:param value:
+		"""
+
+		members = self._fwd.get(key)
+		return members is not None and value in members
+
+	def pairs(self) -> Iterator[Tuple[KT, VT]]:
+		"""
+		Returns an iterator over the ``(key, value)`` pairs.
+		"""
+
+		return _iter_pairs(self._fwd)
+
+	def thaw(self) -> bmultidict[KT, VT]:
+		"""
+		Returns a new :class:`~.bmultidict` with the same contents.
+		"""
+
+		return bmultidict(self.pairs())
+
+	def __hash__(self) -> int:
+		if self._hash is None:
+			h = 0
+			for pair in self.pairs():
+				h ^= hash(pair)
+			self._hash = h
+		return self._hash
+
+	def __eq__(self, other: object) -> bool:
+		if self is other:
+			return True
+
+		if isinstance(other, frozenbmultidict):
+			if self._hash is not None and other._hash is not None and self._hash != other._hash:
+				return False
+			return self._fwd == other._fwd
+
+		return super().__eq__(other)
+
+	def __repr__(self) -> str:
+		return f"<{self.__class__.__name__} {dict(self.items())!r}>"
+
+	def __reduce__(self):  # noqa: MAN002
+		return self.__class__, (list(self.pairs()), )
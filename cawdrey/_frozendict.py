@@ -26,7 +26,11 @@ Provides frozendict, a simple immutable dictionary.
 #
 
 # stdlib
-from typing import AbstractSet, Any
+import operator
+from bisect import bisect_left, bisect_right
+from collections.abc import ItemsView, Mapping, ValuesView
+from itertools import chain, islice
+from typing import AbstractSet, Any, Dict, Iterable, Iterator, List, Optional, Tuple
 
 # 3rd party
 from domdf_python_tools.doctools import prettify_docstrings
@@ -37,28 +41,189 @@ from .base import _D, KT, VT, FrozenBase
 __all__ = ["frozendict"]
 
 
+class _SmallItemsView(ItemsView):
+
+	def __iter__(self) -> Iterator[Tuple[Any, Any]]:
+		it = tuple.__iter__(self._mapping)
+		return zip(it, it)
+
+
+class _SmallValuesView(ValuesView):
+
+	def __iter__(self) -> Iterator[Any]:
+		return islice(tuple.__iter__(self._mapping), 1, None, 2)
+
+
+class _SmallMap(tuple, Mapping):  # type: ignore[misc]
+	r"""
+	Compact, read-only mapping used as the backing store for small :class:`~.frozendict`\s.
+
+	The keys and values are stored interleaved in a single tuple, ``(k0, v0, k1, v1, ...)``,
+	and are looked up with a linear scan.
+	"""
+
+	__slots__ = ()
+
+	@classmethod
+	def from_dict(cls, d: Dict) -> "_SmallMap":
+		return tuple.__new__(cls, chain.from_iterable(d.items()))
+
+	def _index(self, key: Any) -> int:
+		# Keys are at even indices; skip any values which happen to equal the key.
+		# Raises ValueError if the key isn't present.
+
+		idx = tuple.index(self, key)
+		while idx % 2:
+			idx = tuple.index(self, key, idx + 1)
+		return idx
+
+	def __getitem__(self, key: Any) -> Any:
+		# The scan compares keys with ==, so check the key is hashable first, as a dict would.
+		hash(key)
+
+		try:
+			return tuple.__getitem__(self, self._index(key) + 1)
+		except ValueError:
+			raise KeyError(key) from None
+
+	def __contains__(self, key: object) -> bool:
+		hash(key)
+
+		if not tuple.__contains__(self, key):
+			return False
+
+		try:
+			self._index(key)
+		except ValueError:
+			return False
+		return True
+
+	def get(self, key: Any, default: Any = None) -> Any:
+		hash(key)
+
+		if not tuple.__contains__(self, key):
+			return default
+
+		try:
+			return tuple.__getitem__(self, self._index(key) + 1)
+		except ValueError:
+			return default
+
+	def __iter__(self) -> Iterator[Any]:
+		return islice(tuple.__iter__(self), 0, None, 2)
+
+	def __len__(self) -> int:
+		return tuple.__len__(self) >> 1
+
+	def items(self) -> _SmallItemsView:  # type: ignore[override]
+		return _SmallItemsView(self)
+
+	def values(self) -> _SmallValuesView:  # type: ignore[override]
+		return _SmallValuesView(self)
+
+	def copy(self) -> Dict:
+		return dict(self.items())
+
+	def __eq__(self, other: object) -> bool:
+		if isinstance(other, Mapping):
+			return dict(self.items()) == dict(other.items())
+		return NotImplemented
+
+	def __ne__(self, other: object) -> bool:
+		if isinstance(other, Mapping):
+			return dict(self.items()) != dict(other.items())
+		return NotImplemented
+
+	def __repr__(self) -> str:
+		return repr(dict(self.items()))
+
+	def __reduce__(self):  # noqa: MAN002
+		# tuple(self) would only give the keys.
+		return self.__class__, (tuple(tuple.__iter__(self)), )
+
+
 @prettify_docstrings
 class frozendict(FrozenBase[KT, VT]):  # noqa: PRM002
 	"""
 	An immutable wrapper around dictionaries that implements the complete
 	:py:class:`collections.abc.Mapping` interface. It can be used as a
 	drop-in replacement for dictionaries where immutability is desired.
+
+	Non-empty dictionaries with at most :attr:`~.frozendict.small_map_threshold` items
+	can be stored in a compact tuple-based form rather than a :class:`dict`.
+	This is transparent to users of the class.
 	"""  # noqa: D400
 
+	__slots__ = ("_sorted_keys", )
+
 	dict_cls = dict
+	_sorted_keys: List[KT]
+	_transient_slots = FrozenBase._transient_slots | {"_sorted_keys"}
+
+	#: The largest number of items to store in the compact form.
+	#:
+	#: The compact form uses around 20% less memory than a :class:`dict` for eight items,
+	#: but lookups take linear time and are several times slower.
+	#: It is therefore disabled (``0``) by default.
+	#: Set this on a subclass (or on :class:`~.frozendict` itself) to enable it.
+	#:
+	#: .. versionadded:: 0.6.0
+	small_map_threshold: int = 0
 
 	def __init__(self, *args, **kwargs):
 		if hasattr(self, "_dict"):
 			raise TypeError(f"`{self.__class__}` can only be initialised once.")
 
+		if len(args) == 1 and not kwargs and type(getattr(args[0], "_dict", None)) is _SmallMap:
+			# The other frozendict is immutable too, so its store can be shared.
+			self._dict = args[0]._dict
+			self._hash = args[0]._hash if type(args[0]).__hash__ is type(self).__hash__ else None
+			return
+
 		super().__init__(*args, **kwargs)
 
+		# Empty dictionaries are left as they are, as there is nothing to compact.
+		if type(self._dict) is dict and 0 < len(self._dict) <= self.small_map_threshold:
+			self._dict = _SmallMap.from_dict(self._dict)  # type: ignore[assignment]
+
+	@classmethod
+	def adopt(cls, d: dict) -> "frozendict":
+		"""
+		Construct a new instance which takes ownership of ``d`` without copying it.
+
+		The caller must not modify ``d`` afterwards.
+		If ``d`` is not empty and has at most :attr:`~.frozendict.small_map_threshold` items
+		it is converted to the compact store.
+
+		.. versionadded:: 0.6.0
+
+		:param d:
+		"""
+
+		if type(d) is _SmallMap:
+			new = cls.__new__(cls)
+			new._dict = d  # type: ignore[assignment]
+			new._hash = None
+			return new
+
+		new = super().adopt(d)
+
+		if 0 < len(new._dict) <= cls.small_map_threshold:
+			new._dict = _SmallMap.from_dict(new._dict)  # type: ignore[assignment]
+
+		return new
+
 	def copy(self: _D, *args, **kwargs) -> _D:  # noqa: PRM002
 		"""
 		Return a copy of the dictionary.
 		"""
 
-		return self.__class__(self, *args, **kwargs)  # type: ignore[call-arg]
+		new = self.__class__(self._dict, *args, **kwargs)  # type: ignore[call-arg]
+		new._hash = self._derived_hash(  # type: ignore[attr-defined]
+				removed=((k, self._dict[k]) for k in kwargs if k in self._dict),  # type: ignore[attr-defined]
+				added=kwargs.items(),
+				)
+		return new
 
 	def __hash__(self) -> int:
 		if self._hash is None:
@@ -97,6 +262,20 @@ class frozendict(FrozenBase[KT, VT]):  # noqa: PRM002
 
 		tosort: AbstractSet[Any]
 
+		if by == "keys" and not args and set(kwargs) <= {"reverse"}:
+			# Plain sort by keys; use the cached index.
+			index = self._sorted_index()
+			it_sorted = index[::-1] if kwargs.get("reverse") else index
+
+			if all(map(operator.is_, it_sorted, self._dict)):
+				return self
+
+			new = self.__class__({k: self._dict[k] for k in it_sorted})
+			new._hash = self._hash
+			if it_sorted is index:
+				new._sorted_keys = index
+			return new
+
 		if by == "keys":
 			tosort = self.keys()
 		elif by == "values":
@@ -113,9 +292,109 @@ class frozendict(FrozenBase[KT, VT]):  # noqa: PRM002
 			return self
 
 		if by == "keys":
-			return self.__class__({k: self[k] for k in it_sorted})  # type: ignore[index]
+			new = self.__class__({k: self[k] for k in it_sorted})  # type: ignore[index]
 		else:
-			return self.__class__(it_sorted)
+			new = self.__class__(it_sorted)
+
+		# Same items, so the same hash.
+		new._hash = self._hash
+		return new
+
+	def _sorted_index(self) -> List[KT]:
+		# Returns the keys in sorted order, building and caching the list on first use.
+
+		try:
+			return self._sorted_keys
+		except AttributeError:
+			index = self._sorted_keys = sorted(self._dict)
+			return index
+
+	def bisect(self, key: KT) -> int:
+		"""
+		Returns the number of keys in the dictionary which are less than or equal to ``key``.
+
+		This is the position at which ``key`` would be inserted into the sorted keys,
+		after any existing equal key, as for :func:`bisect.bisect`.
+
+		The sorted keys are calculated once and cached, so this takes ``O(log n)`` time.
+
+		.. versionadded:: 0.6.0
+
+		:param key:
+		"""
+
+		return bisect_right(self._sorted_index(), key)
+
+	def floor(self, key: KT) -> KT:
+		"""
+		Returns the largest key in the dictionary which is less than or equal to ``key``.
+
+		.. versionadded:: 0.6.0
+
+		:param key:
+
+		:raises KeyError: If there is no such key.
+		"""
+
+		index = self._sorted_index()
+		idx = bisect_right(index, key)
+
+		if not idx:
+			raise KeyError(key)
+
+		return index[idx - 1]
+
+	def ceiling(self, key: KT) -> KT:
+		"""
+		Returns the smallest key in the dictionary which is greater than or equal to ``key``.
+
+		.. versionadded:: 0.6.0
+
+		:param key:
+
+		:raises KeyError: If there is no such key.
+		"""
+
+		index = self._sorted_index()
+		idx = bisect_left(index, key)
+
+		if idx == len(index):
+			raise KeyError(key)
+
+		return index[idx]
+
+	def range(self, lo: Optional[KT] = None, hi: Optional[KT] = None) -> "frozendict":  # noqa: A003  # pylint: disable=redefined-builtin
+		"""
+		Returns a new :class:`~cawdrey._frozendict.frozendict` containing the items whose keys
+		are greater than or equal to ``lo`` and less than ``hi``, in sorted order.
+
+		This takes ``O(log n + k)`` time, where ``k`` is the number of items returned.
+
+		.. versionadded:: 0.6.0
+
+		:param lo: The lower bound. If :py:obj:`None` there is no lower bound.
+		:param hi: The upper bound. If :py:obj:`None` there is no upper bound.
+		"""  # noqa: D400
+
+		index = self._sorted_index()
+		start = 0 if lo is None else bisect_left(index, lo)
+		stop = len(index) if hi is None else bisect_left(index, hi)
+		keys = index[start:stop]
+
+		new = self.__class__({k: self._dict[k] for k in keys})
+		new._sorted_keys = keys
+		return new
+
+	def _from_subset(self, subset: dict) -> "frozendict":
+		# Construct a new instance from a subset of this dictionary's items.
+		# If fewer items were dropped than kept, derive the hash from the dropped items.
+
+		new = self.__class__(subset)
+
+		if len(self._dict) - len(subset) <= len(subset):
+			new._hash = self._derived_hash(removed=((k, v) for k, v in self._dict.items() if k not in subset))
+
+		return new
 
 	def __add__(self, other, *args, **kwargs) -> "frozendict":  # noqa: MAN001,PRM002
 		"""
@@ -123,15 +402,21 @@ class frozendict(FrozenBase[KT, VT]):  # noqa: PRM002
 		to the old frozendict updated with the other object.
 		"""  # noqa: D400
 
-		tmp = dict(self)
-
 		try:
-			tmp.update(other)
+			changes = other._dict if isinstance(other, frozendict) else dict(other)
 		except Exception:
 			msg = f"Unsupported operand type(s) for +: `{self.__class__.__name__}` and `{other.__class__.__name__}`"
 			raise TypeError(msg) from None
 
-		return self.__class__(tmp)
+		tmp = dict(self._dict)
+		tmp.update(changes)
+
+		new = self.__class__(tmp)
+		new._hash = self._derived_hash(
+				removed=((k, self._dict[k]) for k in changes if k in self._dict),
+				added=changes.items(),
+				)
+		return new
 
 	def __sub__(self, other, *args, **kwargs) -> "frozendict":  # noqa: MAN001,PRM002
 		"""
@@ -150,17 +435,7 @@ class frozendict(FrozenBase[KT, VT]):  # noqa: PRM002
 			msg = f"Unsupported operand type(s) for -: `{self.__class__.__name__}` and `{other.__class__.__name__}`"
 			raise TypeError(msg) from None
 
-		try:
-			res = {k: v for k, v in self.items() if (k, v) not in other.items()}
-		except Exception:
-			if not hasattr(other, "gi_running"):
-				true_other = other
-			else:
-				true_other = tuple(other)
-
-			res = {k: v for k, v in self.items() if k not in true_other}
-
-		return self.__class__(res)
+		return self._from_subset(_difference(self._dict, other))
 
 	def __and__(self, other, *args, **kwargs) -> "frozendict":  # noqa: MAN001,PRM002
 		"""
@@ -182,13 +457,116 @@ class frozendict(FrozenBase[KT, VT]):  # noqa: PRM002
 		API, for consistency and practical reasons.
 		"""  # noqa: D400
 
+		own = self._dict
+
 		try:
-			try:
-				res = {k: v for k, v in other.items() if (k, v) in self.items()}
-			except Exception:
-				res = {k: self[k] for k in other if k in self}
+			other_items = _items_view(other)
+			if other_items is not None:
+				own_items = own.items()
+				res = {k: v for k, v in other_items if (k, v) in own_items}
+			else:
+				res = {k: own[k] for k in other if k in own}
 		except Exception:
 			msg = f"Unsupported operand type(s) for &: `{self.__class__.__name__}` and `{other.__class__.__name__}`"
 			raise TypeError(msg) from None
 
-		return self.__class__(res)
+		return self._from_subset(res)
+
+	@classmethod
+	def union_many(cls, *others: Mapping[KT, VT]) -> "frozendict[KT, VT]":
+		"""
+		Returns a new :class:`~.frozendict` equal to ``others[0] + others[1] + ...``.
+
+		The operands are folded into a single dictionary,
+		rather than creating an intermediate :class:`~.frozendict` for each addition.
+		Values from later operands take precedence.
+
+		.. versionadded:: 0.6.0
+
+		:param others: The dict-like objects to combine.
+		"""
+
+		res: Dict[KT, VT] = {}
+
+		for other in others:
+			res.update(other._dict if isinstance(other, frozendict) else other)
+
+		return cls.adopt(res)
+
+	@classmethod
+	def difference_many(cls, base: Mapping[KT, VT], *others: Iterable) -> "frozendict[KT, VT]":
+		"""
+		Returns a new :class:`~.frozendict` equal to ``base - others[0] - others[1] - ...``.
+
+		Each operand is subtracted as with :meth:`~.frozendict.__sub__`,
+		but from a single working dictionary rather than
+		creating an intermediate :class:`~.frozendict` for each subtraction.
+
+		.. versionadded:: 0.6.0
+
+		:param base: The dict-like object to subtract from.
+		:param others: The dict-like objects or iterables of keys to subtract.
+		"""
+
+		res = dict(base._dict if isinstance(base, frozendict) else base)
+
+		for other in others:
+			res = _difference(res, other, inplace=True)
+
+		return cls.adopt(res)
+
+
+def _items_view(other: Any) -> Optional[Iterable[Tuple[Any, Any]]]:
+	# Returns a view of the items in ``other`` supporting fast membership tests,
+	# or :py:obj:`None` if ``other`` is not dict-like.
+
+	if isinstance(other, frozendict):
+		return other._dict.items()
+
+	items = getattr(other, "items", None)
+	if items is None:
+		return None
+
+	return items()
+
+
+def _difference(res: Mapping, other: Any, inplace: bool = False) -> Dict:
+	# Remove from ``res`` the items in common with ``other`` if it is dict-like,
+	# or the keys in ``other`` otherwise.
+	# ``res`` is only modified if ``inplace`` is :py:obj:`True`, in which case it must be a :class:`dict`.
+
+	other_items = _items_view(other)
+
+	if other_items is not None:
+		if len(res) <= len(other_items):  # type: ignore[arg-type]
+			return {k: v for k, v in res.items() if (k, v) not in other_items}
+
+		# ``other`` is smaller, so only look at its items and delete those in common from a copy of ``res``.
+		res = res if inplace else dict(res)
+		res_items = res.items()
+
+		for item in other_items:
+			if item in res_items:
+				del res[item[0]]
+
+		return res  # type: ignore[return-value]
+
+	if isinstance(other, (AbstractSet, Mapping)):
+		keys = other
+	else:
+		if iter(other) is other:
+			# Consume iterators only once.
+			other = tuple(other)
+
+		try:
+			keys = set(other)
+		except TypeError:
+			# Unhashable elements cannot be keys of ``res``.
+			keys = set()
+			for k in other:
+				try:
+					keys.add(k)
+				except TypeError:
+					pass
+
+	return {k: v for k, v in res.items() if k not in keys}
@@ -2,7 +2,7 @@
 #
 #  alphadict.py
 """
-Provides :class:`~.AlphaDict`, a frozen :class:`OrderedDict` where the keys are stored alphabetically.
+Provides :class:`~.AlphaDict`, a frozen ordered dictionary where the keys are stored alphabetically.
 """
 #
 #  Copyright © 2020,2022 Dominic Davis-Foster <dominic@davis-foster.co.uk>
@@ -24,7 +24,9 @@ Provides :class:`~.AlphaDict`, a frozen :class:`OrderedDict` where the keys are
 #
 
 # stdlib
-from typing import TYPE_CHECKING, Iterable, Optional
+import operator
+from bisect import bisect_left, bisect_right
+from typing import TYPE_CHECKING, Any, Iterable, Iterator, List, Mapping, Optional, Tuple, Union
 
 # 3rd party
 from domdf_python_tools.doctools import prettify_docstrings
@@ -42,6 +44,8 @@ else:
 
 __all__ = ["alphabetical_dict", "AlphaDict"]
 
+_key = operator.itemgetter(0)
+
 
 def alphabetical_dict(**kwargs: T) -> "OrderedDict[str, T]":
 	r"""
@@ -82,8 +86,235 @@ class AlphaDict(FrozenOrderedDict[KT, VT]):
 	:param \*\*kwargs: Keyword arguments to construct dict from.
 	"""
 
+	__slots__ = ("_keys", )
+
+	_keys: List[KT]
+	_transient_slots = FrozenOrderedDict._transient_slots | {"_keys"}
+
 	def __init__(self, seq: Optional[Iterable] = None, **kwargs):
-		if seq:
-			kwargs = dict(seq)
+		if hasattr(self, "_dict"):
+			raise TypeError(f"`{self.__class__}` can only be initialised once.")
+
+		if isinstance(seq, AlphaDict) and not kwargs:
+			# Already sorted, and the backing dict can be shared.
+			self._dict = seq._dict
+
+			if hasattr(seq, "_keys"):
+				self._keys = seq._keys
+		else:
+			if seq is None:
+				items: Iterable = kwargs.items()
+			elif isinstance(seq, Mapping) and not kwargs:
+				# The keys of a mapping are already unique.
+				items = seq.items()
+			else:
+				items = dict(seq, **kwargs).items()
+
+			self._dict = self.dict_cls(sorted(items, key=_key))
+
+		self._hash = None
+
+	@classmethod
+	def adopt(cls, d: dict) -> "AlphaDict":
+		"""
+		Construct a new :class:`~.AlphaDict` which takes ownership of ``d`` without copying it.
+
+		The caller must not modify ``d`` afterwards.
+		``d`` is only used as-is if it is an instance of :attr:`~.FrozenOrderedDict.dict_cls` whose keys are already sorted;
+		otherwise a sorted copy is made.
+
+		.. versionadded:: 0.6.0
+
+		:param d:
+		"""
+
+		if type(d) is not cls.dict_cls or not _is_sorted(list(d)):
+			d = cls.dict_cls(sorted(d.items(), key=_key))
+
+		return super().adopt(d)
+
+	def copy(self, *args, **kwargs) -> "AlphaDict":
+		r"""
+		Return a copy of the :class:`~.AlphaDict`, with the items from ``*args`` and ``**kwargs`` added.
+
+		Only the new keys are sorted, and they are then merged with the existing keys in linear time.
+		See :meth:`~.AlphaDict.merge`.
+
+		:param \*args:
+		:param \*\*kwargs:
+		"""
+
+		return self._merge(dict(*args, **kwargs))
+
+	def merge(self, other: Union[Mapping[KT, VT], Iterable[Any]] = (), **kwargs: VT) -> "AlphaDict[KT, VT]":
+		r"""
+		Return a new :class:`~.AlphaDict` containing the items of this dictionary and of ``other``.
+
+		The values in ``other`` take precedence, and ``**kwargs`` take precedence over both.
+
+		Rather than sorting every key again, the new keys are sorted on their own and merged with the
+		(already sorted) existing keys, so merging ``m`` items into a dictionary of ``n`` items
+		takes ``O(n + m log m)`` time rather than ``O((n + m) log (n + m))``.
+		Changing the values of existing keys does not involve any sorting.
+
+		If nothing is added the dictionary itself is returned.
+
+		.. versionadded:: 0.6.0
+
+		:param other: A mapping or an iterable of ``(key, value)`` pairs.
+		:param \*\*kwargs:
+		"""
+
+		if isinstance(other, AlphaDict) and not kwargs:
+			changes: Mapping = other._dict
+		else:
+			changes = dict(other, **kwargs)
+
+		if not changes:
+			return self
+
+		return self._merge(changes)
+
+	def _merge(self, changes: Mapping) -> "AlphaDict":
+		old = self._dict
+		items = list(old.items())
+		keys: Optional[list] = None
+		added = []
+
+		for key, value in changes.items():
+			if key in old:
+				# Existing keys keep their position, so no sorting is needed.
+				if keys is None:
+					keys = list(old)
+				idx = bisect_left(keys, key)
+				items[idx] = (keys[idx], value)
+			else:
+				added.append((key, value))
+
+		if added:
+			added.sort(key=_key)
+			extend_only = not items or items[-1][0] < added[0][0]
+			items += added
+
+			if not extend_only:
+				# The list now consists of two sorted runs,
+				# which timsort merges in linear time without any further comparison sorting.
+				items.sort(key=_key)
+
+		new = super().adopt(self.dict_cls(items))
+		new._hash = self._derived_hash(
+				removed=((k, old[k]) for k in changes if k in old),
+				added=changes.items(),
+				)
+		return new
+
+	def _sorted_keys(self) -> List[KT]:
+		# The keys as a list, which is built on first use and can then be bisected.
+
+		try:
+			return self._keys
+		except AttributeError:
+			self._keys = keys = list(self._dict)
+			return keys
+
+	def index(self, key: KT) -> int:
+		"""
+		Returns the position of ``key`` in the dictionary.
+
+		.. versionadded:: 0.6.0
+
+		:param key:
+
+		:raises KeyError: If ``key`` is not in the dictionary.
+		"""
+
+		keys = self._sorted_keys()
+		idx = bisect_left(keys, key)
+
+		if idx == len(keys) or keys[idx] != key:
+			raise KeyError(key)
+
+		return idx
+
+	def islice(self, start: Optional[int] = None, stop: Optional[int] = None) -> Iterator[KT]:
+		"""
+		Returns an iterator over the keys from position ``start`` up to (but not including) position ``stop``.
+
+		The positions are interpreted in the same way as for a slice of a :class:`list`.
+
+		.. versionadded:: 0.6.0
+
+		:param start:
+		:param stop:
+		"""
+
+		return iter(self._sorted_keys()[start:stop])
+
+	def irange(
+			self,
+			minimum: Optional[KT] = None,
+			maximum: Optional[KT] = None,
+			inclusive: Tuple[bool, bool] = (True, True),
+			) -> Iterator[KT]:
+		"""
+		Returns an iterator over the keys between ``minimum`` and ``maximum``, in sorted order.
+
+		.. versionadded:: 0.6.0
+
+		:param minimum: The lowest key to return. If :py:obj:`None` the range is unbounded below.
+		:param maximum: The highest key to return. If :py:obj:`None` the range is unbounded above.
+		:param inclusive: Whether ``minimum`` and ``maximum`` themselves are included, if present.
+		"""
+
+		keys = self._sorted_keys()
+		lo, hi = 0, len(keys)
+
+		if minimum is not None:
+			lo = (bisect_left if inclusive[0] else bisect_right)(keys, minimum)
+
+		if maximum is not None:
+			hi = (bisect_right if inclusive[1] else bisect_left)(keys, maximum, lo)
+
+		return iter(keys[lo:hi])
+
+	def prefix(self, prefix: KT) -> Iterator[KT]:
+		"""
+		Returns an iterator over the keys which start with ``prefix``, in sorted order.
+
+		The keys must be :class:`str` or :class:`bytes`.
+
+		.. versionadded:: 0.6.0
+
+		:param prefix:
+		"""
+
+		keys = self._sorted_keys()
+		lo = bisect_left(keys, prefix)
+		successor = _prefix_successor(prefix)
+
+		if successor is None:
+			# Every key from ``lo`` onwards starts with the prefix.
+			return iter(keys[lo:])
+
+		return iter(keys[lo:bisect_left(keys, successor, lo)])
+
+
+def _is_sorted(keys: list) -> bool:
+	# Whether ``keys`` is in ascending order, checked in a single pass.
+	return not any(map(operator.lt, keys[1:], keys))
+
+
+def _prefix_successor(prefix: Any) -> Any:
+	# The smallest value greater than every string starting with ``prefix``,
+	# or :py:obj:`None` if there is no such value (e.g. the prefix is empty).
+
+	if isinstance(prefix, bytes):
+		stripped = prefix.rstrip(b"\xff")
+		if not stripped:
+			return None
+		return stripped[:-1] + bytes((stripped[-1] + 1, ))
 
-		super().__init__(sorted(kwargs.items()))
+	stripped = prefix.rstrip("\U0010ffff")
+	if not stripped:
+		return None
+	return stripped[:-1] + chr(ord(stripped[-1]) + 1)
@@ -28,11 +28,19 @@ Base Classes.
 
 # stdlib
 from abc import abstractmethod
+from copy import deepcopy
+from itertools import repeat
+from types import MappingProxyType
 from typing import (
+		TYPE_CHECKING,
 		AbstractSet,
 		Any,
+		ClassVar,
+		Dict,
+		FrozenSet,
 		Iterable,
 		Iterator,
+		List,
 		Mapping,
 		MutableMapping,
 		Optional,
@@ -46,8 +54,14 @@ from typing import (
 
 # 3rd party
 from domdf_python_tools.doctools import is_documented_by, prettify_docstrings
+from domdf_python_tools.typing import PathLike
 
-__all__ = ["DictWrapper", "FrozenBase", "MutableBase", "KT", "VT", 'T', "_D"]
+if TYPE_CHECKING:
+	# this package
+	from .intern import InternPool
+	from .sharedfrozendict import SharedFrozenDict
+
+__all__ = ["DictWrapper", "Evolver", "FrozenBase", "MutableBase", "KT", "VT", 'T', "_D", "_F"]
 
 #: :class:`typing.TypeVar` used for annotating key types in mappings.
 KT = TypeVar("KT")
@@ -57,6 +71,10 @@ VT = TypeVar("VT")
 
 T = TypeVar('T')
 _D = TypeVar("_D", bound="DictWrapper")
+_F = TypeVar("_F", bound="FrozenBase")
+
+# Types whose instances are immutable and cannot contain mutable objects.
+_ATOMIC_TYPES = frozenset({type(None), bool, int, float, complex, str, bytes, range, type(Ellipsis)})
 
 
 @prettify_docstrings
@@ -64,9 +82,14 @@ class DictWrapper(Mapping[KT, VT]):
 	"""
 	Abstract Mixin class for classes that wrap a dict object or similar.
 
+	Subclasses should define ``__slots__`` for any additional attributes,
+	and include ``"__weakref__"`` in them if instances need to support weak references.
+
 	.. latex:vspace:: 15px
 	"""
 
+	__slots__ = ("_dict", )
+
 	_dict: dict
 
 	def __getitem__(self, key: KT) -> VT:
@@ -127,14 +150,16 @@ class DictWrapper(Mapping[KT, VT]):
 		:param default: The value to return if ``key`` is not in the dictionary.
 		"""
 
-		return super().get(k, default)
+		return self._dict.get(k, default)
 
 	def items(self) -> AbstractSet[Tuple[KT, VT]]:  # type: ignore[override]
 		r"""
 		Returns a set-like object providing a view on the dictionary's items.
+
+		This is the underlying dictionary's own (read-only) view.
 		"""
 
-		return super().items()
+		return self._dict.items()
 
 	def keys(self) -> AbstractSet[KT]:  # type: ignore[override]
 		r"""
@@ -145,14 +170,60 @@ class DictWrapper(Mapping[KT, VT]):
 		.. latex:clearpage::
 		"""
 
-		return super().keys()
+		return self._dict.keys()
 
 	def values(self) -> ValuesView[VT]:
 		r"""
-		Returns an object providing a view on the :class:`~.bdict`\'s values.
+		Returns an object providing a view on the dictionary's values.
+		"""
+
+		return self._dict.values()
+
+	def getmany(self, keys: Iterable[KT], default: Optional[T] = None) -> List[Union[VT, T, None]]:
+		"""
+		Return the values for each of ``keys``, or ``default`` for keys not in the dictionary.
+
+		This is equivalent to ``[self.get(k, default) for k in keys]``,
+		but performs the lookups in a single pass over the underlying dictionary.
+
+		.. versionadded:: 0.6.0
+
+		:param keys: The keys to return the values for.
+		:param default: The value to return for keys not in the dictionary.
+		"""
+
+		return list(map(self._dict.get, keys, repeat(default)))
+
+	def contains_many(self, keys: Iterable[Any]) -> List[bool]:
+		"""
+		Return whether each of ``keys`` is in the dictionary.
+
+		This is equivalent to ``[k in self for k in keys]``.
+
+		.. versionadded:: 0.6.0
+
+		:param keys:
+		"""
+
+		return list(map(self._dict.__contains__, keys))
+
+	def pick(self: _D, keys: Iterable[KT]) -> _D:
+		"""
+		Returns a new dictionary of the same type containing only the given keys.
+
+		Keys which are not in the dictionary are ignored.
+		The order of the new dictionary follows the order of ``keys``.
+
+		.. versionadded:: 0.6.0
+
+		:param keys:
 		"""
 
-		return super().values()
+		return self.__class__(self._pick(keys))  # type: ignore[call-arg]
+
+	def _pick(self, keys: Iterable[KT]) -> Dict[KT, VT]:
+		d = self._dict
+		return {k: d[k] for k in keys if k in d}
 
 
 _T = TypeVar("_T")
@@ -166,16 +237,347 @@ class FrozenBase(DictWrapper[KT, VT]):  # noqa: PRM002
 	Used by :class:`~.frozendict` and :class:`~.FrozenOrderedDict`.
 
 	Custom subclasses must implement at a minimum ``__init__``, ``copy``, ``fromkeys``.
+
+	Any instance ``__dict__`` and additional ``__slots__`` of subclasses are included when the
+	dictionary is pickled or deep copied.
+	Slots which are derived from the contents, such as caches, should be listed in ``_transient_slots``.
 	"""
 
+	__slots__ = ("_hash", )
+
 	dict_cls: Optional[Type] = None
+	_hash: Optional[int]
+
+	#: Slots which are not part of the instance state preserved by pickling and :func:`copy.deepcopy`.
+	_transient_slots: ClassVar[FrozenSet[str]] = frozenset({"_dict", "_hash", "__weakref__", "__dict__"})
 
 	@abstractmethod
 	def __init__(self, *args, **kwargs):
 		assert self.dict_cls is not None
+
+		if len(args) == 1 and not kwargs and isinstance(args[0], FrozenBase):
+			other = args[0]
+
+			# Both are immutable, so the backing dict can be shared.
+			if type(getattr(other, "_dict", None)) is self.dict_cls:
+				self._dict = other._dict
+				self._hash = other._hash if type(other).__hash__ is type(self).__hash__ else None
+				return
+
 		self._dict = self.dict_cls(*args, **kwargs)
 		self._hash = None
 
+	def __reduce__(self):  # noqa: MAN002
+		# The unpickled dict is not shared with anything else, so it can be adopted without copying.
+		# The cached hash is not pickled, as the hashes of str and bytes differ between processes.
+		state = self._get_state()
+
+		if state is None:
+			return _unpickle, (self.__class__, self._dict)
+
+		return _unpickle, (self.__class__, self._dict), state
+
+	def _get_state(self) -> Optional[Tuple[Optional[Dict[str, Any]], Optional[Dict[str, Any]]]]:
+		"""
+		Returns the instance state of a subclass, in the ``(__dict__, slots)`` form used by :mod:`pickle`,
+		or :py:obj:`None` if there is none.
+		"""  # noqa: D400
+
+		state = getattr(self, "__dict__", None) or None
+		slots = {}
+
+		for name in _state_slots(type(self)):
+			try:
+				slots[name] = object.__getattribute__(self, name)
+			except AttributeError:
+				pass
+
+		if state is None and not slots:
+			return None
+
+		return state, (slots or None)
+
+	def __setstate__(self, state: Tuple[Optional[Dict[str, Any]], Optional[Dict[str, Any]]]) -> None:
+		instance_dict, slots = state
+
+		if instance_dict:
+			self.__dict__.update(instance_dict)
+
+		if slots:
+			for name, value in slots.items():
+				object.__setattr__(self, name, value)
+
+	def __reduce_ex__(self, protocol: int):  # noqa: MAN002
+		# Bypasses object.__reduce_ex__, which is relatively slow for small dictionaries.
+		return self.__reduce__()
+
+	def __copy__(self: _F) -> _F:
+		return self
+
+	def __deepcopy__(self: _F, memo: Dict[int, Any]) -> _F:
+		items = []
+		copied = False
+
+		for key, value in self.items():
+			if type(key) not in _ATOMIC_TYPES:
+				new_key = deepcopy(key, memo)
+				copied = copied or new_key is not key
+				key = new_key
+
+			if type(value) not in _ATOMIC_TYPES:
+				new_value = deepcopy(value, memo)
+				copied = copied or new_value is not value
+				value = new_value
+
+			items.append((key, value))
+
+		state = self._get_state()
+
+		# If nothing needed copying this dictionary is immutable all the way down, so can be shared.
+		if not copied and state is None:
+			memo[id(self)] = self
+			return self
+
+		# Not every subclass stores its items in ``_dict``, so the new instance is built from ``items``.
+		new = type(self).adopt(dict(items))
+		memo[id(self)] = new
+
+		if state is not None:
+			new.__setstate__(deepcopy(state, memo))
+
+		return new
+
+	def __eq__(self, other: object) -> bool:
+		"""
+		Return ``self == other``.
+
+		Short-circuits on identity, on differing cached hashes and on differing lengths,
+		before comparing the backing dictionaries directly.
+		As for any :class:`~collections.abc.Mapping`, the order of the items is not significant.
+
+		:param other:
+		"""
+
+		if self is other:
+			return True
+
+		if isinstance(other, FrozenBase):
+			if (
+					self._hash is not None and other._hash is not None and self._hash != other._hash
+					and type(self).__hash__ is type(other).__hash__
+					):
+				return False
+
+		if isinstance(other, DictWrapper):
+			other = getattr(other, "_dict", other)
+
+		if not isinstance(other, Mapping):
+			return NotImplemented
+
+		mine = self._dict
+
+		if len(mine) != len(other):
+			return False
+
+		if isinstance(mine, dict) and isinstance(other, dict):
+			# Use dict's comparison, which (unlike OrderedDict's) ignores order.
+			return dict.__eq__(mine, other)
+
+		return dict(mine.items()) == dict(other.items())
+
+	def _derived_hash(
+			self,
+			removed: Iterable[Tuple[KT, VT]] = (),
+			added: Iterable[Tuple[KT, VT]] = (),
+			) -> Optional[int]:
+		"""
+		Returns the hash of a dictionary derived from this one by removing the items in ``removed``
+		and adding the items in ``added``.
+
+		The hash is the XOR of the hashes of the ``(key, value)`` pairs,
+		so it can be updated in time proportional to the number of items which changed.
+		Returns :py:obj:`None` if the hash of this dictionary has not been calculated yet,
+		or if any of the items are unhashable.
+
+		Subclasses whose ``__hash__`` is not calculated in this way should override this method to return :py:obj:`None`.
+
+		:param removed:
+		:param added:
+		"""  # noqa: D400
+
+		h = self._hash
+
+		if h is None:
+			return None
+
+		try:
+			for item in removed:
+				h ^= hash(item)
+			for item in added:
+				h ^= hash(item)
+		except TypeError:
+			return None
+
+		return h
+
+	@classmethod
+	def adopt(cls: Type[_F], d: dict) -> _F:
+		"""
+		Construct a new instance which takes ownership of ``d`` without copying it.
+
+		The caller must not modify ``d`` afterwards.
+		If ``d`` is not an instance of :attr:`~.FrozenBase.dict_cls` it is converted, which does copy it.
+
+		.. versionadded:: 0.6.0
+
+		:param d:
+		"""
+
+		assert cls.dict_cls is not None
+
+		if type(d) is not cls.dict_cls:
+			d = cls.dict_cls(d)
+
+		new = cls.__new__(cls)
+		new._dict = d
+		new._hash = None
+		return new
+
+	@classmethod
+	def intern_pool(cls) -> "InternPool":
+		"""
+		Returns the :class:`~.InternPool` used by :meth:`~.FrozenBase.intern` for this class.
+
+		Each class has its own pool, which is not shared with its subclasses.
+
+		.. versionadded:: 0.6.0
+		"""
+
+		pool = cls.__dict__.get("_intern_pool")
+
+		if pool is None:
+			# this package
+			from .intern import InternPool
+
+			pool = InternPool()
+			setattr(cls, "_intern_pool", pool)
+
+		return pool
+
+	@classmethod
+	def intern(cls: Type[_F], *args, **kwargs) -> _F:
+		r"""
+		Returns the canonical instance of this class which is equal to ``cls(*args, **kwargs)``.
+
+		Equal dictionaries interned through this method are the same object.
+		The canonical instances are held weakly, and are removed from the pool once no longer in use.
+		Statistics about the pool can be obtained with ``cls.intern_pool().stats()``.
+
+		The pool holds its instances weakly, so the class must support weak references.
+		:class:`~.frozendict`, :class:`~.FrozenOrderedDict` and the other built-in classes do not,
+		so calling this method on them raises a :exc:`TypeError`.
+		Use :class:`~.InternedFrozenDict` or :class:`~.InternedFrozenOrderedDict` instead,
+		or add ``"__weakref__"`` to the ``__slots__`` of a subclass:
+
+		.. code-block:: python3
+
+			class InternedAlphaDict(AlphaDict):
+				__slots__ = ("__weakref__", )
+
+		.. versionadded:: 0.6.0
+
+		:param \*args:
+		:param \*\*kwargs:
+
+		:raises TypeError: If any of the values are unhashable, or the class does not support weak references.
+		"""
+
+		if not cls.__weakrefoffset__:
+			raise TypeError(
+					f"{cls.__name__!r} does not support weak references, so cannot be interned. "
+					"Use InternedFrozenDict, or add '__weakref__' to the __slots__ of a subclass."
+					)
+
+		if len(args) == 1 and not kwargs and type(args[0]) is cls:
+			obj = args[0]
+		else:
+			obj = cls(*args, **kwargs)
+
+		return cls.intern_pool().intern(obj)
+
+	def proxy(self) -> Mapping[KT, VT]:
+		"""
+		Returns a read-only :class:`types.MappingProxyType` of the dictionary's contents, without copying them.
+
+		The proxy is implemented in C, so membership tests, :func:`len`, item lookups and iteration
+		avoid the Python-level method calls made by this class.
+		This makes it suitable for tight loops which only read from the dictionary.
+		The proxy is only a view, and is neither hashable nor a :class:`dict`;
+		:class:`~.fastfrozendict` provides an immutable :class:`dict` subclass.
+
+		.. versionadded:: 0.6.0
+		"""
+
+		# The backing dict is never modified, so the proxy is as immutable as this dictionary.
+		# Other stores, such as tuples, cannot be proxied directly.
+		d = getattr(self, "_dict", None)
+		return MappingProxyType(d if isinstance(d, dict) else self)
+
+	def evolver(self) -> "Evolver[KT, VT]":
+		"""
+		Returns a mutable :class:`~.Evolver` for building a new dictionary from this one.
+
+		The backing dictionary is only copied once, when the evolver is first modified,
+		and :meth:`Evolver.persistent() <.Evolver.persistent>` freezes the result without copying it again.
+
+		.. versionadded:: 0.6.0
+		"""
+
+		return Evolver(self)
+
+	def dump(self, path: PathLike) -> None:
+		"""
+		Write the dictionary to ``path``, in the format read by :class:`~.MappedFrozenDict`.
+
+		The keys and values must all be strings.
+
+		.. versionadded:: 0.6.0
+
+		:param path:
+
+		:raises TypeError: If any of the keys or values are not strings.
+		"""
+
+		# this package
+		from .mappedfrozendict import _dump
+
+		_dump(self.items(), len(self), path)
+
+	def to_shared(self) -> "SharedFrozenDict":
+		"""
+		Copy the dictionary into a new block of shared memory, which can be passed cheaply to other processes.
+
+		The returned :class:`~.SharedFrozenDict` owns the shared memory block,
+		and should be closed (or used as a context manager) once the other processes have finished with it.
+
+		The keys and values must all be strings.
+
+		.. note:: This requires Python 3.8 or newer.
+
+		.. versionadded:: 0.6.0
+
+		:raises TypeError: If any of the keys or values are not strings.
+		"""
+
+		# this package
+		from .sharedfrozendict import SharedFrozenDict
+
+		return SharedFrozenDict._create(self.items(), len(self))
+
+	@is_documented_by(DictWrapper.pick)
+	def pick(self: _F, keys: Iterable[KT]) -> _F:
+		return type(self).adopt(self._pick(keys))
+
 	@classmethod
 	@overload
 	def fromkeys(cls, iterable: Iterable[KT]) -> "FrozenBase[KT, Any]": ...  # pragma: no cover
@@ -190,6 +592,128 @@ class FrozenBase(DictWrapper[KT, VT]):  # noqa: PRM002
 		return cls(dict.fromkeys(iterable, value))
 
 
+def _unpickle(cls: Type[_F], d: dict) -> _F:
+	return cls.adopt(d)
+
+
+def _state_slots(cls: Type[FrozenBase]) -> Tuple[str, ...]:
+	# The names of the slots holding instance state, computed once per class.
+	names = cls.__dict__.get("_state_slot_names")
+
+	if names is None:
+		found: List[str] = []
+
+		for klass in cls.__mro__:
+			declared = klass.__dict__.get("__slots__", ())
+			if isinstance(declared, str):
+				declared = (declared, )
+
+			for name in declared:
+				if name.startswith("__") and not name.endswith("__"):
+					name = f"_{klass.__name__.lstrip('_')}{name}"
+				if name not in cls._transient_slots and name not in found:
+					found.append(name)
+
+		names = tuple(found)
+		setattr(cls, "_state_slot_names", names)
+
+	return names
+
+
+@prettify_docstrings
+class Evolver(DictWrapper[KT, VT], MutableMapping[KT, VT]):
+	"""
+	A mutable transient for efficiently building a new frozen dictionary from an existing one.
+
+	Obtained from :meth:`FrozenBase.evolver() <.FrozenBase.evolver>`.
+	Any number of changes can be made to the evolver
+	before calling :meth:`~.Evolver.persistent` to freeze the result.
+
+	.. code-block:: python
+
+		>>> e = frozendict(a=1).evolver()
+		>>> e['b'] = 2
+		>>> del e['a']
+		>>> e.persistent()
+		<frozendict {'b': 2}>
+
+	.. versionadded:: 0.6.0
+
+	:param original: The frozen dictionary to start from.
+	"""
+
+	__slots__ = ("_cls", "_result")
+
+	def __init__(self, original: FrozenBase[KT, VT]):
+		self._dict = original._dict
+		self._cls = type(original)
+		self._result: Optional[FrozenBase[KT, VT]] = original
+
+	def _prepare_write(self) -> None:
+		# The backing dict is shared with ``self._result``, so copy it before the first change.
+		if self._result is not None:
+			self._dict = self._dict.copy()
+			self._result = None
+
+	def __setitem__(self, key: KT, value: VT) -> None:
+		self._prepare_write()
+		self._dict[key] = value
+
+	def __delitem__(self, key: KT) -> None:
+		self._prepare_write()
+		del self._dict[key]
+
+	def update(self, *args, **kwargs) -> None:  # type: ignore[override]  # noqa: PRM002
+		r"""
+		Update the evolver from a mapping or iterable of pairs, and/or keyword arguments.
+
+		:param \*args:
+		:param \*\*kwargs:
+		"""
+
+		self._prepare_write()
+		self._dict.update(*args, **kwargs)
+
+	def clear(self) -> None:
+		"""
+		Remove all items from the evolver.
+		"""
+
+		self._prepare_write()
+		self._dict.clear()
+
+	def persistent(self) -> FrozenBase[KT, VT]:
+		"""
+		Returns a frozen dictionary with the current contents of the evolver.
+
+		If the evolver has not been modified since it was created, or since the last call to this method,
+		the previous frozen dictionary is returned.
+		"""
+
+		if self._result is None:
+			self._result = self._cls.adopt(self._dict)
+
+		return self._result
+
+	def copy(self) -> "Evolver[KT, VT]":  # type: ignore[override]
+		"""
+		Return a new evolver with the same contents.
+		"""
+
+		return self.persistent().evolver()
+
+	def pick(self, keys: Iterable[KT]) -> FrozenBase[KT, VT]:  # type: ignore[override]
+		"""
+		Returns a new frozen dictionary containing only the given keys.
+
+		Keys which are not in the evolver are ignored.
+
+		:param keys:
+		"""
+
+		return self._cls.adopt(self._pick(keys))
+
+
 @prettify_docstrings
 class MutableBase(DictWrapper[KT, VT], MutableMapping[KT, VT]):  # noqa: PRM002
 	"""
@@ -200,6 +724,8 @@ class MutableBase(DictWrapper[KT, VT], MutableMapping[KT, VT]):  # noqa: PRM002
 	Custom subclasses must implement at a minimum ``__init__``, ``copy``, ``fromkeys``.
 	"""
 
+	__slots__ = ("_hash", )
+
 	dict_cls: Optional[Type] = None
 
 	@abstractmethod
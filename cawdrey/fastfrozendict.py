@@ -0,0 +1,262 @@
+#!/usr/bin/env python
+#
+#  fastfrozendict.py
+"""
+Provides fastfrozendict, an immutable :class:`dict` subclass.
+
+.. versionadded:: 0.6.0
+"""
+#
+#  Copyright © 2022 Dominic Davis-Foster <dominic@davis-foster.co.uk>
+#
+#  This program is free software; you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published by
+#  the Free Software Foundation; either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with this program; if not, write to the Free Software
+#  Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+#  MA 02110-1301, USA.
+#
+
+# stdlib
+from copy import deepcopy
+from typing import Any, Callable, Dict, Iterable, NoReturn, Optional, Type, TypeVar
+
+# 3rd party
+from domdf_python_tools.doctools import prettify_docstrings
+
+# this package
+from ._frozendict import frozendict
+from .base import KT, VT, DictWrapper, Evolver, FrozenBase
+from .frozenordereddict import FrozenOrderedDict
+
+__all__ = ["fastfrozendict", "FastFrozenOrderedDict"]
+
+_FF = TypeVar("_FF", bound="fastfrozendict")
+
+
+def _blocked(name: str) -> Callable[..., NoReturn]:
+
+	def method(self: "fastfrozendict", *args, **kwargs) -> NoReturn:
+		raise AttributeError(f"{self.__class__.__name__!r} object has no attribute {name!r}")
+
+	method.__name__ = name
+	return method
+
+
+@prettify_docstrings
+class fastfrozendict(Dict[KT, VT]):  # noqa: PRM002
+	r"""
+	An immutable subclass of :class:`dict`, with the same interface as :class:`~cawdrey._frozendict.frozendict`.
+
+	Unlike :class:`~cawdrey._frozendict.frozendict`, which wraps a dictionary,
+	this class *is* a dictionary with its mutating methods blocked.
+	Item lookups, membership tests, :func:`len` and iteration therefore
+	run at the speed of :class:`dict` itself, without a Python-level method call.
+	Instances can also be passed to code which requires an actual :class:`dict`.
+
+	The other methods and operators, such as :meth:`~.fastfrozendict.sorted`, :meth:`~.fastfrozendict.evolver`
+	and ``+``, are shared with :class:`~cawdrey._frozendict.frozendict` and return instances of this class.
+	Instances are registered as virtual subclasses of :class:`~.FrozenBase`.
+	Unlike :class:`~cawdrey._frozendict.frozendict`, :meth:`~.fastfrozendict.adopt` always copies the dictionary,
+	as the items are stored in the instance itself.
+
+	The dictionary can still be modified by calling the methods of :class:`dict` directly,
+	such as ``dict.__setitem__(fd, key, value)``, which must not be done.
+
+	.. versionadded:: 0.6.0
+
+	:param \*args: Passed to :class:`dict`.
+	:param \*\*kwargs: Passed to :class:`dict`.
+	"""
+
+	__slots__ = ("_hash", "_sorted_keys")
+
+	dict_cls = dict
+	_hash: Optional[int]
+
+	def __init__(self, *args, **kwargs):
+		if hasattr(self, "_hash"):
+			raise TypeError(f"`{self.__class__}` can only be initialised once.")
+
+		super().__init__(*args, **kwargs)
+		self._hash = None
+
+	@property
+	def _dict(self) -> Dict[KT, VT]:
+		# The methods shared with frozendict read the items from ``self._dict``.
+		return self
+
+	def __setitem__(self, key: KT, value: VT) -> NoReturn:
+		raise TypeError(f"{self.__class__.__name__!r} object does not support item assignment")
+
+	def __delitem__(self, key: KT) -> NoReturn:
+		raise TypeError(f"{self.__class__.__name__!r} object does not support item deletion")
+
+	# As with frozendict, the mutating methods behave as if they do not exist.
+	clear = _blocked("clear")
+	pop = _blocked("pop")
+	popitem = _blocked("popitem")
+	setdefault = _blocked("setdefault")
+	update = _blocked("update")
+
+	# These only read from the dictionary, so the implementations can be shared.
+	__hash__ = frozendict.__hash__  # type: ignore[assignment]
+	_derived_hash = FrozenBase._derived_hash
+	copy = frozendict.copy  # type: ignore[assignment]
+	getmany = DictWrapper.getmany
+	contains_many = DictWrapper.contains_many
+	_pick = DictWrapper._pick
+	pick = FrozenBase.pick
+	proxy = FrozenBase.proxy
+	dump = FrozenBase.dump
+	to_shared = FrozenBase.to_shared
+	intern_pool = FrozenBase.__dict__["intern_pool"]
+	intern = FrozenBase.__dict__["intern"]
+	sorted = frozendict.sorted  # noqa: A003  # pylint: disable=redefined-builtin
+	_sorted_index = frozendict._sorted_index
+	bisect = frozendict.bisect
+	floor = frozendict.floor
+	ceiling = frozendict.ceiling
+	range = frozendict.range  # noqa: A003  # pylint: disable=redefined-builtin
+	_from_subset = frozendict._from_subset
+	__add__ = frozendict.__add__
+	__sub__ = frozendict.__sub__
+	__and__ = frozendict.__and__
+	union_many = frozendict.__dict__["union_many"]
+	difference_many = frozendict.__dict__["difference_many"]
+
+	def __repr__(self) -> str:
+		return f"<{self.__class__.__name__} {dict.__repr__(self)}>"
+
+	def __reduce__(self):  # noqa: MAN002
+		# The default reduction for dict subclasses restores the items through __setitem__.
+		return self.__class__, (dict(self), ), getattr(self, "__dict__", None) or None
+
+	def __copy__(self: _FF) -> _FF:
+		return self
+
+	def __deepcopy__(self: _FF, memo: Dict[int, Any]) -> _FF:
+		items = []
+		copied = False
+
+		for key, value in self.items():
+			new_key, new_value = deepcopy(key, memo), deepcopy(value, memo)
+			copied = copied or new_key is not key or new_value is not value
+			items.append((new_key, new_value))
+
+		state = getattr(self, "__dict__", None)
+
+		# If nothing needed copying this dictionary is immutable all the way down, so can be shared.
+		if not copied and not state:
+			memo[id(self)] = self
+			return self
+
+		new = self.__class__(items)
+		memo[id(self)] = new
+
+		if state:
+			new.__dict__.update(deepcopy(state, memo))
+
+		return new
+
+	@classmethod
+	def adopt(cls: Type[_FF], d: dict) -> _FF:
+		"""
+		Construct a new instance from the items of ``d``.
+
+		As the items are stored in the instance itself, this always copies them.
+
+		:param d:
+		"""
+
+		return cls(d)
+
+	@classmethod
+	def fromkeys(cls, iterable: Iterable[KT], value: Optional[VT] = None) -> "fastfrozendict[KT, Any]":  # type: ignore[override]
+		"""
+		Returns a new :class:`~.fastfrozendict` with keys from ``iterable`` and values equal to ``value``.
+
+		:param iterable:
+		:param value:
+		"""
+
+		# dict.fromkeys would construct an empty instance and then call __setitem__.
+		return cls(dict.fromkeys(iterable, value))
+
+	def evolver(self) -> Evolver[KT, VT]:
+		"""
+		Returns a mutable :class:`~.Evolver` for building a new dictionary from this one.
+
+		The dictionary is copied when the evolver is first modified,
+		and again by :meth:`Evolver.persistent() <.Evolver.persistent>`.
+		"""
+
+		return _FastEvolver(self)
+
+	def __or__(self: _FF, other: Any) -> _FF:  # type: ignore[override]
+		if not isinstance(other, dict):
+			return NotImplemented
+
+		tmp = dict(self)
+		tmp.update(other)
+		return self.__class__(tmp)
+
+	def __ior__(self: _FF, other: Any) -> _FF:  # type: ignore[override,misc]
+		# Rebinds the name to a new instance rather than updating this one in place, as with tuples.
+		return self.__or__(other)
+
+	def __ror__(self: _FF, other: Any) -> _FF:  # type: ignore[override]
+		if not isinstance(other, dict):
+			return NotImplemented
+
+		tmp = dict(other)
+		tmp.update(self)
+		return self.__class__(tmp)
+
+
+FrozenBase.register(fastfrozendict)
+
+
+@prettify_docstrings
+class FastFrozenOrderedDict(fastfrozendict[KT, VT]):  # noqa: PRM002
+	r"""
+	The :class:`~.fastfrozendict` counterpart of :class:`~cawdrey.frozenordereddict.FrozenOrderedDict`.
+
+	As both classes store their items in insertion order in a :class:`dict`,
+	and ignore the order when comparing for equality, this only differs from :class:`~.fastfrozendict` in name.
+	Instances are registered as virtual subclasses of :class:`~cawdrey.frozenordereddict.FrozenOrderedDict`.
+
+	.. versionadded:: 0.6.0
+
+	:param \*args: Passed to :class:`dict`.
+	:param \*\*kwargs: Passed to :class:`dict`.
+	"""
+
+	__slots__ = ()
+
+
+FrozenOrderedDict.register(FastFrozenOrderedDict)
+
+
+class _FastEvolver(Evolver[KT, VT]):
+	"""
+	:class:`~.Evolver` for :class:`~.fastfrozendict`.
+
+	:param original: The frozen dictionary to start from.
+	"""
+
+	__slots__ = ()
+
+	def _prepare_write(self) -> None:
+		# The store is the immutable dictionary itself, so copy it into a plain dict before the first change.
+		if self._result is not None:
+			self._dict = dict(self._dict)
+			self._result = None
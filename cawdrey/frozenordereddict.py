@@ -26,9 +26,8 @@ Provides FrozenOrderedDict, an immutable ordered dictionary.
 
 # stdlib
 import operator
-from collections import OrderedDict
 from functools import reduce
-from typing import AbstractSet, Optional, Tuple, Union, ValuesView, overload
+from typing import AbstractSet, Optional, Tuple, Type, Union, ValuesView, overload
 
 # this package
 from .base import KT, VT, FrozenBase, T
@@ -40,9 +39,18 @@ class FrozenOrderedDict(FrozenBase[KT, VT]):  # noqa: PRM002
 	"""
 	An immutable OrderedDict.
 	It can be used as a drop-in replacement for dictionaries where immutability is desired.
+
+	.. versionchanged:: 0.6.0
+
+		The items are stored in a plain :class:`dict`, which preserves insertion order
+		and uses around half the memory of a :class:`collections.OrderedDict`.
+		As before, the order of the items is not significant when comparing for equality.
+		Subclasses may set :attr:`~.FrozenOrderedDict.dict_cls` to :class:`collections.OrderedDict` to use it instead.
 	"""
 
-	dict_cls = OrderedDict
+	__slots__ = ()
+
+	dict_cls: Type[dict] = dict
 
 	def __init__(self, *args, **kwargs):
 		if hasattr(self, "_dict"):
@@ -59,11 +67,15 @@ class FrozenOrderedDict(FrozenBase[KT, VT]):  # noqa: PRM002
 		"""
 
 		new_dict = self._dict.copy()
+		changes = dict(*args, **kwargs)
+		new_dict.update(changes)
 
-		if args or kwargs:
-			new_dict.update(OrderedDict(*args, **kwargs))
-
-		return self.__class__(new_dict)
+		new = self.__class__(new_dict)
+		new._hash = self._derived_hash(
+				removed=((k, self._dict[k]) for k in changes if k in self._dict),
+				added=changes.items(),
+				)
+		return new
 
 	def __hash__(self) -> int:
 		"""
@@ -89,28 +101,28 @@ class FrozenOrderedDict(FrozenBase[KT, VT]):  # noqa: PRM002
 		:param default: The value to return if ``key`` is not in the dictionary.
 		"""
 
-		return super().get(k, default)
+		return self._dict.get(k, default)
 
 	def items(self) -> AbstractSet[Tuple[KT, VT]]:  # type: ignore[override]
 		r"""
 		Returns a set-like object providing a view on the :class:`~.FrozenOrderedDict`\'s items.
 		"""
 
-		return super().items()
+		return self._dict.items()
 
 	def keys(self) -> AbstractSet[KT]:  # type: ignore[override]
 		r"""
 		Returns a set-like object providing a view on the :class:`~.FrozenOrderedDict`\'s keys.
 		"""
 
-		return super().keys()
+		return self._dict.keys()
 
 	def values(self) -> ValuesView[VT]:
 		r"""
 		Returns an object providing a view on the :class:`~.FrozenOrderedDict`\'s values.
 		"""
 
-		return super().values()
+		return self._dict.values()
 
 	def __contains__(self, key: object) -> bool:
 		"""
@@ -119,7 +131,7 @@ class FrozenOrderedDict(FrozenBase[KT, VT]):  # noqa: PRM002
 		:param key:
 		"""
 
-		return super().__contains__(key)
+		return key in self._dict
 
 	def __getitem__(self, key: KT) -> VT:
 		"""
@@ -128,4 +140,4 @@ class FrozenOrderedDict(FrozenBase[KT, VT]):  # noqa: PRM002
 		:param key:
 		"""
 
-		return super().__getitem__(key)
+		return self._dict[key]
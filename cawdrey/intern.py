@@ -0,0 +1,201 @@
+#!/usr/bin/env python
+#
+#  intern.py
+"""
+Interning (hash-consing) of frozen dictionaries.
+
+.. versionadded:: 0.6.0
+"""
+#
+#  Copyright © 2022 Dominic Davis-Foster <dominic@davis-foster.co.uk>
+#
+#  This program is free software; you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published by
+#  the Free Software Foundation; either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with this program; if not, write to the Free Software
+#  Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+#  MA 02110-1301, USA.
+#
+
+# stdlib
+import weakref
+from typing import Callable, Dict, Generic, List, NamedTuple, TypeVar
+
+# this package
+from ._frozendict import frozendict
+from .frozenordereddict import FrozenOrderedDict
+
+__all__ = ["InternPool", "InternStats", "InternedFrozenDict", "InternedFrozenOrderedDict"]
+
+_H = TypeVar("_H")
+
+
+def _identical(candidate: object, obj: object) -> bool:
+	# Equal mappings may differ in type or iteration order (e.g. frozendict and FrozenOrderedDict),
+	# and returning one in place of the other would change the order seen by the caller.
+	if type(candidate) is not type(obj) or candidate != obj:
+		return False
+
+	items = getattr(obj, "items", None)
+	if items is None:
+		return True
+
+	return list(candidate.items()) == list(items())  # type: ignore[attr-defined]
+
+
+class InternStats(NamedTuple):
+	"""
+	Statistics about an :class:`~.InternPool`.
+	"""
+
+	#: The number of canonical instances currently in the pool.
+	size: int
+
+	#: The number of times an equal instance was already in the pool.
+	hits: int
+
+	#: The number of times a new canonical instance was added to the pool.
+	misses: int
+
+	#: The number of canonical instances which have been removed from the pool
+	#: because they were garbage collected.
+	evictions: int
+
+	@property
+	def hit_rate(self) -> float:
+		"""
+		The proportion of lookups which found an equal instance in the pool.
+		"""
+
+		lookups = self.hits + self.misses
+
+		if not lookups:
+			return 0.0
+
+		return self.hits / lookups
+
+
+class InternPool(Generic[_H]):
+	"""
+	A pool of canonical instances of hashable objects.
+
+	:meth:`~.InternPool.intern` returns the instance in the pool which is equal to the given object,
+	or adds the object to the pool if there is none.
+	Instances are only considered equal if they are of the same type and,
+	for mappings, iterate over their items in the same order.
+	Equal objects therefore collapse to a single instance, which saves memory
+	and allows equality checks to short-circuit on identity.
+
+	The pool only holds weak references to its instances,
+	which are removed from the pool once they are no longer used elsewhere.
+	Objects must therefore support weak references.
+	"""
+
+	def __init__(self):
+		self._table: Dict[int, List["weakref.ref[_H]"]] = {}
+		self._size = 0
+		self._hits = 0
+		self._misses = 0
+		self._evictions = 0
+
+	def intern(self, obj: _H) -> _H:
+		"""
+		Returns the canonical instance equal to ``obj``.
+
+		:param obj:
+
+		:raises TypeError: If ``obj`` is unhashable or does not support weak references.
+		"""
+
+		h = hash(obj)
+		bucket = self._table.get(h)
+
+		if bucket is None:
+			bucket = self._table[h] = []
+		else:
+			# Copy the bucket, as a garbage collection could remove from it during iteration.
+			for ref in tuple(bucket):
+				candidate = ref()
+				if candidate is not None and (candidate is obj or _identical(candidate, obj)):
+					self._hits += 1
+					return candidate
+
+		bucket.append(weakref.ref(obj, self._make_callback(h)))
+		self._size += 1
+		self._misses += 1
+		return obj
+
+	def _make_callback(self, h: int) -> Callable[["weakref.ref[_H]"], None]:
+
+		def evict(ref: "weakref.ref[_H]") -> None:
+			bucket = self._table.get(h)
+
+			if bucket is None or ref not in bucket:
+				return
+
+			bucket.remove(ref)
+			if not bucket:
+				del self._table[h]
+
+			self._size -= 1
+			self._evictions += 1
+
+		return evict
+
+	def __len__(self) -> int:
+		"""
+		Returns the number of canonical instances in the pool.
+		"""
+
+		return self._size
+
+	def stats(self) -> InternStats:
+		"""
+		Returns statistics about the pool.
+		"""
+
+		return InternStats(self._size, self._hits, self._misses, self._evictions)
+
+	def clear(self) -> None:
+		"""
+		Remove all instances from the pool and reset the statistics.
+		"""
+
+		self._table.clear()
+		self._size = self._hits = self._misses = self._evictions = 0
+
+
+class InternedFrozenDict(frozendict):
+	"""
+	A :class:`~cawdrey._frozendict.frozendict` which can be interned with :meth:`~.FrozenBase.intern`.
+
+	The only difference from :class:`~cawdrey._frozendict.frozendict` is that instances support weak references,
+	which are required by the pool.
+
+	.. code-block:: python3
+
+		>>> a = InternedFrozenDict.intern({"hello": "World"})
+		>>> a is InternedFrozenDict.intern(hello="World")
+		True
+	"""
+
+	__slots__ = ("__weakref__", )
+
+
+class InternedFrozenOrderedDict(FrozenOrderedDict):
+	"""
+	A :class:`~cawdrey.frozenordereddict.FrozenOrderedDict` which can be interned with :meth:`~.FrozenBase.intern`.
+
+	The only difference from :class:`~cawdrey.frozenordereddict.FrozenOrderedDict`
+	is that instances support weak references, which are required by the pool.
+	"""
+
+	__slots__ = ("__weakref__", )
@@ -0,0 +1,438 @@
+#!/usr/bin/env python
+#
+#  level_dict.py
+"""
+Persistent, disk-backed :class:`collections.abc.MutableMapping` stored in a local log file.
+
+.. versionadded:: 0.6.0
+"""
+#
+#  Copyright © 2022 Dominic Davis-Foster <dominic@davis-foster.co.uk>
+#
+#  This program is free software; you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published by
+#  the Free Software Foundation; either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with this program; if not, write to the Free Software
+#  Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+#  MA 02110-1301, USA.
+#
+
+# stdlib
+import json
+import mmap
+import os
+import struct
+import weakref
+from typing import Any, Callable, Dict, Iterator, MutableMapping, Tuple, Type, TypeVar
+
+# 3rd party
+from domdf_python_tools.typing import PathLike
+
+# this package
+from cawdrey.base import KT, VT
+
+__all__ = ["LevelDict", "LogFile", "TypedLevelDict", "register_codec"]
+
+_L = TypeVar("_L", bound="LevelDict")
+
+# File layout (all integers little-endian):
+#
+# * header: magic number
+# * records, in the order they were written: operation, key length, value length, key, value
+#
+# The last record for a key determines its value. Deletions are recorded with an empty value.
+
+_MAGIC = b"CWDRLOG\x01"
+_RECORD = struct.Struct("<BII")
+_PUT = 1
+_DELETE = 2
+
+_Codec = Tuple[Callable[[Any], bytes], Callable[[bytes], Any]]
+
+_codecs: Dict[type, _Codec] = {
+		str: (lambda obj: str.encode(obj, "UTF-8", "surrogatepass"), lambda data: data.decode("UTF-8", "surrogatepass")),
+		bytes: (bytes, bytes),
+		bool: (lambda obj: b'1' if obj else b'0', lambda data: data == b'1'),
+		int: (lambda obj: str(int(obj)).encode("ascii"), int),
+		float: (lambda obj: repr(float(obj)).encode("ascii"), float),
+		object: (lambda obj: json.dumps(obj).encode("UTF-8"), json.loads),
+		}
+
+
+def register_codec(type_: type, encode: Callable[[Any], bytes], decode: Callable[[bytes], Any]) -> None:
+	"""
+	Register functions to convert instances of ``type_`` to and from :class:`bytes`,
+	for use as the :attr:`~.LevelDict.key_type` or :attr:`~.LevelDict.value_type` of a :class:`~.LevelDict`.
+
+	:param type_:
+	:param encode: Function which converts an instance of ``type_`` to :class:`bytes`.
+	:param decode: Function which converts the output of ``encode`` back to an instance of ``type_``.
+	"""  # noqa: D400
+
+	_codecs[type_] = (encode, decode)
+
+
+def _get_codec(type_: type) -> _Codec:
+	try:
+		return _codecs[type_]
+	except KeyError:
+		raise TypeError(f"No codec registered for {type_.__name__!r}. Use 'register_codec' to add one.") from None
+
+
+class LogFile:
+	"""
+	An append-only log of key-value records, used as the storage for a :class:`~.LevelDict`.
+
+	Writes are collected in memory and written to disk in batches,
+	when more than ``buffer_size`` bytes are waiting or when :meth:`~.LogFile.flush` is called.
+
+	:param path: The file to store the log in. It is created if it does not exist.
+	:param buffer_size: The number of bytes of pending writes to hold in memory before writing them to disk.
+
+	:raises ValueError: If the file exists but is not a log file.
+	"""
+
+	def __init__(self, path: PathLike, buffer_size: int = 1 << 20):
+		self.path: str = os.fspath(path)
+		self.buffer_size: int = buffer_size
+		self._buffer = bytearray()
+
+		if not os.path.exists(self.path):
+			with open(self.path, "wb") as fp:
+				fp.write(_MAGIC)
+
+		self._fp = open(self.path, "r+b")  # noqa: SIM115
+		self._size = self._fp.seek(0, os.SEEK_END)
+		self._fp.seek(0)
+
+		if self._fp.read(len(_MAGIC)) != _MAGIC:
+			self._fp.close()
+			raise ValueError(f"{self.path!r} is not a {self.__class__.__name__}.")
+
+	@property
+	def closed(self) -> bool:
+		"""
+		Whether the log has been closed.
+		"""
+
+		return self._fp.closed
+
+	def records(self) -> Iterator[Tuple[int, bytes, int, int]]:
+		"""
+		Iterate over the records in the log.
+
+		Yields tuples of the operation, the key, and the offset and length of the value.
+		The values themselves are not read.
+
+		If the log ends with an incomplete record, such as after a crash part way through a write,
+		that record is removed from the file.
+		"""
+
+		self.flush()
+
+		if self._size == len(_MAGIC):
+			return
+
+		with mmap.mmap(self._fp.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+			offset = len(_MAGIC)
+			end = self._size
+
+			while offset + _RECORD.size <= end:
+				op, key_len, value_len = _RECORD.unpack_from(mm, offset)
+				key_start = offset + _RECORD.size
+				value_start = key_start + key_len
+
+				if value_start + value_len > end:
+					break
+
+				yield op, mm[key_start:value_start], value_start, value_len
+				offset = value_start + value_len
+
+		if offset != end:
+			self._fp.truncate(offset)
+			self._size = offset
+
+	def append(self, op: int, key: bytes, value: bytes = b'') -> int:
+		"""
+		Add a record to the end of the log.
+
+		:param op:
+		:param key:
+		:param value:
+
+		:returns: The offset of the value in the log.
+		"""
+
+		buffer = self._buffer
+		value_offset = self._size + len(buffer) + _RECORD.size + len(key)
+
+		buffer += _RECORD.pack(op, len(key), len(value))
+		buffer += key
+		buffer += value
+
+		if len(buffer) >= self.buffer_size:
+			self.flush()
+
+		return value_offset
+
+	def read(self, offset: int, length: int) -> bytes:
+		"""
+		Read ``length`` bytes from the log, starting at ``offset``.
+
+		:param offset:
+		:param length:
+		"""
+
+		if offset >= self._size:
+			start = offset - self._size
+			return bytes(self._buffer[start:start + length])
+
+		self._fp.seek(offset)
+		return self._fp.read(length)
+
+	def flush(self) -> None:
+		"""
+		Write any pending records to disk.
+		"""
+
+		if self._buffer:
+			self._fp.seek(self._size)
+			self._fp.write(self._buffer)
+			self._fp.flush()
+			self._size += len(self._buffer)
+			self._buffer.clear()
+
+	def close(self) -> None:
+		"""
+		Write any pending records to disk and close the file.
+
+		Has no effect if the log is already closed.
+		"""
+
+		if not self._fp.closed:
+			self.flush()
+			self._fp.close()
+
+	def __repr__(self) -> str:
+		return f"<{self.__class__.__name__} {self.path!r}>"
+
+
+class LevelDict(MutableMapping[KT, VT]):
+	"""
+	A :class:`~collections.abc.MutableMapping` which is stored in a file on disk.
+
+	Changes are appended to a log file (see :class:`~.LogFile`),
+	and an index of the keys and the locations of their values is kept in memory.
+	Reopening an existing file only reads the keys, and values are read from disk when they are accessed.
+
+	Keys are strings, and values may be any object which can be serialised to JSON.
+	Subclasses can store other types by setting :attr:`~.LevelDict.key_type` and :attr:`~.LevelDict.value_type`
+	(see :class:`~.TypedLevelDict`).
+
+	Writes are batched, so call :meth:`~.LevelDict.flush` or :meth:`~.LevelDict.close`
+	(or use the dictionary as a context manager) to ensure they have been written to disk.
+	Any pending writes are also written when the dictionary is garbage collected.
+
+	Overwritten and deleted values continue to take up space in the file until :meth:`~.LevelDict.compact` is called.
+
+	:param path: The file to store the dictionary in. It is created if it does not exist.
+	:param buffer_size: The number of bytes of pending writes to hold in memory before writing them to disk.
+	"""
+
+	#: The type of the keys. A codec must be registered for it with :func:`~.register_codec`.
+	key_type: Type = str
+
+	#: The type of the values. A codec must be registered for it with :func:`~.register_codec`.
+	#: :class:`object` means any value which can be serialised to JSON.
+	value_type: Type = object
+
+	#: The underlying log file.
+	db: LogFile
+
+	def __init__(self, path: PathLike, buffer_size: int = 1 << 20):
+		self._encode_key, self._decode_key = _get_codec(self.key_type)
+		self._encode_value, self._decode_value = _get_codec(self.value_type)
+
+		self.db = LogFile(path, buffer_size=buffer_size)
+		self._finalizer = weakref.finalize(self, self.db.close)
+		self._load_index()
+
+	def _load_index(self) -> None:
+		index: Dict[KT, Tuple[int, int]] = {}
+		decode_key = self._decode_key
+
+		for op, key, value_offset, value_len in self.db.records():
+			if op == _PUT:
+				index[decode_key(key)] = (value_offset, value_len)
+			else:
+				index.pop(decode_key(key), None)
+
+		self._index = index
+
+	@property
+	def path(self) -> str:
+		"""
+		The path of the underlying file.
+		"""
+
+		return self.db.path
+
+	def __getitem__(self, key: KT) -> VT:
+		"""
+		Return ``self[key]``.
+
+		:param key:
+		"""
+
+		offset, length = self._index[key]
+		return self._decode_value(self.db.read(offset, length))
+
+	def __setitem__(self, key: KT, value: VT) -> None:
+		"""
+		Set ``self[key]`` to ``value``.
+
+		:param key:
+		:param value:
+		"""
+
+		encoded = self._encode_value(value)
+		self._index[key] = (self.db.append(_PUT, self._encode_key(key), encoded), len(encoded))
+
+	def __delitem__(self, key: KT) -> None:
+		"""
+		Delete ``self[key]``.
+
+		:param key:
+		"""
+
+		del self._index[key]
+		self.db.append(_DELETE, self._encode_key(key))
+
+	def __contains__(self, key: object) -> bool:
+		"""
+		Return ``key in self``.
+
+		This does not read from the file.
+
+		:param key:
+		"""
+
+		return key in self._index
+
+	def __iter__(self) -> Iterator[KT]:
+		"""
+		Iterates over the dictionary's keys.
+		"""
+
+		return iter(self._index)
+
+	def __len__(self) -> int:
+		"""
+		Returns the number of keys in the dictionary.
+		"""
+
+		return len(self._index)
+
+	def __repr__(self) -> str:
+		return f"<{self.__class__.__name__} {self.path!r}>"
+
+	def flush(self) -> None:
+		"""
+		Write any pending changes to disk.
+		"""
+
+		self.db.flush()
+
+	def close(self) -> None:
+		"""
+		Write any pending changes to disk and close the underlying file.
+
+		The dictionary cannot be used afterwards.
+		"""
+
+		self._finalizer()
+
+	def __enter__(self: _L) -> _L:
+		return self
+
+	def __exit__(self, *args) -> None:
+		self.close()
+
+	def compact(self) -> None:
+		"""
+		Rewrite the underlying file so that it only contains the current values.
+		"""
+
+		db = self.db
+		db.flush()
+
+		tmp_path = f"{db.path}.{os.getpid()}.tmp"
+
+		# A leftover file from an interrupted compaction would otherwise be appended to,
+		# and its stale records would reappear when the log is next loaded.
+		if os.path.exists(tmp_path):
+			os.unlink(tmp_path)
+
+		new = LogFile(tmp_path, buffer_size=db.buffer_size)
+		index: Dict[KT, Tuple[int, int]] = {}
+
+		try:
+			for key, (offset, length) in self._index.items():
+				index[key] = (new.append(_PUT, self._encode_key(key), db.read(offset, length)), length)
+
+			new.close()
+			db.close()
+			os.replace(tmp_path, db.path)
+
+		except BaseException:
+			new.close()
+			if os.path.exists(tmp_path):
+				os.unlink(tmp_path)
+			raise
+
+		self._finalizer.detach()
+		self.db = LogFile(db.path, buffer_size=db.buffer_size)
+		self._finalizer = weakref.finalize(self, self.db.close)
+		self._index = index
+
+
+class TypedLevelDict(LevelDict[KT, VT]):
+	"""
+	A :class:`~.LevelDict` which checks the types of keys and values.
+
+	Subclasses must set :attr:`~.LevelDict.key_type` and :attr:`~.LevelDict.value_type`:
+
+	.. code-block:: python
+
+		class MyDict(TypedLevelDict[str, int]):
+			key_type = str
+			value_type = int
+
+	Setting a key or value of the wrong type raises a :exc:`TypeError`.
+
+	:param path: The file to store the dictionary in. It is created if it does not exist.
+	:param buffer_size: The number of bytes of pending writes to hold in memory before writing them to disk.
+	"""
+
+	def __setitem__(self, key: KT, value: VT) -> None:
+		"""
+		Set ``self[key]`` to ``value``.
+
+		:param key:
+		:param value:
+		"""
+
+		if not isinstance(key, self.key_type):
+			raise TypeError(f"Keys must be of type {self.key_type.__name__!r}, not {type(key).__name__!r}")
+		if not isinstance(value, self.value_type):
+			raise TypeError(f"Values must be of type {self.value_type.__name__!r}, not {type(value).__name__!r}")
+
+		super().__setitem__(key, value)
@@ -0,0 +1,520 @@
+#!/usr/bin/env python
+#
+#  mappedfrozendict.py
+"""
+A read-only dictionary of strings stored in a file, which is accessed via :mod:`mmap`.
+
+.. versionadded:: 0.6.0
+"""
+#
+#  Copyright © 2022 Dominic Davis-Foster <dominic@davis-foster.co.uk>
+#
+#  This program is free software; you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published by
+#  the Free Software Foundation; either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with this program; if not, write to the Free Software
+#  Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+#  MA 02110-1301, USA.
+#
+
+# stdlib
+import mmap
+import os
+import struct
+import sys
+from array import array
+from itertools import repeat
+from typing import (
+		IO,
+		Any,
+		Dict,
+		ItemsView,
+		Iterable,
+		Iterator,
+		KeysView,
+		List,
+		Mapping,
+		Optional,
+		Tuple,
+		Type,
+		TypeVar,
+		Union,
+		ValuesView,
+		overload
+		)
+from zlib import crc32
+
+# 3rd party
+from domdf_python_tools.doctools import prettify_docstrings
+from domdf_python_tools.typing import PathLike
+
+# this package
+from ._frozendict import frozendict
+from .base import Evolver, FrozenBase, T
+
+__all__ = ["MappedFrozenDict"]
+
+_M = TypeVar("_M", bound="MappedFrozenDict")
+
+# File layout (all integers little-endian):
+#
+# * header: magic number, format version, reserved, number of items, number of index slots, offset of the index
+# * entries: key length, value length, UTF-8 encoded key, UTF-8 encoded value; in insertion order
+# * padding to a multiple of 8 bytes
+# * index: an open-addressing hash table with linear probing. Each slot holds the CRC-32 of the key
+#   and the offset of the entry plus one, so that a slot of zeros is empty.
+
+_MAGIC = b"CAWDREY\x00"
+_VERSION = 1
+_HEADER = struct.Struct("<8sIIQQQ")
+_ENTRY = struct.Struct("<II")
+_SLOT = struct.Struct("<QQ")
+
+
+def _encode(obj: object, what: str) -> bytes:
+	if not isinstance(obj, str):
+		raise TypeError(f"{what} must be strings, not {type(obj).__name__!r}")
+
+	return obj.encode("UTF-8", "surrogatepass")
+
+
+def _write(items: Iterable[Tuple[Any, Any]], size: int, fp: IO[bytes]) -> None:
+	# Write ``size`` items to ``fp``, which must be seekable.
+
+	n_slots = 8
+	while n_slots < size * 2:
+		n_slots <<= 1
+
+	mask = n_slots - 1
+	index = array('Q', bytes(_SLOT.size * n_slots))
+
+	fp.write(bytes(_HEADER.size))
+	offset = _HEADER.size
+	count = 0
+
+	for key, value in items:
+		if count == size:
+			raise RuntimeError("dictionary changed size during iteration")
+
+		key_bytes = _encode(key, "Keys")
+		value_bytes = _encode(value, "Values")
+		key_hash = crc32(key_bytes)
+
+		slot = key_hash & mask
+		while index[2 * slot + 1]:
+			slot = (slot + 1) & mask
+
+		index[2 * slot] = key_hash
+		index[2 * slot + 1] = offset + 1
+
+		fp.write(_ENTRY.pack(len(key_bytes), len(value_bytes)))
+		fp.write(key_bytes)
+		fp.write(value_bytes)
+		offset += _ENTRY.size + len(key_bytes) + len(value_bytes)
+		count += 1
+
+	padding = -offset % 8
+	fp.write(bytes(padding))
+
+	if sys.byteorder != "little":
+		index.byteswap()
+
+	index.tofile(fp)
+
+	fp.seek(0)
+	fp.write(_HEADER.pack(_MAGIC, _VERSION, 0, count, n_slots, offset + padding))
+
+
+def _dump(items: Iterable[Tuple[Any, Any]], size: int, path: PathLike) -> None:
+	# Write ``size`` items to ``path``.
+	# The file is written alongside and then moved into place, so readers never see a partial file.
+
+	path = os.fspath(path)
+	tmp_path = f"{path}.{os.getpid()}.tmp"
+
+	try:
+		with open(tmp_path, "wb") as fp:
+			_write(items, size, fp)
+
+		os.replace(tmp_path, path)
+
+	except BaseException:
+		if os.path.exists(tmp_path):
+			os.unlink(tmp_path)
+		raise
+
+
+def _decode(data: Any) -> str:
+	return str(data, "UTF-8", "surrogatepass")
+
+
+class _MappedItemsView(ItemsView[str, str]):
+
+	def __iter__(self) -> Iterator[Tuple[str, str]]:
+		return self._mapping._iter_items()
+
+
+class _MappedValuesView(ValuesView[str]):
+
+	def __iter__(self) -> Iterator[str]:
+		for _, value in self._mapping._iter_items():
+			yield value
+
+
+class _FlatMapping(FrozenBase[str, str]):
+	"""
+	Base class for read-only dictionaries of strings stored in a buffer, in the format written by :meth:`FrozenBase.dump() <.FrozenBase.dump>`.
+	"""
+
+	__slots__ = ("_buffer", "_len", "_mask", "_index_offset")
+
+	_buffer: Any
+	_len: int
+	_mask: int
+	_index_offset: int
+	_transient_slots = FrozenBase._transient_slots | {"_buffer", "_len", "_mask", "_index_offset"}
+
+	def _load(self, buffer: Any, description: str) -> None:
+		# Read the header from ``buffer`` and use it for lookups.
+
+		if len(buffer) < _HEADER.size or buffer[:len(_MAGIC)] != _MAGIC:
+			raise ValueError(f"{description} is not a {self.__class__.__name__}.")
+
+		magic, version, _, size, n_slots, index_offset = _HEADER.unpack_from(buffer)
+
+		if version != _VERSION:
+			raise ValueError(f"Unsupported {self.__class__.__name__} version {version} in {description}.")
+
+		self._buffer = buffer
+		self._len = size
+		self._mask = n_slots - 1
+		self._index_offset = index_offset
+		self._hash = None
+
+	def _find(self, key: object) -> Optional[Tuple[int, int]]:
+		# Returns the offset and length of the value for ``key``, or :py:obj:`None` if it is not in the dictionary.
+
+		if not isinstance(key, str):
+			return None
+
+		key_bytes = key.encode("UTF-8", "surrogatepass")
+		key_len = len(key_bytes)
+		key_hash = crc32(key_bytes)
+
+		buffer = self._buffer
+		mask = self._mask
+		index_offset = self._index_offset
+		slot = key_hash & mask
+
+		while True:
+			slot_hash, offset = _SLOT.unpack_from(buffer, index_offset + slot * _SLOT.size)
+
+			if not offset:
+				return None
+
+			if slot_hash == key_hash:
+				offset -= 1
+				entry_key_len, value_len = _ENTRY.unpack_from(buffer, offset)
+				start = offset + _ENTRY.size
+
+				if entry_key_len == key_len and buffer[start:start + key_len] == key_bytes:
+					return start + key_len, value_len
+
+			slot = (slot + 1) & mask
+
+	def _iter_items(self) -> Iterator[Tuple[str, str]]:
+		buffer = self._buffer
+		offset = _HEADER.size
+
+		for _ in range(self._len):
+			key_len, value_len = _ENTRY.unpack_from(buffer, offset)
+			start = offset + _ENTRY.size
+			end = start + key_len
+			offset = end + value_len
+			yield _decode(buffer[start:end]), _decode(buffer[end:offset])
+
+	def __getitem__(self, key: str) -> str:
+		"""
+		Return ``self[key]``.
+
+		:param key:
+		"""
+
+		found = self._find(key)
+
+		if found is None:
+			raise KeyError(key)
+
+		start, length = found
+		return _decode(self._buffer[start:start + length])
+
+	def __contains__(self, key: object) -> bool:
+		"""
+		Return ``key in self``.
+
+		:param key:
+		"""
+
+		return self._find(key) is not None
+
+	def __iter__(self) -> Iterator[str]:
+		"""
+		Iterates over the dictionary's keys.
+		"""
+
+		for key, _ in self._iter_items():
+			yield key
+
+	def __len__(self) -> int:
+		"""
+		Returns the number of keys in the dictionary.
+		"""
+
+		return self._len
+
+	def __hash__(self) -> int:
+		if self._hash is None:
+			h = 0
+			for item in self._iter_items():
+				h ^= hash(item)
+			self._hash = h
+		return self._hash
+
+	def __eq__(self, other: object) -> bool:
+		"""
+		Return ``self == other``.
+
+		:param other:
+		"""
+
+		if self is other:
+			return True
+
+		if not isinstance(other, Mapping):
+			return NotImplemented
+
+		if len(self) != len(other):
+			return False
+
+		return dict(self._iter_items()) == dict(other.items())
+
+	@overload
+	def get(self, k: str) -> Optional[str]: ...  # pragma: no cover
+
+	@overload
+	def get(self, k: str, default: Union[str, T]) -> Union[str, T]: ...  # pragma: no cover
+
+	def get(self, k, default=None):  # noqa: MAN001,MAN002
+		"""
+		Return the value for ``k`` if ``k`` is in the dictionary, else ``default``.
+
+		:param k: The key to return the value for.
+		:param default: The value to return if ``key`` is not in the dictionary.
+		"""
+
+		found = self._find(k)
+
+		if found is None:
+			return default
+
+		start, length = found
+		return _decode(self._buffer[start:start + length])
+
+	def items(self) -> ItemsView[str, str]:  # type: ignore[override]
+		"""
+		Returns a set-like object providing a view on the dictionary's items.
+		"""
+
+		return _MappedItemsView(self)
+
+	def values(self) -> ValuesView[str]:  # type: ignore[override]
+		"""
+		Returns an object providing a view on the dictionary's values.
+		"""
+
+		return _MappedValuesView(self)
+
+	def keys(self) -> KeysView[str]:  # type: ignore[override]
+		"""
+		Returns a set-like object providing a view on the dictionary's keys.
+		"""
+
+		return KeysView(self)
+
+	def getmany(self, keys: Iterable[str], default: Optional[T] = None) -> List[Union[str, T, None]]:
+		"""
+		Return the values for each of ``keys``, or ``default`` for keys not in the dictionary.
+
+		:param keys: The keys to return the values for.
+		:param default: The value to return for keys not in the dictionary.
+		"""
+
+		return list(map(self.get, keys, repeat(default)))
+
+	def contains_many(self, keys: Iterable[Any]) -> List[bool]:
+		"""
+		Return whether each of ``keys`` is in the dictionary.
+
+		:param keys:
+		"""
+
+		return list(map(self.__contains__, keys))
+
+	def pick(self, keys: Iterable[str]) -> frozendict[str, str]:  # type: ignore[override]
+		"""
+		Returns a new :class:`~cawdrey._frozendict.frozendict` containing only the given keys.
+
+		Keys which are not in the dictionary are ignored.
+
+		:param keys:
+		"""
+
+		return frozendict.adopt(self._pick(keys))
+
+	def _pick(self, keys: Iterable[str]) -> Dict[str, str]:
+		res = {}
+
+		for k in keys:
+			value = self.get(k)
+			if value is not None:
+				res[k] = value
+
+		return res
+
+	def copy(self, *args, **kwargs) -> frozendict[str, str]:  # type: ignore[override]  # noqa: PRM002
+		r"""
+		Return a :class:`~cawdrey._frozendict.frozendict` with the contents of the dictionary,
+		updated with the given keys and values.
+
+		:param \*args:
+		:param \*\*kwargs:
+		"""  # noqa: D400
+
+		d = dict(self._iter_items())
+		d.update(*args, **kwargs)
+		return frozendict.adopt(d)
+
+	def evolver(self) -> Evolver[str, str]:
+		"""
+		Returns a mutable :class:`~.Evolver` for building a new :class:`~cawdrey._frozendict.frozendict`
+		from the contents of this dictionary.
+		"""  # noqa: D400
+
+		return frozendict.adopt(dict(self._iter_items())).evolver()
+
+	@classmethod
+	def adopt(cls, d: dict) -> frozendict[str, Any]:  # type: ignore[override]
+		"""
+		Returns a new :class:`~cawdrey._frozendict.frozendict` which takes ownership of ``d`` without copying it.
+
+		The dictionary's contents are stored outside of the Python heap, so ``d`` cannot be adopted by this class.
+
+		:param d:
+		"""
+
+		return frozendict.adopt(d)
+
+	@classmethod
+	def fromkeys(cls, iterable: Iterable[str], value: Optional[str] = None) -> frozendict[str, Any]:  # type: ignore[override]
+		"""
+		Returns a new :class:`~cawdrey._frozendict.frozendict` with keys from ``iterable`` and values equal to ``value``.
+
+		:param iterable:
+		:param value:
+		"""
+
+		return frozendict.fromkeys(iterable, value)
+
+
+@prettify_docstrings
+class MappedFrozenDict(_FlatMapping):  # noqa: PRM002
+	"""
+	A read-only dictionary of strings, stored in a file written by :meth:`FrozenBase.dump() <.FrozenBase.dump>`.
+
+	The file is accessed via :mod:`mmap` rather than being read into memory,
+	so opening it takes constant time regardless of its size.
+	Processes which open the same file share a single copy of it in the operating system's page cache.
+
+	Keys are found via a hash table stored in the file, and values are only decoded when they are accessed.
+	Iteration order is the order of the dictionary the file was written from.
+
+	Pickling a :class:`~.MappedFrozenDict` only pickles the path to the file.
+
+	Methods which derive a new dictionary, such as :meth:`~.MappedFrozenDict.copy`,
+	return a :class:`~cawdrey._frozendict.frozendict`.
+
+	.. versionadded:: 0.6.0
+
+	:param path: The file to open.
+
+	:raises ValueError: If the file is not in the expected format.
+	"""
+
+	__slots__ = ("_path", "_mmap")
+
+	_path: str
+	_mmap: mmap.mmap
+	_transient_slots = _FlatMapping._transient_slots | {"_path", "_mmap"}
+
+	def __init__(self, path: PathLike):
+		if hasattr(self, "_mmap"):
+			raise TypeError(f"`{self.__class__}` can only be initialised once.")
+
+		self._path = os.fspath(path)
+
+		with open(self._path, "rb") as fp:
+			# The mapping remains valid after the file is closed.
+			self._mmap = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+
+		try:
+			self._load(self._mmap, repr(self._path))
+		except ValueError:
+			self._mmap.close()
+			raise
+
+	@classmethod
+	def open(cls: Type[_M], path: PathLike) -> _M:  # noqa: A003  # pylint: disable=redefined-builtin
+		"""
+		Open the dictionary stored in ``path``.
+
+		:param path:
+		"""
+
+		return cls(path)
+
+	def close(self) -> None:
+		"""
+		Close the underlying memory map.
+
+		The dictionary cannot be used afterwards.
+		"""
+
+		self._mmap.close()
+
+	def __enter__(self: _M) -> _M:
+		return self
+
+	def __exit__(self, *args) -> None:
+		self.close()
+
+	@property
+	def path(self) -> str:
+		"""
+		The path of the underlying file.
+		"""
+
+		return self._path
+
+	def __repr__(self) -> str:
+		return f"<{self.__class__.__name__} {self._path!r}>"
+
+	def __reduce__(self):  # noqa: MAN002
+		return self.__class__, (self._path, ), self._get_state()
@@ -25,50 +25,130 @@ Provides dictionaries that cannot contain :py:obj:`None`.
 #
 
 # stdlib
-import operator
-from collections import OrderedDict
-from functools import reduce
-from typing import Optional, TypeVar
+from typing import Any, Dict, Iterable, Mapping, Optional, Tuple, Type, TypeVar
 
 # 3rd party
-from domdf_python_tools.doctools import prettify_docstrings
+from domdf_python_tools.doctools import is_documented_by, prettify_docstrings
 
 # this package
-from .base import KT, VT, MutableBase
+from .base import KT, VT, DictWrapper, MutableBase
 
 __all__ = ["NonelessDict", "NonelessOrderedDict", "_ND", "_NOD"]
 
 _ND = TypeVar("_ND", bound="NonelessDict")
 _NOD = TypeVar("_NOD", bound="NonelessOrderedDict")
+_NB = TypeVar("_NB", bound="_NonelessBase")
 
 
-@prettify_docstrings
-class NonelessDict(MutableBase[KT, VT]):  # noqa: PRM002
-	"""
-	A wrapper around dict that will check if a value is
-	:py:obj:`None`/empty/:py:obj:`False`, and not add the key in that case.
+def _items(other: Any) -> Iterable[Tuple[Any, Any]]:
+	# Returns the items of a mapping or iterable of pairs, in the same way as :meth:`dict.update`.
 
-	Use the :meth:`~.NonelessDict.set_with_strict_none_check` method to check only
-	for :py:obj:`None`.
+	if type(other) is dict or isinstance(other, Mapping):
+		return other.items()
+	elif hasattr(other, "keys"):
+		return ((key, other[key]) for key in other.keys())
+	else:
+		return other
 
-	.. autosummary-widths:: 1/2
-	"""  # noqa: D400
 
-	dict_cls = dict
+def _filtered(args: Tuple[Any, ...], kwargs: Dict[str, Any], strict_none: bool = False) -> Dict[Any, Any]:
+	# Returns a dict of the items given to ``update()``, without those which would be skipped.
+
+	if len(args) > 1:
+		raise TypeError(f"expected at most 1 positional argument, got {len(args)}")
+
+	if not args:
+		sources: Tuple[Iterable[Tuple[Any, Any]], ...] = (kwargs.items(), )
+	elif kwargs:
+		sources = (_items(args[0]), kwargs.items())
+	else:
+		sources = (_items(args[0]), )
+
+	result: Dict[Any, Any] = {}
+
+	for items in sources:
+		if strict_none:
+			filtered = {key: value for key, value in items if value is not None}
+		else:
+			filtered = {key: value for key, value in items if value}
+
+		if result:
+			result.update(filtered)
+		else:
+			result = filtered
+
+	return result
+
+
+class _NonelessBase(MutableBase[KT, VT]):  # noqa: PRM002
+	# Shared implementation of NonelessDict and NonelessOrderedDict.
+
+	__slots__ = ()
+
+	dict_cls: Type[dict] = dict
 	_hash: int
 
 	def __init__(self, *args, **kwargs):
 		if hasattr(self, "_dict"):
 			raise TypeError(f"`{self.__class__}` can only be initialised once.")
 
-		super().__init__(*args, **kwargs)
+		d = _filtered(args, kwargs)
+		self._dict = d if type(d) is self.dict_cls else self.dict_cls(d)
+		self._hash = None
 
-	def copy(self: _ND, **add_or_replace: VT) -> _ND:  # type: ignore[override]  # noqa: PRM002
-		"""
-		Return a copy of the dictionary.
+	@classmethod
+	def _wrap(cls: Type[_NB], d: Dict[KT, VT]) -> _NB:
+		# Construct a new instance from ``d`` without filtering it.
+
+		if type(d) is not cls.dict_cls:
+			d = cls.dict_cls(d)
+
+		new = cls.__new__(cls)
+		new._dict = d
+		new._hash = None
+		return new
+
+	@classmethod
+	def from_items(cls: Type[_NB], items: Any, strict_none: bool = False) -> _NB:
 		"""
+		Construct a new dictionary from a mapping or an iterable of ``(key, value)`` pairs,
+		skipping any values which are :py:obj:`None`, empty or :py:obj:`False`.
+
+		.. versionadded:: 0.6.0
+
+		:param items:
+		:param strict_none: If :py:obj:`True`, only skip :py:obj:`None` values.
+		"""  # noqa: D400
+
+		return cls._wrap(_filtered((items, ), {}, strict_none))
+
+	def update(self, *args, **kwargs) -> None:  # type: ignore[override]
+		r"""
+		Update the dictionary from a mapping or an iterable of ``(key, value)`` pairs, and/or keyword arguments,
+		skipping any values which are :py:obj:`None`, empty or :py:obj:`False`.
+
+		The items are filtered and inserted in bulk, rather than one at a time.
+
+		.. versionadded:: 0.6.0
 
-		return self.__class__(self, **add_or_replace)
+		:param \*args:
+		:param \*\*kwargs:
+		"""  # noqa: D400
+
+		self._dict.update(_filtered(args, kwargs))
+
+	def update_with_strict_none_check(self, *args, **kwargs) -> None:
+		r"""
+		Update the dictionary from a mapping or an iterable of ``(key, value)`` pairs, and/or keyword arguments,
+		but only skipping :py:obj:`None` values.
+
+		.. versionadded:: 0.6.0
+
+		:param \*args:
+		:param \*\*kwargs:
+		"""  # noqa: D400
+
+		self._dict.update(_filtered(args, kwargs, strict_none=True))
 
 	def __hash__(self) -> int:
 		if self._hash is None:
@@ -93,53 +173,63 @@ class NonelessDict(MutableBase[KT, VT]):  # noqa: PRM002
 		if value:
 			super().__setitem__(key, value)
 
+	@is_documented_by(DictWrapper.pick)
+	def pick(self: _NB, keys: Iterable[KT]) -> _NB:
+		# Values added with set_with_strict_none_check() must not be filtered out.
+		return self._wrap(self._pick(keys))
+
 
 @prettify_docstrings
-class NonelessOrderedDict(MutableBase[KT, VT]):  # noqa: PRM002
+class NonelessDict(_NonelessBase[KT, VT]):  # noqa: PRM002
 	"""
-	A wrapper around OrderedDict that will check if a value is None/empty/False,
-	and not add the key in that case.
-	Use the set_with_strict_none_check function to check only for None
-	"""  # noqa: D400
+	A wrapper around dict that will check if a value is
+	:py:obj:`None`/empty/:py:obj:`False`, and not add the key in that case.
 
-	dict_cls = OrderedDict
-	_hash: int
+	Use the :meth:`~.NonelessDict.set_with_strict_none_check` method to check only
+	for :py:obj:`None`.
 
-	def __init__(self, *args, **kwargs):
-		if hasattr(self, "_dict"):
-			raise TypeError(f"`{self.__class__}` can only be initialised once.")
+	.. versionchanged:: 0.6.0
 
-		super().__init__(*args, **kwargs)
+		Values passed to the constructor are also checked.
 
-	def copy(self: _NOD, *args, **kwargs) -> _NOD:  # noqa: PRM002
+	.. autosummary-widths:: 1/2
+	"""  # noqa: D400
+
+	__slots__ = ()
+
+	def copy(self: _ND, **add_or_replace: VT) -> _ND:  # type: ignore[override]  # noqa: PRM002
 		"""
 		Return a copy of the dictionary.
 		"""
 
-		new_dict = self._dict.copy()
+		new = self._wrap(self._dict.copy())
+		new.update(add_or_replace)
+		return new
 
-		if args or kwargs:
-			new_dict.update(OrderedDict(*args, **kwargs))
 
-		return self.__class__(new_dict)
+@prettify_docstrings
+class NonelessOrderedDict(_NonelessBase[KT, VT]):  # noqa: PRM002
+	"""
+	An insertion-ordered wrapper around dict that will check if a value is None/empty/False,
+	and not add the key in that case.
+	Use the set_with_strict_none_check function to check only for None
+
+	.. versionchanged:: 0.6.0
 
-	def __hash__(self) -> int:
-		if self._hash is None:
-			self._hash = reduce(operator.xor, map(hash, self.items()), 0)
+		The items are stored in a plain, insertion-ordered :class:`dict` rather than a :class:`collections.OrderedDict`.
+		Values passed to the constructor are also checked.
+	"""  # noqa: D400
 
-		return self._hash
+	__slots__ = ()
 
-	def set_with_strict_none_check(self, key: KT, value: Optional[VT]) -> None:
+	def copy(self: _NOD, *args, **kwargs) -> _NOD:  # noqa: PRM002
 		"""
-		Set ``key`` in the dictionary to ``value``, but skipping :py:obj:`None` values.
-
-		:param key:
-		:param value:
+		Return a copy of the dictionary.
 		"""
 
-		if value is not None:
-			self._dict[key] = value
+		new = self._wrap(self._dict.copy())
 
-	def __setitem__(self, key: KT, value: Optional[VT]) -> None:
-		if value:
-			super().__setitem__(key, value)
+		if args or kwargs:
+			new.update(*args, **kwargs)
+
+		return new
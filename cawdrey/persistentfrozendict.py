@@ -0,0 +1,638 @@
+#!/usr/bin/env python
+#
+#  persistentfrozendict.py
+"""
+Provides :class:`~.PersistentFrozenDict`, an immutable dictionary backed by a hash array mapped trie.
+
+.. versionadded:: 0.6.0
+"""
+#
+#  Copyright © 2022 Dominic Davis-Foster <dominic@davis-foster.co.uk>
+#
+#  This program is free software; you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published by
+#  the Free Software Foundation; either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with this program; if not, write to the Free Software
+#  Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+#  MA 02110-1301, USA.
+#
+
+# stdlib
+import sys
+from itertools import repeat
+from typing import (
+		AbstractSet,
+		Any,
+		Dict,
+		ItemsView,
+		Iterable,
+		Iterator,
+		KeysView,
+		List,
+		Mapping,
+		Optional,
+		Tuple,
+		Type,
+		TypeVar,
+		Union,
+		ValuesView,
+		overload
+		)
+
+# 3rd party
+from domdf_python_tools.doctools import prettify_docstrings
+
+# this package
+from .base import KT, VT, Evolver, FrozenBase, T
+
+__all__ = ["PersistentFrozenDict"]
+
+_P = TypeVar("_P", bound="PersistentFrozenDict")
+
+_BITS = 5
+_MASK = (1 << _BITS) - 1
+_HASH_MASK = (1 << sys.hash_info.width) - 1
+
+_MISSING: Any = object()
+
+#: A leaf of the trie, in the form ``(key, value, hash(key))``.
+_Leaf = Tuple[Any, Any, int]
+
+
+def _popcount(n: int) -> int:
+	return bin(n).count('1')
+
+
+def _make_node(shift: int, leaf1: _Leaf, leaf2: _Leaf) -> "Union[_BitmapNode, _CollisionNode]":
+	# Create the smallest subtree (rooted at ``shift``) that holds both leaves.
+
+	if leaf1[2] == leaf2[2]:
+		return _CollisionNode(leaf1[2], [leaf1, leaf2])
+
+	idx1 = (leaf1[2] >> shift) & _MASK
+	idx2 = (leaf2[2] >> shift) & _MASK
+
+	if idx1 == idx2:
+		return _BitmapNode(1 << idx1, [_make_node(shift + _BITS, leaf1, leaf2)])
+	elif idx1 < idx2:
+		return _BitmapNode((1 << idx1) | (1 << idx2), [leaf1, leaf2])
+	else:
+		return _BitmapNode((1 << idx1) | (1 << idx2), [leaf2, leaf1])
+
+
+class _BitmapNode:
+	"""
+	A trie node with up to 32 children, indexed by 5 bits of the key's hash.
+
+	Each entry in ``array`` is either a leaf tuple or another node.
+	"""
+
+	__slots__ = ("bitmap", "array")
+
+	def __init__(self, bitmap: int, array: List):
+		self.bitmap = bitmap
+		self.array = array
+
+	def find(self, shift: int, h: int, key: Any, default: Any) -> Any:
+		bit = 1 << ((h >> shift) & _MASK)
+		if not self.bitmap & bit:
+			return default
+
+		entry = self.array[_popcount(self.bitmap & (bit - 1))]
+
+		if type(entry) is tuple:
+			if entry[0] is key or entry[0] == key:
+				return entry[1]
+			return default
+
+		return entry.find(shift + _BITS, h, key, default)
+
+	def assoc(self, shift: int, h: int, key: Any, value: Any) -> Tuple["_BitmapNode", Optional[_Leaf]]:
+		"""
+		Returns the updated node and the leaf that was replaced (or :py:obj:`None` if the key is new).
+
+		A replaced leaf keeps its original key object. If the key is already mapped to ``value`` the node itself is returned.
+		"""
+
+		bit = 1 << ((h >> shift) & _MASK)
+		idx = _popcount(self.bitmap & (bit - 1))
+
+		if not self.bitmap & bit:
+			array = self.array[:]
+			array.insert(idx, (key, value, h))
+			return _BitmapNode(self.bitmap | bit, array), None
+
+		entry = self.array[idx]
+		old: Optional[_Leaf]
+
+		if type(entry) is tuple:
+			if entry[0] is key or entry[0] == key:
+				if entry[1] is value:
+					return self, entry
+				# As with dict, an equal key keeps the original key object.
+				new_entry: Any = (entry[0], value, h)
+				old = entry
+			else:
+				new_entry = _make_node(shift + _BITS, entry, (key, value, h))
+				old = None
+		else:
+			new_entry, old = entry.assoc(shift + _BITS, h, key, value)
+			if new_entry is entry:
+				return self, old
+
+		array = self.array[:]
+		array[idx] = new_entry
+		return _BitmapNode(self.bitmap, array), old
+
+	def without(self, shift: int, h: int, key: Any) -> Tuple[Any, _Leaf]:
+		"""
+		Returns the replacement for this node and the leaf that was removed.
+
+		The replacement is :py:obj:`None` if the node is now empty,
+		or a bare leaf if only a single leaf remains.
+
+		:raises KeyError: If the key is not present.
+		"""
+
+		bit = 1 << ((h >> shift) & _MASK)
+		if not self.bitmap & bit:
+			raise KeyError(key)
+
+		idx = _popcount(self.bitmap & (bit - 1))
+		entry = self.array[idx]
+
+		if type(entry) is tuple:
+			if not (entry[0] is key or entry[0] == key):
+				raise KeyError(key)
+			removed = entry
+			replacement = None
+		else:
+			replacement, removed = entry.without(shift + _BITS, h, key)
+
+		array = self.array[:]
+		bitmap = self.bitmap
+
+		if replacement is None:
+			del array[idx]
+			bitmap ^= bit
+		else:
+			array[idx] = replacement
+
+		if not array:
+			return None, removed
+		elif len(array) == 1 and type(array[0]) is tuple:
+			return array[0], removed
+
+		return _BitmapNode(bitmap, array), removed
+
+
+class _CollisionNode:
+	"""
+	A trie node holding leaves whose keys have identical hashes.
+	"""
+
+	__slots__ = ("hash", "array")
+
+	def __init__(self, h: int, array: List[_Leaf]):
+		self.hash = h
+		self.array = array
+
+	def find(self, shift: int, h: int, key: Any, default: Any) -> Any:
+		if h == self.hash:
+			for leaf in self.array:
+				if leaf[0] is key or leaf[0] == key:
+					return leaf[1]
+
+		return default
+
+	def assoc(self, shift: int, h: int, key: Any, value: Any) -> Tuple[Any, Optional[_Leaf]]:
+		if h != self.hash:
+			node = _BitmapNode(1 << ((self.hash >> shift) & _MASK), [self])
+			return node.assoc(shift, h, key, value)
+
+		array = self.array[:]
+
+		for idx, leaf in enumerate(array):
+			if leaf[0] is key or leaf[0] == key:
+				if leaf[1] is value:
+					return self, leaf
+				array[idx] = (leaf[0], value, h)
+				return _CollisionNode(h, array), leaf
+
+		array.append((key, value, h))
+		return _CollisionNode(h, array), None
+
+	def without(self, shift: int, h: int, key: Any) -> Tuple[Any, _Leaf]:
+		if h == self.hash:
+			for idx, leaf in enumerate(self.array):
+				if leaf[0] is key or leaf[0] == key:
+					array = self.array[:]
+					del array[idx]
+
+					if len(array) == 1:
+						return array[0], leaf
+
+					return _CollisionNode(h, array), leaf
+
+		raise KeyError(key)
+
+
+def _iter_leaves(node: Union[_BitmapNode, _CollisionNode]) -> Iterator[_Leaf]:
+	for entry in node.array:
+		if type(entry) is tuple:
+			yield entry
+		else:
+			yield from _iter_leaves(entry)
+
+
+_EMPTY = _BitmapNode(0, [])
+
+
+class _PersistentItemsView(ItemsView[Any, Any]):
+
+	def __iter__(self) -> Iterator[Tuple[Any, Any]]:
+		for leaf in _iter_leaves(self._mapping._root):
+			yield leaf[0], leaf[1]
+
+
+class _PersistentValuesView(ValuesView[Any]):
+
+	def __iter__(self) -> Iterator[Any]:
+		for leaf in _iter_leaves(self._mapping._root):
+			yield leaf[1]
+
+
+@prettify_docstrings
+class PersistentFrozenDict(FrozenBase[KT, VT]):  # noqa: PRM002
+	r"""
+	An immutable dictionary backed by a hash array mapped trie (HAMT).
+
+	Unlike :class:`~cawdrey._frozendict.frozendict`, deriving a new mapping with
+	:meth:`~.PersistentFrozenDict.set`, :meth:`~.PersistentFrozenDict.delete` or
+	:meth:`~.PersistentFrozenDict.update` does not copy the whole dictionary.
+	The new instance shares all unchanged parts of the trie with the original,
+	so deriving a mapping with a single key changed takes ``O(log n)`` time and memory.
+
+	The signature is the same as regular dictionaries.
+
+	.. note::
+
+		Iteration order is determined by the hashes of the keys, not by insertion order.
+
+	.. versionadded:: 0.6.0
+	"""
+
+	__slots__ = ("_root", "_len")
+
+	_root: _BitmapNode
+	_len: int
+	_transient_slots = FrozenBase._transient_slots | {"_root", "_len"}
+
+	def __init__(self, *args, **kwargs):
+		if hasattr(self, "_root"):
+			raise TypeError(f"`{self.__class__}` can only be initialised once.")
+
+		if len(args) == 1 and not kwargs and isinstance(args[0], PersistentFrozenDict):
+			self._root = args[0]._root
+			self._len = args[0]._len
+			self._hash = args[0]._hash
+			return
+
+		root = _EMPTY
+		size = 0
+
+		for key, value in dict(*args, **kwargs).items():
+			root, old = root.assoc(0, hash(key) & _HASH_MASK, key, value)
+			if old is None:
+				size += 1
+
+		self._root = root
+		self._len = size
+		self._hash = None
+
+	@classmethod
+	def _from_root(cls, root: _BitmapNode, size: int, hash_: Optional[int] = None) -> Any:
+		new = cls.__new__(cls)
+		new._root = root
+		new._len = size
+		new._hash = hash_
+		return new
+
+	def __getitem__(self, key: KT) -> VT:
+		"""
+		Return ``self[key]``.
+
+		:param key:
+		"""
+
+		value = self._root.find(0, hash(key) & _HASH_MASK, key, _MISSING)
+		if value is _MISSING:
+			raise KeyError(key)
+		return value
+
+	def __contains__(self, key: object) -> bool:
+		"""
+		Return ``key in self``.
+
+		:param key:
+		"""
+
+		return self._root.find(0, hash(key) & _HASH_MASK, key, _MISSING) is not _MISSING
+
+	def __iter__(self) -> Iterator[KT]:
+		"""
+		Iterates over the dictionary's keys.
+		"""
+
+		for leaf in _iter_leaves(self._root):
+			yield leaf[0]
+
+	def __len__(self) -> int:
+		"""
+		Returns the number of keys in the dictionary.
+		"""
+
+		return self._len
+
+	def __repr__(self) -> str:
+		return f"<{self.__class__.__name__} {dict(self.items())!r}>"
+
+	def __hash__(self) -> int:
+		if self._hash is None:
+			h = 0
+			for leaf in _iter_leaves(self._root):
+				h ^= hash((leaf[0], leaf[1]))
+			self._hash = h
+		return self._hash
+
+	def __reduce__(self):  # noqa: MAN002
+		return self.__class__, (dict(self.items()), ), self._get_state()
+
+	def __eq__(self, other: object) -> bool:
+		"""
+		Return ``self == other``.
+
+		:param other:
+		"""
+
+		if self is other:
+			return True
+
+		if isinstance(other, PersistentFrozenDict):
+			if self._len != other._len:
+				return False
+			if self._hash is not None and other._hash is not None and self._hash != other._hash:
+				return False
+
+		if not isinstance(other, Mapping):
+			return NotImplemented
+
+		return dict(self.items()) == dict(other.items())
+
+	@overload
+	def get(self, k: KT) -> Optional[VT]: ...  # pragma: no cover
+
+	@overload
+	def get(self, k: KT, default: Union[VT, T]) -> Union[VT, T]: ...  # pragma: no cover
+
+	def get(self, k, default=None):  # noqa: MAN001,MAN002
+		"""
+		Return the value for ``k`` if ``k`` is in the dictionary, else ``default``.
+
+		:param k: The key to return the value for.
+		:param default: The value to return if ``key`` is not in the dictionary.
+		"""
+
+		return self._root.find(0, hash(k) & _HASH_MASK, k, default)
+
+	def getmany(self, keys: Iterable[KT], default: Optional[T] = None) -> List[Union[VT, T, None]]:
+		"""
+		Return the values for each of ``keys``, or ``default`` for keys not in the dictionary.
+
+		:param keys: The keys to return the values for.
+		:param default: The value to return for keys not in the dictionary.
+		"""
+
+		return list(map(self.get, keys, repeat(default)))
+
+	def contains_many(self, keys: Iterable[Any]) -> List[bool]:
+		"""
+		Return whether each of ``keys`` is in the dictionary.
+
+		:param keys:
+		"""
+
+		return list(map(self.__contains__, keys))
+
+	def pick(self: _P, keys: Iterable[KT]) -> _P:
+		"""
+		Returns a new :class:`~.PersistentFrozenDict` containing only the given keys.
+
+		Keys which are not in the dictionary are ignored.
+
+		:param keys:
+		"""
+
+		return self.__class__(self._pick(keys))
+
+	def _pick(self, keys: Iterable[KT]) -> Dict[KT, VT]:
+		res = {}
+
+		for k in keys:
+			value = self.get(k, _MISSING)
+			if value is not _MISSING:
+				res[k] = value
+
+		return res
+
+	@classmethod
+	def adopt(cls: Type[_P], d: dict) -> _P:
+		"""
+		Construct a new instance from the items of ``d``.
+
+		As the items are stored in a trie rather than a dictionary, this always copies them.
+
+		:param d:
+		"""
+
+		return cls(d)
+
+	def items(self) -> AbstractSet[Tuple[KT, VT]]:  # type: ignore[override]
+		"""
+		Returns a set-like object providing a view on the dictionary's items.
+		"""
+
+		return _PersistentItemsView(self)
+
+	def keys(self) -> AbstractSet[KT]:  # type: ignore[override]
+		"""
+		Returns a set-like object providing a view on the dictionary's keys.
+		"""
+
+		return KeysView(self)
+
+	def values(self) -> ValuesView[VT]:
+		"""
+		Returns an object providing a view on the dictionary's values.
+		"""
+
+		return _PersistentValuesView(self)
+
+	def set(self: _P, key: KT, value: VT) -> _P:  # noqa: A003  # pylint: disable=redefined-builtin
+		"""
+		Return a new :class:`~.PersistentFrozenDict` with ``key`` set to ``value``.
+
+		If ``key`` is already mapped to ``value`` the dictionary itself is returned.
+
+		:param key:
+		:param value:
+		"""
+
+		root, old = self._root.assoc(0, hash(key) & _HASH_MASK, key, value)
+
+		if root is self._root:
+			return self
+
+		if old is None:
+			return self._from_root(root, self._len + 1, self._derived_hash(added=[(key, value)]))
+		else:
+			return self._from_root(root, self._len, self._derived_hash([old[:2]], [(key, value)]))
+
+	def delete(self: _P, key: KT) -> _P:
+		"""
+		Return a new :class:`~.PersistentFrozenDict` without ``key``.
+
+		:param key:
+
+		:raises KeyError: If ``key`` is not in the dictionary.
+		"""
+
+		replacement, removed = self._root.without(0, hash(key) & _HASH_MASK, key)
+
+		if replacement is None:
+			root = _EMPTY
+		elif type(replacement) is tuple:
+			root = _BitmapNode(1 << (replacement[2] & _MASK), [replacement])
+		else:
+			root = replacement
+
+		return self._from_root(root, self._len - 1, self._derived_hash(removed=[removed[:2]]))
+
+	def update(self: _P, *args, **kwargs) -> _P:  # noqa: PRM002
+		r"""
+		Return a new :class:`~.PersistentFrozenDict` updated with the given keys and values.
+
+		The arguments are interpreted in the same way as for :meth:`dict.update`.
+
+		:param \*args:
+		:param \*\*kwargs:
+		"""
+
+		root = self._root
+		size = self._len
+		removed = []
+		changes = dict(*args, **kwargs)
+
+		for key, value in changes.items():
+			root, old = root.assoc(0, hash(key) & _HASH_MASK, key, value)
+			if old is None:
+				size += 1
+			else:
+				removed.append(old[:2])
+
+		if root is self._root:
+			return self
+
+		return self._from_root(root, size, self._derived_hash(removed, changes.items()))
+
+	def copy(self: _P, *args, **kwargs) -> _P:  # noqa: PRM002
+		r"""
+		Return a copy of the dictionary, updated with the given keys and values.
+
+		:param \*args:
+		:param \*\*kwargs:
+		"""
+
+		return self.update(*args, **kwargs)
+
+	def evolver(self) -> "_PersistentEvolver[KT, VT]":
+		"""
+		Returns a mutable :class:`~.Evolver` for building a new dictionary from this one.
+
+		Each change is applied to the trie as it is made,
+		so the result continues to share structure with this dictionary.
+		"""
+
+		return _PersistentEvolver(self)
+
+
+class _PersistentEvolver(Evolver[KT, VT]):
+	"""
+	:class:`~.Evolver` for :class:`~.PersistentFrozenDict`.
+
+	:param original: The frozen dictionary to start from.
+	"""
+
+	__slots__ = ("_current", )
+
+	def __init__(self, original: PersistentFrozenDict[KT, VT]):  # pylint: disable=super-init-not-called
+		self._current = original
+
+	def __getitem__(self, key: KT) -> VT:
+		return self._current[key]
+
+	def __contains__(self, key: object) -> bool:
+		return key in self._current
+
+	def __iter__(self) -> Iterator[KT]:
+		return iter(self._current)
+
+	def __len__(self) -> int:
+		return len(self._current)
+
+	def __repr__(self) -> str:
+		return f"<{self.__class__.__name__} {dict(self._current.items())!r}>"
+
+	def get(self, k, default=None):  # noqa: MAN001,MAN002
+		return self._current.get(k, default)
+
+	def items(self) -> AbstractSet[Tuple[KT, VT]]:  # type: ignore[override]
+		return self._current.items()
+
+	def keys(self) -> AbstractSet[KT]:  # type: ignore[override]
+		return self._current.keys()
+
+	def values(self) -> ValuesView[VT]:  # type: ignore[override]
+		return self._current.values()
+
+	def getmany(self, keys: Iterable[KT], default: Optional[T] = None) -> List[Union[VT, T, None]]:
+		return self._current.getmany(keys, default)
+
+	def contains_many(self, keys: Iterable[Any]) -> List[bool]:
+		return self._current.contains_many(keys)
+
+	def pick(self, keys: Iterable[KT]) -> PersistentFrozenDict[KT, VT]:  # type: ignore[override]
+		return self._current.pick(keys)
+
+	def __setitem__(self, key: KT, value: VT) -> None:
+		self._current = self._current.set(key, value)
+
+	def __delitem__(self, key: KT) -> None:
+		self._current = self._current.delete(key)
+
+	def update(self, *args, **kwargs) -> None:  # noqa: PRM002
+		self._current = self._current.update(*args, **kwargs)
+
+	def clear(self) -> None:
+		self._current = self._current._from_root(_EMPTY, 0)
+
+	def persistent(self) -> PersistentFrozenDict[KT, VT]:
+		return self._current
@@ -0,0 +1,171 @@
+#!/usr/bin/env python
+#
+#  sharedfrozendict.py
+"""
+A read-only dictionary of strings stored in :mod:`multiprocessing.shared_memory`.
+
+.. versionadded:: 0.6.0
+"""
+#
+#  Copyright © 2022 Dominic Davis-Foster <dominic@davis-foster.co.uk>
+#
+#  This program is free software; you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published by
+#  the Free Software Foundation; either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with this program; if not, write to the Free Software
+#  Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+#  MA 02110-1301, USA.
+#
+
+# stdlib
+import weakref
+from io import BytesIO
+from typing import TYPE_CHECKING, Any, Iterable, Tuple, Type, TypeVar
+
+# this package
+from .mappedfrozendict import _FlatMapping, _write
+
+if TYPE_CHECKING:
+	# stdlib
+	from multiprocessing.shared_memory import SharedMemory
+
+__all__ = ["SharedFrozenDict"]
+
+_S = TypeVar("_S", bound="SharedFrozenDict")
+
+
+def _release(buffer: memoryview, shm: "SharedMemory", owner: bool) -> None:
+	buffer.release()
+	shm.close()
+
+	if owner:
+		try:
+			shm.unlink()
+		except FileNotFoundError:
+			pass
+
+
+class SharedFrozenDict(_FlatMapping):
+	"""
+	A read-only dictionary of strings, stored in a block of shared memory.
+
+	Create one with :meth:`FrozenBase.to_shared() <.FrozenBase.to_shared>`,
+	and pass it to other processes, such as the workers of a :class:`concurrent.futures.ProcessPoolExecutor`.
+	Pickling a :class:`~.SharedFrozenDict` only pickles the name of the shared memory block,
+	and unpickling it attaches to the same block, so the contents are neither copied nor deserialised.
+
+	The process which created the dictionary owns the shared memory block,
+	which is destroyed when that instance is closed, either with :meth:`~.SharedFrozenDict.close`,
+	at the end of a :keyword:`with` block, or when it is garbage collected:
+
+	.. code-block:: python
+
+		with frozendict(reference_data).to_shared() as shared:
+			with ProcessPoolExecutor() as executor:
+				results = list(executor.map(process, tasks, repeat(shared)))
+
+	Instances in other processes only detach from the block when they are closed.
+
+	Methods which derive a new dictionary, such as :meth:`~.SharedFrozenDict.copy`,
+	return a :class:`~cawdrey._frozendict.frozendict`.
+
+	.. note:: This requires Python 3.8 or newer.
+
+	.. versionadded:: 0.6.0
+
+	:param name: The name of an existing shared memory block created by :meth:`FrozenBase.to_shared() <.FrozenBase.to_shared>`.
+
+	:raises ValueError: If the block does not contain a dictionary.
+	"""
+
+	__slots__ = ("_shm", "_owner", "_finalizer", "__weakref__")
+
+	_shm: "SharedMemory"
+	_owner: bool
+	_finalizer: weakref.finalize
+	_transient_slots = _FlatMapping._transient_slots | {"_shm", "_owner", "_finalizer"}
+
+	def __init__(self, name: str):
+		if hasattr(self, "_shm"):
+			raise TypeError(f"`{self.__class__}` can only be initialised once.")
+
+		# stdlib
+		from multiprocessing.shared_memory import SharedMemory
+
+		self._attach(SharedMemory(name=name), owner=False)
+
+	@classmethod
+	def _create(cls: Type[_S], items: Iterable[Tuple[Any, Any]], size: int) -> _S:
+		# Create a new shared memory block containing ``items``, owned by the returned instance.
+
+		# stdlib
+		from multiprocessing.shared_memory import SharedMemory
+
+		fp = BytesIO()
+		_write(items, size, fp)
+
+		with fp.getbuffer() as data:
+			shm = SharedMemory(create=True, size=len(data))
+			shm.buf[:len(data)] = data
+
+		new = cls.__new__(cls)
+		new._attach(shm, owner=True)
+		return new
+
+	def _attach(self, shm: "SharedMemory", owner: bool) -> None:
+		buffer = shm.buf.toreadonly()
+
+		try:
+			self._load(buffer, repr(shm.name))
+		except ValueError:
+			_release(buffer, shm, owner)
+			raise
+
+		self._shm = shm
+		self._owner = owner
+		self._finalizer = weakref.finalize(self, _release, buffer, shm, owner)
+
+	@property
+	def name(self) -> str:
+		"""
+		The name of the underlying shared memory block.
+		"""
+
+		return self._shm.name
+
+	@property
+	def owner(self) -> bool:
+		"""
+		Whether this instance created the shared memory block, and will destroy it when closed.
+		"""
+
+		return self._owner
+
+	def close(self) -> None:
+		"""
+		Detach from the shared memory block, and destroy it if this instance is the :attr:`~.SharedFrozenDict.owner`.
+
+		The dictionary cannot be used afterwards.
+		"""
+
+		self._finalizer()
+
+	def __enter__(self: _S) -> _S:
+		return self
+
+	def __exit__(self, *args) -> None:
+		self.close()
+
+	def __repr__(self) -> str:
+		return f"<{self.__class__.__name__} {self.name!r}>"
+
+	def __reduce__(self):  # noqa: MAN002
+		return self.__class__, (self.name, ), self._get_state()
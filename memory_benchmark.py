@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Memory benchmark script.
+
+Reports the number of bytes allocated per instance for each dictionary type,
+excluding the keys and values themselves (which are shared between instances).
+
+Requires https://github.com/MagicStack/immutables
+"""
+
+# stdlib
+import gc
+import tracemalloc
+import uuid
+
+# 3rd party
+import immutables
+
+# this package
+from cawdrey import AlphaDict, FrozenOrderedDict, NonelessDict, PersistentFrozenDict, frozendict
+
+dictionary_sizes = (0, 1, 8, 1000)
+types = (dict, immutables.Map, frozendict, FrozenOrderedDict, AlphaDict, NonelessDict, PersistentFrozenDict)
+
+
+def getUuid():
+	return str(uuid.uuid4())
+
+
+def bytes_per_instance(klass, d, number):
+	gc.collect()
+	tracemalloc.start()
+	before = tracemalloc.get_traced_memory()[0]
+
+	instances = [klass(d) for _ in range(number)]
+
+	after = tracemalloc.get_traced_memory()[0]
+	tracemalloc.stop()
+
+	# The list holding the instances is not part of their footprint.
+	list_size = instances.__sizeof__()
+	del instances
+
+	return (after - before - list_size) / number
+
+
+for n in dictionary_sizes:
+	print('#' * 80)
+	d = {getUuid(): getUuid() for i in range(n)}
+	number = 100000 if n < 1000 else 1000
+
+	for klass in types:
+		print(
+				"Dictionary size: {: >4}; Type: {: >20}; bytes per instance: {: >10.1f}".format(
+						n, klass.__name__, bytes_per_instance(klass, d, number)
+						),
+				)
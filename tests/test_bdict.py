@@ -1,8 +1,13 @@
+# stdlib
+import copy
+import functools
+import pickle
+
 # 3rd party
 import pytest
 
 # this package
-from cawdrey import bdict
+from cawdrey import bdict, frozenbdict, frozendict
 
 
 def test_bdict():
@@ -33,11 +38,18 @@ def test_bdict():
 	assert new_dict[1234] == "Key1"
 	assert new_dict["Key1"] == 1234
 
+	# A key may equal the value of another pair.
 	new_dict["Value2"] = 5678
-	assert "Key2" not in new_dict
+	assert new_dict["Key2"] == "Value2"
+	assert new_dict.inverse["Value2"] == "Key2"
 	assert new_dict[5678] == "Value2"
 	assert new_dict["Value2"] == 5678
 
+	# Reusing a value replaces the pair which had it.
+	new_dict["Key4"] = "Value3"
+	assert "Key3" not in new_dict
+	assert new_dict.inverse["Value3"] == "Key4"
+
 
 def test_bdict_from_dict():
 	original_dict = {"Alice": 27, "Bob": 30, "Dom": 23}
@@ -95,12 +107,205 @@ def test_bdict_bool():
 	assert new_dict[False] == 'F'
 	assert new_dict[None] == 'N'
 
-	assert "_None" in new_dict
-	assert new_dict["_None"] == 'N'
+	# No sentinel values are stored.
+	assert "_None" not in new_dict
 
-	# Test for pyMHDAC
 	new_dict_2: bdict = bdict(Unspecified=0, _None=1, GC=2, LC=3, CE=4)
 
-	assert None in new_dict_2
+	assert None not in new_dict_2
+	assert new_dict_2["_None"] == 1
+	assert new_dict_2[1] == "_None"
+
+
+def test_bdict_inverse():
+	new_dict: bdict = bdict(Alice=27, Bob=30)
+	inverse = new_dict.inverse
+
+	assert isinstance(inverse, bdict)
+	assert inverse is new_dict.inverse
+	assert inverse.inverse is new_dict
+	assert dict(inverse) == {27: "Alice", 30: "Bob"}
+	assert len(new_dict) == len(inverse) == 2
+	assert list(new_dict) == ["Alice", "Bob"]
+
+	# Changes are reflected in both directions.
+	inverse[23] = "Dom"
+	assert new_dict["Dom"] == 23
+	del new_dict["Alice"]
+	assert 27 not in inverse
+
+	# Deleting by value.
+	del new_dict[30]
+	assert "Bob" not in new_dict
+	assert dict(new_dict) == {"Dom": 23}
+
+	with pytest.raises(KeyError):
+		del new_dict["Alice"]
+
+	new_dict.clear()
+	assert not inverse
+
+
+def test_bdict_copy():
+	new_dict: bdict = bdict(Alice=27, Bob=30)
+
+	for copied in (new_dict.copy(), copy.copy(new_dict)):
+		assert type(copied) is bdict
+		copied["Alice"] = 28
+		assert new_dict["Alice"] == 27
+		assert 28 not in new_dict.inverse
+		assert copied.inverse[28] == "Alice"
+
+	new_dict |= {"Dom": 23}
+	assert new_dict.inverse[23] == "Dom"
+
+	new = pickle.loads(pickle.dumps(new_dict))
+	assert new == new_dict
+	assert new.inverse[23] == "Dom"
+
+
+def test_frozenbdict():
+	fbd: frozenbdict = frozenbdict([("Alice", 27), ("Bob", 30)], Dom=23)
+
+	assert fbd["Alice"] == 27
+	assert fbd.inverse[23] == "Dom"
+	assert 27 not in fbd
+	assert list(fbd) == ["Alice", "Bob", "Dom"]
+	assert isinstance(fbd.inverse, frozenbdict)
+	assert fbd.inverse is fbd.inverse
+	assert fbd.inverse.inverse is fbd
+	assert fbd == {"Alice": 27, "Bob": 30, "Dom": 23}
+	assert hash(fbd) == hash(frozendict(fbd))
+	assert frozenbdict(fbd)._inverse is fbd._inverse
+
+	with pytest.raises(ValueError, match="The keys 'Alice' and 'Dom' have the same value 27."):
+		frozenbdict(Alice=27, Dom=27)
+
+	with pytest.raises(TypeError, match="can only be initialised once"):
+		fbd.__init__()
+
+
+def test_frozenbdict_from_bdict():
+	bd: bdict = bdict(Alice=27, Bob=30)
+	fbd = frozenbdict(bd)
+
+	assert fbd.inverse[30] == "Bob"
+	assert fbd._dict is not bd.data
+	bd["Alice"] = 28
+	assert fbd["Alice"] == 27
+	assert 28 not in fbd.inverse
+
+
+def test_frozenbdict_derived():
+	fbd: frozenbdict = frozenbdict(Alice=27, Bob=30)
+	hash(fbd)
+
+	new = fbd.copy(Alice=28)
+	assert type(new) is frozenbdict
+	assert new.inverse[28] == "Alice"
+	assert 27 not in new.inverse
+	assert new._hash == hash(frozenbdict(new.items()))
+
+	with pytest.raises(ValueError, match="have the same value 30"):
+		fbd.copy(Alice=30)
+
+	assert fbd.pick(["Bob"]).inverse == {30: "Bob"}
+
+	evolver = fbd.evolver()
+	evolver["Dom"] = 23
+	assert evolver.persistent().inverse[23] == "Dom"
+
+	for new in (pickle.loads(pickle.dumps(fbd)), copy.deepcopy(fbd)):
+		assert new == fbd
+		assert new.inverse[30] == "Bob"
+
+
+def test_frozenbdict_cache_key():
+
+	@functools.lru_cache()
+	def lookup(table: frozenbdict, value: int) -> str:
+		return table.inverse[value]
+
+	assert lookup(frozenbdict(Alice=27), 27) == "Alice"
+	assert lookup(frozenbdict(Alice=27), 27) == "Alice"
+	assert lookup.cache_info().hits == 1
+
+
+def test_bdict_update():
+	new_dict: bdict = bdict(Alice=27, Bob=30)
+
+	assert new_dict.update([("Dom", 23)], Eve=31) == []
+	assert new_dict.inverse[31] == "Eve"
+
+	# Pairs which are already present are not conflicts.
+	assert new_dict.update(Alice=27, on_conflict="raise") == []
+
+	evicted = new_dict.update([("Alice", 28), ("Fred", 30)])
+	assert evicted == [("Alice", 27), ("Bob", 30)]
+	assert dict(new_dict) == {"Alice": 28, "Dom": 23, "Eve": 31, "Fred": 30}
+	assert dict(new_dict.inverse) == {28: "Alice", 23: "Dom", 31: "Eve", 30: "Fred"}
+
+	skipped = new_dict.update({"Alice": 1, "Gina": 23, "Hal": 40}, on_conflict="keep")
+	assert skipped == [("Alice", 1), ("Gina", 23)]
+	assert new_dict["Alice"] == 28
+	assert new_dict.inverse[23] == "Dom"
+	assert new_dict["Hal"] == 40
+
+	# Within a batch, later pairs win.
+	assert new_dict.update([("Ida", 50), ("Jo", 50)]) == [("Ida", 50)]
+	assert new_dict.inverse[50] == "Jo"
+
+
+def test_bdict_update_in_order():
+	new_dict: bdict = bdict({1: "v5", 2: "v1"})
+
+	# The first pair evicts (1, "v5"), even though the second then replaces its value.
+	assert new_dict.update([(4, "v5"), (4, "v0")]) == [(1, "v5"), (4, "v5")]
+	assert dict(new_dict) == {2: "v1", 4: "v0"}
+	assert dict(new_dict.inverse) == {"v1": 2, "v0": 4}
+
+	# The second pair for the key conflicts with the first.
+	assert new_dict.update([(5, "v6"), (5, "v7")], on_conflict="keep") == [(5, "v7")]
+	assert new_dict[5] == "v6"
+
+	# Replacing a value earlier in the batch frees it for a later pair.
+	assert new_dict.update([(6, "v8"), (6, "v9"), (7, "v8")]) == [(6, "v8")]
+	assert dict(new_dict.inverse)["v8"] == 7
+
+
+@pytest.mark.parametrize(
+		"pairs, message",
+		[
+				pytest.param({"Alice": 1}, "The key 'Alice' is already present in the dictionary, with the value 27.", id="key"),
+				pytest.param({"Dom": 30}, "The value 30 is already present in the dictionary, with the key 'Bob'.", id="value"),
+				pytest.param([("Dom", 1), ("Eve", 1)], "The keys 'Dom' and 'Eve' have the same value 1.", id="batch"),
+				pytest.param(
+						[("Dom", 1), ("Dom", 2)],
+						"The key 'Dom' is given twice, with the values 1 and 2.",
+						id="batch_key",
+						),
+				]
+		)
+def test_bdict_update_raise(pairs, message: str):
+	new_dict: bdict = bdict(Alice=27, Bob=30)
+
+	with pytest.raises(ValueError, match=message):
+		new_dict.update(pairs, on_conflict="raise")
+
+	assert dict(new_dict) == {"Alice": 27, "Bob": 30}
+	assert dict(new_dict.inverse) == {27: "Alice", 30: "Bob"}
+
+
+def test_bdict_from_pairs():
+	new_dict = bdict.from_pairs(zip(["Alice", "Bob"], [27, 30]))
+	assert type(new_dict) is bdict
+	assert new_dict.inverse[30] == "Bob"
+
+	with pytest.raises(ValueError, match="The keys 'Alice' and 'Bob' have the same value 27."):
+		bdict.from_pairs([("Alice", 27), ("Bob", 27)])
+
+	assert bdict.from_pairs([("Alice", 27), ("Bob", 27)], on_conflict="keep") == {"Alice": 27}
+	assert bdict.from_pairs([("Alice", 27), ("Bob", 27)], on_conflict="overwrite") == {"Bob": 27}
 
-	assert new_dict_2[None] == 1
+	with pytest.raises(ValueError, match="Unexpected value for parameter `on_conflict`: replace"):
+		bdict.from_pairs([], on_conflict="replace")
@@ -0,0 +1,144 @@
+# stdlib
+import copy
+import pickle
+
+# 3rd party
+import pytest
+
+# this package
+from cawdrey import bmultidict, frozenbmultidict
+
+
+def test_add_and_discard():
+	tags: bmultidict = bmultidict([("python", "a.py"), ("python", "b.py"), ("rust", "a.rs")])
+
+	assert tags["python"] == frozenset({"a.py", "b.py"})
+	assert tags.inverse["a.py"] == frozenset({"python"})
+	assert len(tags) == 2
+	assert len(tags.inverse) == 3
+
+	tags.add("scripts", "a.py")
+	tags.add("scripts", "a.py")
+	assert tags.inverse["a.py"] == frozenset({"python", "scripts"})
+	assert tags.has("scripts", "a.py")
+	assert not tags.has("scripts", "b.py")
+
+	tags.discard("python", "a.py")
+	tags.discard("python", "missing.py")
+	assert tags["python"] == frozenset({"b.py"})
+	assert tags.inverse["a.py"] == frozenset({"scripts"})
+
+	tags.remove("rust", "a.rs")
+	assert "rust" not in tags
+	assert "a.rs" not in tags.inverse
+
+	with pytest.raises(KeyError):
+		tags.remove("rust", "a.rs")
+
+	assert sorted(tags.pairs()) == [("python", "b.py"), ("scripts", "a.py")]
+
+
+def test_bulk():
+	tags: bmultidict = bmultidict({"python": ["a.py", "b.py"], "docs": ["a.py"]})
+
+	tags.add_many([("docs", "b.py"), ("docs", "c.rst")])
+	assert tags["docs"] == frozenset({"a.py", "b.py", "c.rst"})
+	assert tags.inverse["b.py"] == frozenset({"python", "docs"})
+
+	tags.discard_many([("docs", "a.py"), ("docs", "b.py"), ("docs", "missing")])
+	assert tags["docs"] == frozenset({"c.rst"})
+	assert tags.inverse["a.py"] == frozenset({"python"})
+
+
+def test_mutable_mapping():
+	tags: bmultidict = bmultidict([("python", "a.py"), ("python", "b.py")])
+
+	tags["python"] = ["b.py", "c.py"]
+	assert tags["python"] == frozenset({"b.py", "c.py"})
+	assert "a.py" not in tags.inverse
+
+	del tags["python"]
+	assert not tags
+	assert not tags.inverse
+
+	with pytest.raises(KeyError):
+		del tags["python"]
+
+	tags.add("python", "a.py")
+	new = tags.copy()
+	new.add("python", "b.py")
+	assert tags["python"] == frozenset({"a.py"})
+
+	tags.clear()
+	assert not tags
+	assert new.inverse["a.py"] == frozenset({"python"})
+
+	for new in (pickle.loads(pickle.dumps(new)), copy.deepcopy(new)):
+		assert new["python"] == frozenset({"a.py", "b.py"})
+		assert new.inverse["b.py"] == frozenset({"python"})
+
+
+def test_snapshot():
+	tags: bmultidict = bmultidict([("python", "a.py"), ("python", "b.py"), ("rust", "a.rs")])
+	snapshot = tags.snapshot()
+
+	# The sets are shared until they are modified.
+	assert tags._fwd["rust"] is snapshot._fwd["rust"]
+
+	assert isinstance(snapshot, frozenbmultidict)
+	assert tags.snapshot() is snapshot
+	assert snapshot == tags
+	assert snapshot["python"] == frozenset({"a.py", "b.py"})
+	assert snapshot.inverse["a.rs"] == frozenset({"rust"})
+	assert snapshot.inverse.inverse is snapshot
+
+	tags.add("python", "c.py")
+	tags.discard("rust", "a.rs")
+	tags.add("docs", "a.py")
+
+	assert snapshot["python"] == frozenset({"a.py", "b.py"})
+	assert snapshot.inverse["a.rs"] == frozenset({"rust"})
+	assert snapshot.inverse["a.py"] == frozenset({"python"})
+	assert "docs" not in snapshot
+	assert tags["python"] == frozenset({"a.py", "b.py", "c.py"})
+	assert tags.inverse["a.py"] == frozenset({"python", "docs"})
+
+	new_snapshot = tags.snapshot()
+	assert new_snapshot is not snapshot
+	assert new_snapshot != snapshot
+	assert new_snapshot.has("docs", "a.py")
+	assert not snapshot.has("docs", "a.py")
+
+	# Taking another snapshot does not affect the first.
+	tags.add("docs", "b.py")
+	assert "docs" not in snapshot
+	assert new_snapshot["docs"] == frozenset({"a.py"})
+
+	tags.add_many([("docs", "c.py"), ("rust", "b.rs")])
+	tags.discard_many([("python", "b.py")])
+	assert new_snapshot["docs"] == frozenset({"a.py"})
+	assert new_snapshot["python"] == frozenset({"a.py", "b.py", "c.py"})
+	assert "rust" not in new_snapshot
+	assert tags["docs"] == frozenset({"a.py", "b.py", "c.py"})
+
+	thawed = snapshot.thaw()
+	assert type(thawed) is bmultidict
+	assert thawed == snapshot
+
+
+def test_frozenbmultidict():
+	frozen: frozenbmultidict = frozenbmultidict([("python", "a.py"), ("docs", "a.py")])
+
+	assert frozen.inverse["a.py"] == frozenset({"python", "docs"})
+	assert frozen == frozenbmultidict({"docs": ["a.py"], "python": ["a.py"]})
+	assert hash(frozen) == hash(frozenbmultidict({"docs": ["a.py"], "python": ["a.py"]}))
+	assert frozen == {"python": {"a.py"}, "docs": {"a.py"}}
+	assert frozen != frozenbmultidict([("python", "a.py")])
+	assert {frozen: 1}[frozen.thaw().snapshot()] == 1
+
+	new = pickle.loads(pickle.dumps(frozen))
+	assert type(new) is frozenbmultidict
+	assert new == frozen
+
+	with pytest.raises(TypeError, match="can only be initialised once"):
+		frozen.__init__()
@@ -1,11 +1,14 @@
 # stdlib
-from typing import Any, List, Tuple
+import copy
+import pickle
+import weakref
+from typing import Any, List, Tuple, Type
 
 # 3rd party
 import pytest
 
 # this package
-from cawdrey import frozendict
+from cawdrey import FastFrozenOrderedDict, FrozenBase, FrozenOrderedDict, fastfrozendict, frozendict
 
 ################################################################################
 # dict fixtures
@@ -68,37 +71,50 @@ math_dict = pytest.fixture(math_dict_raw)
 ################################################################################
 # frozendict fixtures
 
+# The tests run against both implementations, except those for frozendict's internals,
+# which are marked with ``frozendict_only``.
+
+
+@pytest.fixture(params=[frozendict, fastfrozendict], ids=lambda cls: cls.__name__)
+def frozendict_cls(request) -> Type[frozendict]:
+	return request.param
+
+
+frozendict_only = pytest.mark.parametrize("frozendict_cls", [frozendict], ids=["frozendict"])
+
 
 @pytest.fixture()
-def fd(fd_dict: dict) -> frozendict:
-	return frozendict(fd_dict)
+def fd(frozendict_cls: Type[frozendict], fd_dict: dict) -> frozendict:
+	return frozendict_cls(fd_dict)
 
 
 @pytest.fixture()
-def fd_unhashable() -> frozendict:
-	return frozendict({1: []})
+def fd_unhashable(frozendict_cls: Type[frozendict]) -> frozendict:
+	return frozendict_cls({1: []})
 
 
 @pytest.fixture()
-def fd_eq(fd_dict_eq: dict) -> frozendict:
-	return frozendict(fd_dict_eq)
+def fd_eq(frozendict_cls: Type[frozendict], fd_dict_eq: dict) -> frozendict:
+	return frozendict_cls(fd_dict_eq)
 
 
 def fd2_raw() -> frozendict:
 	return frozendict(fd_dict_2_raw())
 
 
-fd2 = pytest.fixture(fd2_raw)
+@pytest.fixture()
+def fd2(frozendict_cls: Type[frozendict]) -> frozendict:
+	return frozendict_cls(fd_dict_2_raw())
 
 
 @pytest.fixture()
-def fd_sub(fd_sub_dict: dict) -> frozendict:
-	return frozendict(fd_sub_dict)
+def fd_sub(frozendict_cls: Type[frozendict], fd_sub_dict: dict) -> frozendict:
+	return frozendict_cls(fd_sub_dict)
 
 
 @pytest.fixture()
-def fd_nested(fd_nested_dict: dict) -> frozendict:
-	return frozendict(fd_nested_dict)
+def fd_nested(frozendict_cls: Type[frozendict], fd_nested_dict: dict) -> frozendict:
+	return frozendict_cls(fd_nested_dict)
 
 
 def math_fd_raw() -> frozendict:
@@ -110,8 +126,8 @@ def math_items_raw() -> tuple:
 
 
 @pytest.fixture()
-def fd_giulia() -> frozendict:
-	return frozendict({"Marco": "Sulla", "Giulia": "Sulla"})
+def fd_giulia(frozendict_cls: Type[frozendict]) -> frozendict:
+	return frozendict_cls({"Marco": "Sulla", "Giulia": "Sulla"})
 
 
 @pytest.fixture()
@@ -120,13 +136,13 @@ def fd_items(fd_dict: dict) -> tuple:
 
 
 @pytest.fixture()
-def fd_empty() -> frozendict:
-	return frozendict()
+def fd_empty(frozendict_cls: Type[frozendict]) -> frozendict:
+	return frozendict_cls()
 
 
 @pytest.fixture()
-def fd_repr(fd_dict: dict) -> str:
-	return f"<{frozendict.__name__} {fd_dict!r}>"
+def fd_repr(frozendict_cls: Type[frozendict], fd_dict: dict) -> str:
+	return f"<{frozendict_cls.__name__} {fd_dict!r}>"
 
 
 ################################################################################
@@ -178,17 +194,63 @@ def test_equals_dict(fd: frozendict, fd_dict: dict):
 	assert fd == fd_dict
 
 
+def test_equals_shortcuts(fd: frozendict, fd_eq: frozendict, fd_giulia: frozendict):
+	assert fd == fd
+	assert fd == fd_eq
+	assert not fd != fd_eq
+
+	hash(fd)
+	hash(fd_giulia)
+	assert fd != fd_giulia
+	assert fd != type(fd)(fd, Bim="James May")
+	assert fd != {"Sulla": "Marco"}
+	assert fd != 5
+
+
 def test_hash(fd: frozendict, fd_eq: frozendict):
 	assert hash(fd)
 	assert hash(fd) == hash(fd_eq)
 
 
-def test_constructor_kwargs(fd2: frozendict, fd_dict_2: dict):
-	assert frozendict(**fd_dict_2) == fd2
+def test_hash_derived(fd: frozendict, fd2: frozendict):
+	hash(fd)
+	hash(fd2)
+
+	derived = [
+			fd + {"Sulla": "Silla", "Bim": "James May"},
+			fd.copy(Hicks="Bill"),
+			fd.copy(Hicks="Bob"),
+			fd - {"Sulla": "Marco"},
+			fd - ["Sulla"],
+			fd & fd2,
+			fd2.sorted(),
+			]
 
+	for new in derived:
+		assert new._hash is not None
+		assert new._hash == hash(type(fd)(dict(new)))
 
-def test_constructor_iterator(fd: frozendict, fd_items: tuple):
-	assert frozendict(fd_items) == fd
+
+def test_hash_derived_not_cached(fd: frozendict):
+	assert (fd + {"Bim": "James May"})._hash is None
+	assert (fd - ["Sulla"])._hash is None
+
+
+def test_hash_derived_unhashable(fd: frozendict):
+	hash(fd)
+	new = fd + {"Bim": []}
+	assert new._hash is None
+
+	with pytest.raises(TypeError):
+		hash(new)
+
+
+def test_constructor_kwargs(frozendict_cls: Type[frozendict], fd2: frozendict, fd_dict_2: dict):
+	assert frozendict_cls(**fd_dict_2) == fd2
+
+
+def test_constructor_iterator(frozendict_cls: Type[frozendict], fd: frozendict, fd_items: tuple):
+	assert frozendict_cls(fd_items) == fd
 
 
 def test_sorted_keys(fd2: frozendict, fd_dict_2: str):
@@ -197,6 +259,53 @@ def test_sorted_keys(fd2: frozendict, fd_dict_2: str):
 	assert fd_sorted is fd_sorted.sorted()
 
 
+def test_sorted_keys_cached(fd2: frozendict, fd_dict_2: str):
+	fd_sorted = fd2.sorted()
+	assert fd2._sorted_keys is fd_sorted._sorted_keys
+	assert fd_sorted.sorted() is fd_sorted
+
+	fd_reversed = fd2.sorted(reverse=True)
+	assert list(fd_reversed) == sorted(fd_dict_2, reverse=True)
+	assert fd_reversed.sorted(reverse=True) is fd_reversed
+
+
+@pytest.fixture()
+def fd_numbers(frozendict_cls: Type[frozendict]) -> frozendict:
+	return frozendict_cls({k: str(k) for k in (50, 10, 40, 20, 30)})
+
+
+def test_range(fd_numbers: frozendict):
+	assert list(fd_numbers.range(20, 40).items()) == [(20, "20"), (30, "30")]
+	assert list(fd_numbers.range(15, 45)) == [20, 30, 40]
+	assert list(fd_numbers.range(hi=30)) == [10, 20]
+	assert list(fd_numbers.range(lo=30)) == [30, 40, 50]
+	assert list(fd_numbers.range()) == [10, 20, 30, 40, 50]
+	assert fd_numbers.range(60, 70) == {}
+	assert type(fd_numbers.range()) is type(fd_numbers)
+
+
+def test_floor_ceiling(fd_numbers: frozendict):
+	assert fd_numbers.floor(30) == 30
+	assert fd_numbers.floor(35) == 30
+	assert fd_numbers.floor(100) == 50
+	assert fd_numbers.ceiling(30) == 30
+	assert fd_numbers.ceiling(35) == 40
+	assert fd_numbers.ceiling(0) == 10
+
+	with pytest.raises(KeyError):
+		fd_numbers.floor(5)
+
+	with pytest.raises(KeyError):
+		fd_numbers.ceiling(55)
+
+
+def test_bisect(fd_numbers: frozendict):
+	assert fd_numbers.bisect(5) == 0
+	assert fd_numbers.bisect(10) == 1
+	assert fd_numbers.bisect(35) == 3
+	assert fd_numbers.bisect(100) == 5
+
+
 def strange_sort(item: tuple) -> str:
 	return f"{item[0]}{item[1]}"
 
@@ -275,8 +384,18 @@ def test_items(fd: frozendict, fd_dict: dict):
 	assert tuple(fd.items()) == tuple(fd_dict.items())
 
 
-def test_fromkeys(fd_giulia: frozendict):
-	assert frozendict.fromkeys(["Marco", "Giulia"], "Sulla") == fd_giulia
+def test_views_are_native(fd: frozendict, fd_dict: dict):
+	assert type(fd.keys()) is type(fd_dict.keys())
+	assert type(fd.values()) is type(fd_dict.values())
+	assert type(fd.items()) is type(fd_dict.items())
+	assert fd.keys() & {"Sulla", "Bim"} == {"Sulla"}
+	assert not hasattr(fd.keys(), "add")
+
+
+def test_fromkeys(frozendict_cls: Type[frozendict], fd_giulia: frozendict):
+	new = frozendict_cls.fromkeys(["Marco", "Giulia"], "Sulla")
+	assert type(new) is frozendict_cls
+	assert new == fd_giulia
 
 
 def test_repr(fd: frozendict, fd_repr: str):
@@ -311,8 +430,9 @@ def test_iter(fd: frozendict):
 def test_add(fd: frozendict, add_end: dict):
 	newd = dict(fd)
 	newd.update(add_end)
-	newfrozen: frozendict = frozendict(newd)
+	newfrozen: frozendict = type(fd)(newd)
 	assert fd + add_end == newfrozen
+	assert type(fd + add_end) is type(fd)
 	fd += add_end
 	assert fd == newfrozen
 
@@ -327,8 +447,9 @@ def test_add(fd: frozendict, add_end: dict):
 		)
 def test_sub(fd: frozendict, subtract_end: dict):
 	newd = {k: v for k, v in fd.items() if (k, v) not in subtract_end}
-	newfrozen: frozendict = frozendict(newd)
+	newfrozen: frozendict = type(fd)(newd)
 	assert fd - subtract_end == newfrozen
+	assert type(fd - subtract_end) is type(fd)
 	fd -= subtract_end
 	assert fd == newfrozen
 
@@ -345,6 +466,192 @@ def test_bitwise_and(fd_eq: frozendict, other: Any):
 	assert fd_eq & other == {"Sulla": "Marco", "Hicks": "Bill"}
 
 
+def test_sub_iterables(frozendict_cls: Type[frozendict]):
+	fd = frozendict_cls(a=1, b=2, c=3, d=4)
+	expected = {'b': 2, 'd': 4}
+
+	assert fd - ['a', 'c'] == expected
+	assert fd - {'a', 'c'} == expected
+	assert fd - (k for k in "ac") == expected
+	assert fd - ['a', ['unhashable'], 'c'] == expected
+	assert fd - "ac" == expected
+
+
+def test_sub_large_other(frozendict_cls: Type[frozendict]):
+	fd = frozendict_cls(a=1, b=2)
+	other = {str(i): i for i in range(100)}
+	other['a'] = 1
+	other['b'] = 3
+
+	assert fd - other == {'b': 2}
+	assert fd - frozendict_cls(other) == {'b': 2}
+	assert fd == {'a': 1, 'b': 2}
+
+
+def test_and_order(frozendict_cls: Type[frozendict]):
+	fd = frozendict_cls(a=1, b=2, c=3)
+	assert list(fd & ['c', 'a', 'z']) == ['c', 'a']
+	assert list(fd & {'c': 3, 'a': 1, 'b': 0}) == ['c', 'a']
+	assert list(fd & frozendict_cls(c=3, a=1)) == ['c', 'a']
+
+
+def test_union_many(frozendict_cls: Type[frozendict]):
+	a, b, c = frozendict_cls(x=1, y=2), {'y': 3, 'z': 4}, frozendict_cls(z=5)
+
+	result = frozendict_cls.union_many(a, b, c)
+	assert result == a + b + c == {'x': 1, 'y': 3, 'z': 5}
+	assert type(result) is frozendict_cls
+	assert frozendict_cls.union_many() == {}
+	assert type(SmallFrozendict.union_many(a)) is SmallFrozendict
+
+
+def test_difference_many(frozendict_cls: Type[frozendict]):
+	base = frozendict_cls({str(i): i for i in range(10)})
+	others = ({'0': 0, '1': -1}, ['2', '3'], frozendict_cls({str(i): i for i in range(5, 50)}), (k for k in "4"))
+
+	result = frozendict_cls.difference_many(base, *others)
+	assert result == {'1': 1}
+	assert result == base - others[0] - others[1] - others[2] - ['4']
+	assert frozendict_cls.difference_many(base) == base
+	assert base == {str(i): i for i in range(10)}
+
+
+def test_slots(fd: frozendict):
+	assert not hasattr(fd, "__dict__")
+
+	with pytest.raises(TypeError):
+		weakref.ref(fd)
+
+
+class SmallFrozendict(frozendict):
+	small_map_threshold = 8
+
+
+@pytest.fixture()
+def fd_small(fd_dict: dict) -> SmallFrozendict:
+	return SmallFrozendict(fd_dict)
+
+
+def test_small_map(fd: frozendict, fd_small: SmallFrozendict, fd_dict: dict):
+	assert isinstance(fd._dict, dict)
+	assert not isinstance(fd_small._dict, dict)
+	assert isinstance(SmallFrozendict({i: i for i in range(9)})._dict, dict)
+
+	assert fd_small == fd
+	assert fd == fd_small
+	assert fd_small == fd_dict
+	assert hash(fd) == hash(fd_small)
+	assert repr(fd_small) == f"<SmallFrozendict {fd_dict!r}>"
+	assert dict(fd_small) == fd_dict
+	assert fd_small.keys() & {"Sulla", "Bim"} == {"Sulla"}
+	assert list(fd_small.items()) == list(fd_dict.items())
+	assert SmallFrozendict(fd_small)._dict is fd_small._dict
+
+
+def test_small_map_derived(fd_small: SmallFrozendict, fd_dict: dict):
+	assert fd_small + {"Bim": "James May"} == dict(fd_dict, Bim="James May")
+	assert fd_small - ["Sulla"] == {k: v for k, v in fd_dict.items() if k != "Sulla"}
+	assert fd_small & ["Sulla"] == {"Sulla": "Marco"}
+
+	evolver = fd_small.evolver()
+	evolver["Bim"] = "James May"
+	assert evolver.persistent() == dict(fd_dict, Bim="James May")
+	assert fd_small == fd_dict
+
+
+def test_small_map_value_equals_key():
+	fd = SmallFrozendict({1: 'a', 'a': 1, 'b': 'a'})
+
+	assert fd['a'] == 1
+	assert fd[1] == 'a'
+	assert 'b' in fd
+	assert "Bim" not in fd
+	assert fd.get("Bim") is None
+	assert list(fd) == [1, 'a', 'b']
+	assert list(fd.values()) == ['a', 1, 'a']
+
+	fd = SmallFrozendict({'a': 'b', 'b': 'b'})
+	assert fd['b'] == 'b'
+	assert 'c' not in fd
+	assert SmallFrozendict({'a': 'b'}).get('b') is None
+
+	with pytest.raises(KeyError, match="Bim"):
+		fd["Bim"]  # pylint: disable=pointless-statement
+
+	with pytest.raises(KeyError, match="'b'"):
+		SmallFrozendict({'a': 'b'})['b']  # pylint: disable=pointless-statement
+
+
+def test_small_map_unhashable_key(fd: frozendict, fd_small: SmallFrozendict):
+	# Unhashable keys are rejected, as they are for a dict, rather than reported as missing.
+	for mapping in (fd, fd_small):
+		with pytest.raises(TypeError, match="unhashable type"):
+			[] in mapping  # pylint: disable=pointless-statement
+
+		with pytest.raises(TypeError, match="unhashable type"):
+			mapping[[]]  # pylint: disable=pointless-statement
+
+		with pytest.raises(TypeError, match="unhashable type"):
+			mapping.get([])
+
+	assert fd_small - ["Sulla", ["unhashable"]] == fd - ["Sulla", ["unhashable"]]
+
+
+@pytest.mark.parametrize("protocol", range(pickle.HIGHEST_PROTOCOL + 1))
+def test_small_map_pickle(fd_small: SmallFrozendict, protocol: int):
+	new = pickle.loads(pickle.dumps(fd_small, protocol))
+	assert new == fd_small
+	assert type(new._dict) is type(fd_small._dict)
+
+
+def test_adopt(fd_dict: dict):
+	new = frozendict.adopt(fd_dict)
+	assert new._dict is fd_dict
+	assert new == fd_dict
+
+
+@frozendict_only
+def test_constructor_shares_dict(fd: frozendict):
+	hash(fd)
+	new = frozendict(fd)
+	assert new._dict is fd._dict
+	assert new._hash == fd._hash
+
+	assert frozendict(fd, Bim="James May")._dict is not fd._dict
+
+
+def test_evolver(fd: frozendict, fd_dict: dict):
+	evolver = fd.evolver()
+	assert evolver.persistent() is fd
+
+	evolver["Bim"] = "James May"
+	del evolver["Sulla"]
+	evolver.update({"Hicks": "Bob"}, Giulia="Sulla")
+
+	assert "Bim" in evolver
+	assert len(evolver) == len(fd_dict) + 1
+
+	new = evolver.persistent()
+	assert type(new) is type(fd)
+	assert new is evolver.persistent()
+
+	expected = dict(fd_dict)
+	expected["Bim"] = "James May"
+	del expected["Sulla"]
+	expected.update({"Hicks": "Bob"}, Giulia="Sulla")
+	assert new == expected
+	assert fd == fd_dict
+
+	# Changes after persistent() don't affect the frozen result
+	evolver["Sulla"] = "Marco"
+	assert "Sulla" not in new
+	assert evolver.persistent() == fd + {"Bim": "James May", "Hicks": "Bob", "Giulia": "Sulla"}
+
+	evolver.clear()
+	assert evolver.persistent() == {}
+	assert new == expected
+
+
 ################################################################################
 # immutability tests
 
@@ -384,13 +691,223 @@ def test_update(fd: frozendict):
 		fd.update({"Bim": "James May"})  # type: ignore[attr-defined]
 
 
-def test_init(fd: frozendict):
+def test_init(fd: frozendict, fd_dict: dict):
 	with pytest.raises(TypeError):
 		fd.__init__({"Trump": "Donald"})  # type: ignore[misc]
 
+	assert fd == fd_dict
+
 
 def test_delvar(fd: frozendict):
 	del fd
 
 	with pytest.raises(NameError):
 		fd  # pylint: disable=pointless-statement
+
+
+def test_getmany(fd: frozendict):
+	assert fd.getmany(["Sulla", "Hicks", "missing"]) == ["Marco", "Bill", None]
+	assert fd.getmany(["missing"], default=0) == [0]
+	assert fd.getmany(iter(["Hicks"])) == ["Bill"]
+	assert fd.getmany([]) == []
+
+
+def test_contains_many(fd: frozendict):
+	assert fd.contains_many(["Sulla", "missing", "Hicks"]) == [True, False, True]
+	assert fd.contains_many(k for k in ()) == []
+
+
+def test_pick(fd: frozendict):
+	picked = fd.pick(["Hicks", "missing", "Sulla"])
+
+	assert type(picked) is type(fd)
+	assert picked == {"Hicks": "Bill", "Sulla": "Marco"}
+	assert list(picked) == ["Hicks", "Sulla"]
+	assert fd.pick([]) == {}
+
+
+def test_pick_evolver(fd: frozendict):
+	evolver = fd.evolver()
+	evolver["new"] = 1
+
+	picked = evolver.pick(["new", "Sulla"])
+	assert type(picked) is type(fd)
+	assert picked == {"new": 1, "Sulla": "Marco"}
+	assert evolver.getmany(["new", "missing"]) == [1, None]
+	assert evolver.contains_many(["new", "missing"]) == [True, False]
+
+
+@pytest.mark.parametrize("protocol", range(pickle.HIGHEST_PROTOCOL + 1))
+def test_pickle(fd: frozendict, protocol: int):
+	hash(fd)
+
+	new = pickle.loads(pickle.dumps(fd, protocol))
+	assert type(new) is type(fd)
+	assert new == fd
+	assert list(new) == list(fd)
+	assert new._hash is None
+	assert hash(new) == hash(fd)
+
+
+class AnnotatedFrozendict(frozendict):
+	pass
+
+
+class SlottedFrozendict(frozendict):
+	__slots__ = ("label", "__private")
+
+	def set_private(self, value: Any) -> None:
+		self.__private = value
+
+	def get_private(self) -> Any:
+		return self.__private
+
+
+@pytest.mark.parametrize("protocol", range(pickle.HIGHEST_PROTOCOL + 1))
+def test_pickle_subclass_state(protocol: int):
+	annotated = AnnotatedFrozendict(a=1)
+	annotated.source = "config.toml"
+
+	new = pickle.loads(pickle.dumps(annotated, protocol))
+	assert type(new) is AnnotatedFrozendict
+	assert new == annotated
+	assert new.source == "config.toml"
+
+	slotted = SlottedFrozendict(a=1)
+	slotted.label = "defaults"
+	slotted.set_private([1, 2])
+
+	new = pickle.loads(pickle.dumps(slotted, protocol))
+	assert new == slotted
+	assert new.label == "defaults"
+	assert new.get_private() == [1, 2]
+
+	unset = pickle.loads(pickle.dumps(SlottedFrozendict(a=1), protocol))
+	assert not hasattr(unset, "label")
+
+	# Instances without state use the compact form.
+	assert len(frozendict(a=1).__reduce__()) == 2
+	assert len(AnnotatedFrozendict(a=1).__reduce__()) == 2
+
+
+def test_copy(fd: frozendict):
+	assert copy.copy(fd) is fd
+
+
+def test_deepcopy(frozendict_cls: Type[frozendict]):
+	atomic = frozendict_cls(a=1, b="two", c=None, d=(1, 2), e=frozendict_cls(f=3.0))
+	# Tuples and frozendicts of immutable values are immutable too.
+	assert copy.deepcopy(atomic) is atomic
+
+	inner: List[int] = []
+	mutable = frozendict_cls(a=1, b=inner, c=frozendict_cls(d=inner))
+	new = copy.deepcopy(mutable)
+
+	assert type(new) is frozendict_cls
+	assert new == mutable
+	assert new['b'] is not inner
+	assert new['c'] is not mutable['c']
+	assert new['c']['d'] is new['b']
+	assert new['a'] is mutable['a']
+
+
+def test_deepcopy_subclass_state():
+	tags: List[str] = []
+
+	annotated = AnnotatedFrozendict(a=1)
+	annotated.tags = tags
+	new = copy.deepcopy(annotated)
+
+	assert type(new) is AnnotatedFrozendict
+	assert new is not annotated
+	assert new == annotated
+	assert new.tags == tags
+	assert new.tags is not tags
+
+	slotted = SlottedFrozendict(a=[])
+	slotted.label = "defaults"
+	slotted.set_private(tags)
+	new = copy.deepcopy(slotted)
+
+	assert new == slotted
+	assert new.label == "defaults"
+	assert new.get_private() is not tags
+
+	# Without any state, immutable contents are still shared.
+	plain = AnnotatedFrozendict(a=1)
+	assert copy.deepcopy(plain) is plain
+
+
+def test_adopt_small_map(fd_small: SmallFrozendict):
+	new = SmallFrozendict.adopt(dict(fd_small))
+	assert type(new._dict) is type(fd_small._dict)
+	assert SmallFrozendict.adopt(new._dict)._dict is new._dict
+
+
+def test_proxy(fd: frozendict, fd_dict: dict):
+	proxy = fd.proxy()
+
+	assert proxy == fd_dict
+	assert "Sulla" in proxy
+	assert len(proxy) == len(fd)
+	assert list(proxy) == list(fd)
+	assert proxy["Sulla"] == fd["Sulla"]
+
+	with pytest.raises(TypeError):
+		proxy["Sulla"] = "Silla"  # type: ignore[index]
+
+	assert fd == fd_dict
+
+
+def test_empty_not_small_map():
+	assert type(frozendict()._dict) is dict
+	assert type(frozendict.adopt({})._dict) is dict
+	assert type(SmallFrozendict()._dict) is dict
+	assert type(SmallFrozendict.adopt({})._dict) is dict
+
+	proxy = frozendict().proxy()
+	assert proxy == {}
+	assert type(proxy.copy()) is dict
+
+
+def test_proxy_small_map(fd_small: SmallFrozendict):
+	assert fd_small.proxy() == fd_small
+
+
+################################################################################
+# fastfrozendict
+
+
+def test_fastfrozendict_is_dict(fd_dict: dict):
+	fd = fastfrozendict(fd_dict)
+
+	assert isinstance(fd, dict)
+	assert type(fd.keys()) is type(fd_dict.keys())
+	assert isinstance(fd, FrozenBase)
+	assert isinstance(FastFrozenOrderedDict(fd_dict), FrozenOrderedDict)
+
+
+def test_fastfrozendict_interop(fd_dict: dict):
+	fast, slow = fastfrozendict(fd_dict), frozendict(fd_dict)
+
+	assert fast == slow
+	assert slow == fast
+	assert hash(fast) == hash(slow)
+	assert {slow: 1}[fast] == 1
+
+
+def test_fastfrozendict_or(fd_dict: dict):
+	fd = fastfrozendict(fd_dict)
+
+	new = fd | {5: 7}
+	assert type(new) is fastfrozendict
+	assert new[5] == 7
+
+	new = {5: 7} | fd
+	assert type(new) is fastfrozendict
+	assert list(new)[0] == 5
+
+	original = fd
+	fd |= {5: 7}
+	assert 5 not in original
+	assert fd[5] == 7
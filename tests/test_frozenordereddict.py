@@ -1,11 +1,13 @@
 # stdlib
+import copy
+import pickle
 from collections import OrderedDict
 
 # 3rd party
 import pytest
 
 # this package
-from cawdrey import FrozenOrderedDict
+from cawdrey import AlphaDict, FrozenOrderedDict
 
 ITEMS_1 = (
 		('b', 2),
@@ -79,3 +81,205 @@ def test_copy_kwargs():
 
 	assert id(fod1) != id(fod2)
 	assert dict(**fod1, **ODICT_2) == fod2
+
+
+def test_copy_hash():
+	fod1: FrozenOrderedDict[str, int] = FrozenOrderedDict(ITEMS_1)
+	hash(fod1)
+
+	fod2 = fod1.copy(a=5, e=6)
+	assert fod2._hash is not None
+	assert fod2._hash == hash(FrozenOrderedDict(fod2.items()))
+
+
+def test_evolver():
+	fod1: FrozenOrderedDict[str, int] = FrozenOrderedDict(ITEMS_1)
+	evolver = fod1.evolver()
+	evolver.update(ITEMS_2)
+	del evolver['b']
+
+	fod2 = evolver.persistent()
+	assert isinstance(fod2, FrozenOrderedDict)
+	assert type(fod2._dict) is dict
+	assert list(fod2.items()) == [('a', 1), ('d', 4), ('c', 3)]
+	assert list(fod1.items()) == list(ITEMS_1)
+
+
+def test_alphadict_evolver():
+	ad1: AlphaDict[str, int] = AlphaDict(ITEMS_1)
+	evolver = ad1.evolver()
+	evolver.update(ITEMS_2)
+
+	ad2 = evolver.persistent()
+	assert isinstance(ad2, AlphaDict)
+	assert list(ad2) == ['a', 'b', 'c', 'd']
+
+
+def test_adopt():
+	d = dict(ITEMS_1)
+	fod = FrozenOrderedDict.adopt(d)
+	assert fod._dict is d
+	assert FrozenOrderedDict(fod)._dict is d
+
+	fod = FrozenOrderedDict.adopt(ODICT_1)
+	assert type(fod._dict) is dict
+	assert list(ITEMS_1) == list(fod.items())
+
+
+def test_alphadict_adopt():
+	already_sorted = dict(sorted(ITEMS_1 + ITEMS_2))
+	ad = AlphaDict.adopt(already_sorted)
+	assert ad._dict is already_sorted
+	assert AlphaDict(ad)._dict is already_sorted
+
+	ad = AlphaDict.adopt(dict(ODICT_1))
+	assert list(ad) == ['a', 'b']
+
+	ad = AlphaDict.adopt(OrderedDict(sorted(ITEMS_1)))
+	assert type(ad._dict) is dict
+	assert list(ad) == ['a', 'b']
+
+
+def test_equality_ignores_order():
+	fod1: FrozenOrderedDict[str, int] = FrozenOrderedDict(ITEMS_1)
+	fod2: FrozenOrderedDict[str, int] = FrozenOrderedDict(reversed(ITEMS_1))
+
+	assert fod1 == fod2
+	assert fod1 == OrderedDict(reversed(ITEMS_1))
+	assert fod1 == dict(ITEMS_1)
+	assert fod1 != FrozenOrderedDict(ITEMS_2)
+
+
+@pytest.mark.parametrize("protocol", range(pickle.HIGHEST_PROTOCOL + 1))
+def test_pickle(protocol: int):
+	fod = FrozenOrderedDict([('b', 1), ('a', [2])])
+	new = pickle.loads(pickle.dumps(fod, protocol))
+	assert type(new) is FrozenOrderedDict
+	assert list(new.items()) == [('b', 1), ('a', [2])]
+
+	alpha = AlphaDict(b=1, a=2)
+	new = pickle.loads(pickle.dumps(alpha, protocol))
+	assert type(new) is AlphaDict
+	assert list(new) == ['a', 'b']
+
+
+def test_unpickle_unsorted_alphadict():
+	# Even if the pickled order is wrong, the keys are sorted.
+	alpha = AlphaDict.adopt(OrderedDict([('b', 1), ('a', 2)]))
+	assert list(alpha) == ['a', 'b']
+
+
+def test_copy():
+	fod = FrozenOrderedDict([('b', 1), ('a', [2])])
+	assert copy.copy(fod) is fod
+
+	new = copy.deepcopy(fod)
+	assert type(new) is FrozenOrderedDict
+	assert list(new.items()) == [('b', 1), ('a', [2])]
+	assert new['a'] is not fod['a']
+
+	alpha = AlphaDict(b=1, a=2)
+	assert copy.deepcopy(alpha) is alpha
+
+
+def test_alphadict_seq_and_kwargs():
+	alpha = AlphaDict([('c', 1), ('a', 2)], b=3, c=4)
+	assert list(alpha.items()) == [('a', 2), ('b', 3), ('c', 4)]
+
+	assert list(AlphaDict({'b': 1, 'a': 2})) == ['a', 'b']
+	assert list(AlphaDict([('b', 1), ('a', 2), ('b', 3)]).items()) == [('a', 2), ('b', 3)]
+	assert AlphaDict([]) == AlphaDict() == {}
+
+	with pytest.raises(TypeError, match="can only be initialised once"):
+		alpha.__init__()
+
+
+def test_alphadict_merge():
+	alpha = AlphaDict(b=1, d=2, f=3)
+	assert hash(alpha)
+
+	merged = alpha.merge({'e': 4, 'a': 5, 'd': 6}, g=7)
+	assert type(merged) is AlphaDict
+	assert list(merged.items()) == [('a', 5), ('b', 1), ('d', 6), ('e', 4), ('f', 3), ('g', 7)]
+	assert merged._hash == hash(AlphaDict(merged.items()))
+	assert list(alpha.items()) == [('b', 1), ('d', 2), ('f', 3)]
+
+	# Only values change.
+	assert list(alpha.merge([('d', 0)]).items()) == [('b', 1), ('d', 0), ('f', 3)]
+
+	# New keys after the existing ones.
+	assert list(alpha.merge(AlphaDict(h=0, g=1))) == ['b', 'd', 'f', 'g', 'h']
+
+	assert alpha.merge() is alpha
+	assert alpha.merge({}) is alpha
+	assert list(AlphaDict().merge(b=1, a=2)) == ['a', 'b']
+
+
+def test_alphadict_copy():
+	alpha = AlphaDict(b=1, d=2)
+	new = alpha.copy({'c': 3}, a=4)
+	assert type(new) is AlphaDict
+	assert list(new.items()) == [('a', 4), ('b', 1), ('c', 3), ('d', 2)]
+	assert alpha.copy() == alpha
+
+
+def test_alphadict_ordered_lookups():
+	alpha = AlphaDict.fromkeys(["apple", "apricot", "banana", "blueberry", "cherry", "date"], 0)
+
+	assert alpha.index("apple") == 0
+	assert alpha.index("cherry") == 4
+
+	with pytest.raises(KeyError, match="'coconut'"):
+		alpha.index("coconut")
+
+	with pytest.raises(KeyError, match="'zucchini'"):
+		alpha.index("zucchini")
+
+	assert list(alpha.islice(1, 3)) == ["apricot", "banana"]
+	assert list(alpha.islice(-2)) == ["cherry", "date"]
+	assert list(alpha.islice()) == list(alpha)
+
+	assert list(alpha.irange("apricot", "blueberry")) == ["apricot", "banana", "blueberry"]
+	assert list(alpha.irange("apricot", "blueberry", inclusive=(False, False))) == ["banana"]
+	assert list(alpha.irange("b")) == ["banana", "blueberry", "cherry", "date"]
+	assert list(alpha.irange(maximum="b")) == ["apple", "apricot"]
+	assert list(alpha.irange("c", "b")) == []
+
+	assert list(alpha.prefix("ap")) == ["apple", "apricot"]
+	assert list(alpha.prefix("b")) == ["banana", "blueberry"]
+	assert list(alpha.prefix("date")) == ["date"]
+	assert list(alpha.prefix("e")) == []
+	assert list(alpha.prefix('')) == list(alpha)
+
+	# The key list is shared by dictionaries which share the backing dict.
+	assert AlphaDict(alpha)._keys is alpha._keys
+
+
+def test_alphadict_prefix_edge_cases():
+	alpha = AlphaDict.fromkeys(['a', "a\U0010ffff", "a\U0010ffffb", 'b'])
+	assert list(alpha.prefix("a\U0010ffff")) == ["a\U0010ffff", "a\U0010ffffb"]
+	assert list(alpha.prefix("\U0010ffff")) == []
+
+	alpha = AlphaDict.fromkeys([b"a", b"a\xff", b"a\xff\x01", b"b"])
+	assert list(alpha.prefix(b"a\xff")) == [b"a\xff", b"a\xff\x01"]
+	assert list(alpha.prefix(b"a")) == [b"a", b"a\xff", b"a\xff\x01"]
+	assert list(alpha.prefix(b"")) == list(alpha)
+
+
+def test_ordereddict_semantics():
+	fod = FrozenOrderedDict(ODICT_1)
+	assert type(fod._dict) is dict
+	assert list(fod) == ['b', 'a']
+
+	# Comparisons with OrderedDicts are still unaffected by order, in either direction.
+	assert fod == OrderedDict(reversed(ITEMS_1))
+	assert OrderedDict(reversed(ITEMS_1)) == fod
+	assert fod == FrozenOrderedDict(reversed(ITEMS_1))
+
+	class OrderedDictBacked(FrozenOrderedDict):
+		dict_cls = OrderedDict
+
+	fod = OrderedDictBacked(ITEMS_1)
+	assert type(fod._dict) is OrderedDict
+	assert type(fod.copy(c=3)._dict) is OrderedDict
+	assert fod == FrozenOrderedDict(reversed(ITEMS_1))
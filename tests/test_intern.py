@@ -0,0 +1,89 @@
+# stdlib
+import gc
+
+# 3rd party
+import pytest
+
+# this package
+from cawdrey import FrozenOrderedDict, InternedFrozenDict, InternedFrozenOrderedDict, frozendict
+from cawdrey.intern import InternPool, InternStats
+
+
+@pytest.fixture(autouse=True)
+def clear_pools():
+	# The pools are shared by every test using these classes, which may run in any order.
+	gc.collect()
+	InternedFrozenDict.intern_pool().clear()
+	InternedFrozenOrderedDict.intern_pool().clear()
+
+
+def test_intern():
+	a = InternedFrozenDict.intern({"Sulla": "Marco", "Hicks": "Bill"})
+	b = InternedFrozenDict.intern(Sulla="Marco", Hicks="Bill")
+	c = InternedFrozenDict.intern(a)
+	d = InternedFrozenDict.intern({"Sulla": "Marco"})
+
+	assert a is b
+	assert a is c
+	assert d is not a
+	assert isinstance(a, InternedFrozenDict)
+
+	stats = InternedFrozenDict.intern_pool().stats()
+	assert stats == InternStats(size=2, hits=2, misses=2, evictions=0)
+	assert stats.hit_rate == 0.5
+
+
+def test_intern_eviction():
+	pool = InternPool()
+
+	a = pool.intern(InternedFrozenDict(a=1))
+	assert pool.intern(InternedFrozenDict(a=1)) is a
+	assert len(pool) == 1
+
+	del a
+	gc.collect()
+
+	assert len(pool) == 0
+	assert pool.stats() == InternStats(size=0, hits=1, misses=1, evictions=1)
+
+	pool.clear()
+	assert pool.stats() == InternStats(size=0, hits=0, misses=0, evictions=0)
+	assert pool.stats().hit_rate == 0.0
+
+
+def test_intern_pool_per_class():
+	assert frozendict.intern_pool() is frozendict.intern_pool()
+	assert frozendict.intern_pool() is not FrozenOrderedDict.intern_pool()
+	assert frozendict.intern_pool() is not InternedFrozenDict.intern_pool()
+
+
+def test_intern_order():
+	a = InternedFrozenOrderedDict.intern(a=1, b=2)
+	b = InternedFrozenOrderedDict.intern(b=2, a=1)
+	assert a == b
+	assert a is not b
+	assert list(b) == ['b', 'a']
+	assert InternedFrozenOrderedDict.intern(a=1, b=2) is a
+
+	c = InternedFrozenDict.intern(b=2, a=1)
+	assert InternedFrozenDict.intern(a=1, b=2) is not c
+	assert list(InternedFrozenDict.intern(b=2, a=1)) == ['b', 'a']
+
+
+def test_intern_pool_type():
+	pool = InternPool()
+
+	a = pool.intern(InternedFrozenDict(a=1))
+	b = pool.intern(InternedFrozenOrderedDict(a=1))
+	assert a is not b
+	assert type(b) is InternedFrozenOrderedDict
+
+
+def test_intern_requires_weakref():
+	with pytest.raises(TypeError, match="does not support weak references"):
+		frozendict.intern(a=1)
+
+
+def test_intern_unhashable():
+	with pytest.raises(TypeError):
+		InternedFrozenDict.intern({1: []})
@@ -0,0 +1,177 @@
+# stdlib
+import os
+import struct
+
+# 3rd party
+import pytest
+from domdf_python_tools.paths import PathPlus
+
+# this package
+from cawdrey.level_dict import LevelDict, LogFile, TypedLevelDict
+
+
+class IntDict(TypedLevelDict[str, int]):
+	key_type = str
+	value_type = int
+
+
+@pytest.fixture()
+def path(tmp_pathplus: PathPlus) -> PathPlus:
+	return tmp_pathplus / "test_dict.ld"
+
+
+def test_mapping(path: PathPlus):
+	with LevelDict(path) as data:
+		data["cat"] = "100"
+		data["dog"] = {"a": [1, 2.5, None]}
+		data["cat"] = "200"
+		data["fish"] = 1
+		del data["fish"]
+
+		assert data["cat"] == "200"
+		assert data["dog"] == {"a": [1, 2.5, None]}
+		assert "cat" in data
+		assert "fish" not in data
+		assert list(data) == ["cat", "dog"]
+		assert len(data) == 2
+		assert data.get("fish") is None
+
+		with pytest.raises(KeyError, match="fish"):
+			data["fish"]  # pylint: disable=pointless-statement
+
+		with pytest.raises(KeyError, match="fish"):
+			del data["fish"]
+
+	with LevelDict(path) as data:
+		assert dict(data) == {"cat": "200", "dog": {"a": [1, 2.5, None]}}
+		assert list(data) == ["cat", "dog"]
+
+
+def test_buffering(path: PathPlus):
+	data = LevelDict(path, buffer_size=100)
+	size = path.stat().st_size
+
+	data["key"] = "value"
+	assert path.stat().st_size == size
+	assert data["key"] == "value"
+
+	data.flush()
+	assert path.stat().st_size > size
+	assert data["key"] == "value"
+
+	for i in range(20):
+		data[f"key{i}"] = str(i)
+
+	assert path.stat().st_size > size + 100
+	assert data["key19"] == "19"
+
+	data.db.close()
+	assert LevelDict(path)["key19"] == "19"
+
+
+def test_closed_on_garbage_collection(path: PathPlus):
+	data = LevelDict(path)
+	data["key"] = "value"
+	del data
+
+	assert LevelDict(path)["key"] == "value"
+
+
+def test_compact(path: PathPlus):
+	with LevelDict(path) as data:
+		for i in range(100):
+			data["key"] = str(i)
+		data["other"] = "value"
+		data["deleted"] = "value"
+		del data["deleted"]
+
+		data.flush()
+		size = path.stat().st_size
+		data.compact()
+
+		assert path.stat().st_size < size
+		assert dict(data) == {"key": "99", "other": "value"}
+
+		data["new"] = "value"
+
+	with LevelDict(path) as data:
+		assert dict(data) == {"key": "99", "other": "value", "new": "value"}
+
+
+def test_compact_stale_tmp_file(path: PathPlus):
+	with LevelDict(path.parent / "stale.db") as stale:
+		stale["ghost"] = "boo"
+
+	(path.parent / "stale.db").rename(f"{path}.{os.getpid()}.tmp")
+
+	with LevelDict(path) as data:
+		data["key"] = "value"
+		data.compact()
+		assert dict(data) == {"key": "value"}
+
+	with LevelDict(path) as data:
+		assert dict(data) == {"key": "value"}
+
+
+def test_truncated_record(path: PathPlus):
+	with LevelDict(path) as data:
+		data["a"] = '1'
+		data["b"] = '2'
+
+	path.write_bytes(path.read_bytes()[:-1])
+
+	with LevelDict(path) as data:
+		assert dict(data) == {"a": '1'}
+		data["c"] = '3'
+
+	with LevelDict(path) as data:
+		assert dict(data) == {"a": '1', "c": '3'}
+
+
+def test_invalid_file(path: PathPlus):
+	path.write_text("not a log")
+
+	with pytest.raises(ValueError, match="is not a LogFile"):
+		LevelDict(path)
+
+
+def test_typed(path: PathPlus):
+	with IntDict(path) as data:
+		data["cat"] = 100
+		assert data["cat"] == 100
+
+		with pytest.raises(TypeError, match="Values must be of type 'int', not 'str'"):
+			data["dog"] = "100"  # type: ignore[assignment]
+
+		with pytest.raises(TypeError, match="Keys must be of type 'str', not 'int'"):
+			data[1] = 100  # type: ignore[index]
+
+		assert "dog" not in data
+
+	with IntDict(path) as data:
+		assert dict(data) == {"cat": 100}
+
+
+def test_unknown_codec(path: PathPlus):
+
+	class ComplexDict(TypedLevelDict[str, complex]):
+		key_type = str
+		value_type = complex
+
+	with pytest.raises(TypeError, match="No codec registered for 'complex'"):
+		ComplexDict(path)
+
+
+def test_log_file(path: PathPlus):
+	log = LogFile(path)
+	offset = log.append(1, b"key", b"value")
+	assert log.read(offset, 5) == b"value"
+	log.close()
+	assert log.closed
+	log.close()
+
+	log = LogFile(path)
+	assert list(log.records()) == [(1, b"key", offset, 5)]
+	assert log.read(offset, 5) == b"value"
+	assert struct.calcsize("<BII") + 3 + 5 + 8 == path.stat().st_size
+	log.close()
@@ -0,0 +1,149 @@
+# stdlib
+import copy
+import pickle
+from typing import Dict
+
+# 3rd party
+import pytest
+from domdf_python_tools.paths import PathPlus
+
+# this package
+from cawdrey import FrozenBase, MappedFrozenDict, PersistentFrozenDict, frozendict
+
+
+@pytest.fixture()
+def md_dict() -> Dict[str, str]:
+	d = {f"key{i}": f"value{i}" for i in range(1000)}
+	d["ünïcödé"] = "välüé"
+	d[''] = ''
+	return d
+
+
+@pytest.fixture()
+def md(md_dict: Dict[str, str], tmp_pathplus: PathPlus):
+	frozendict(md_dict).dump(tmp_pathplus / "table.cawdrey")
+
+	with MappedFrozenDict.open(tmp_pathplus / "table.cawdrey") as md:
+		yield md
+
+
+def test_mapping(md: MappedFrozenDict, md_dict: Dict[str, str]):
+	assert isinstance(md, FrozenBase)
+	assert len(md) == len(md_dict)
+	assert md == md_dict
+	assert md_dict == md
+	assert dict(md) == md_dict
+	assert list(md) == list(md_dict)
+	assert list(md.items()) == list(md_dict.items())
+	assert list(md.values()) == list(md_dict.values())
+	assert md.keys() == md_dict.keys()
+
+	assert md["key500"] == "value500"
+	assert md["ünïcödé"] == "välüé"
+	assert md[''] == ''
+	assert "key999" in md
+	assert "key1000" not in md
+	assert 1 not in md
+	assert md.get("key1000") is None
+	assert md.get("key1000", '') == ''
+
+	with pytest.raises(KeyError, match="key1000"):
+		md["key1000"]  # pylint: disable=pointless-statement
+
+
+def test_empty(tmp_pathplus: PathPlus):
+	frozendict().dump(tmp_pathplus / "empty.cawdrey")
+	md = MappedFrozenDict(tmp_pathplus / "empty.cawdrey")
+
+	assert len(md) == 0
+	assert md == {}
+	assert "key" not in md
+
+
+def test_hash(md: MappedFrozenDict, md_dict: Dict[str, str]):
+	assert hash(md) == hash(frozendict(md_dict))
+	assert hash(md) == hash(PersistentFrozenDict(md_dict))
+
+
+def test_derived(md: MappedFrozenDict, md_dict: Dict[str, str]):
+	assert type(md.copy()) is frozendict
+	assert md.copy() == md_dict
+	assert md.copy(key0='a')["key0"] == 'a'
+	assert md["key0"] == "value0"
+
+	assert md.pick(["key1", "missing"]) == {"key1": "value1"}
+	assert md.getmany(["key1", "missing"]) == ["value1", None]
+	assert md.contains_many(["key1", "missing"]) == [True, False]
+
+	evolver = md.evolver()
+	evolver["new"] = "value"
+	assert evolver.persistent() == {**md_dict, "new": "value"}
+
+	assert frozendict(md) == md_dict
+	assert copy.copy(md) is md
+
+
+def test_pickle(md: MappedFrozenDict, md_dict: Dict[str, str]):
+	for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+		unpickled = pickle.loads(pickle.dumps(md, protocol=protocol))
+		assert type(unpickled) is MappedFrozenDict
+		assert unpickled.path == md.path
+		assert unpickled == md_dict
+
+
+def test_dump_from_other_types(md_dict: Dict[str, str], tmp_pathplus: PathPlus):
+	for cls in (frozendict, PersistentFrozenDict):
+		cls(md_dict).dump(tmp_pathplus / "table.cawdrey")
+		assert MappedFrozenDict(tmp_pathplus / "table.cawdrey") == md_dict
+
+
+def test_dump_replaces(tmp_pathplus: PathPlus):
+	frozendict(a='1').dump(tmp_pathplus / "table.cawdrey")
+	md = MappedFrozenDict(tmp_pathplus / "table.cawdrey")
+
+	frozendict(b='2').dump(tmp_pathplus / "table.cawdrey")
+	assert md == {'a': '1'}
+	assert MappedFrozenDict(tmp_pathplus / "table.cawdrey") == {'b': '2'}
+
+
+@pytest.mark.parametrize("d", [{'a': 1}, {1: 'a'}])
+def test_dump_non_strings(d: dict, tmp_pathplus: PathPlus):
+	with pytest.raises(TypeError, match="must be strings"):
+		frozendict(d).dump(tmp_pathplus / "table.cawdrey")
+
+	assert not list(tmp_pathplus.iterdir())
+
+
+def test_invalid_file(tmp_pathplus: PathPlus):
+	(tmp_pathplus / "table.cawdrey").write_text("not a table")
+
+	with pytest.raises(ValueError, match="is not a MappedFrozenDict"):
+		MappedFrozenDict(tmp_pathplus / "table.cawdrey")
+
+
+def test_close(md: MappedFrozenDict):
+	md.close()
+
+	with pytest.raises(ValueError):
+		md["key0"]  # pylint: disable=pointless-statement
+
+
+def test_immutable(md: MappedFrozenDict):
+	with pytest.raises(TypeError):
+		md["key0"] = 'a'  # type: ignore[index]
+
+	with pytest.raises(TypeError):
+		md.__init__(md.path)  # type: ignore[misc]
+
+
+def test_adopt():
+	d = {"key0": "value0"}
+	new = MappedFrozenDict.adopt(d)
+
+	assert type(new) is frozendict
+	assert new == d
+	assert new._dict is d
+
+
+def test_repr(md: MappedFrozenDict):
+	assert repr(md) == f"<MappedFrozenDict {md.path!r}>"
@@ -1,8 +1,11 @@
 # stdlib
 from typing import Union
 
+# 3rd party
+import pytest
+
 # this package
-from cawdrey import NonelessDict
+from cawdrey import NonelessDict, NonelessOrderedDict
 
 
 def test_to_from_normal_dictionary():
@@ -38,3 +41,81 @@ def test_strict_none_with_none():
 	noneless: NonelessDict[str, Union[str, int]] = NonelessDict(hello="world", key=42)
 	noneless.set_with_strict_none_check("reality", None)
 	assert "reality" not in noneless
+
+
+def test_bulk_lookups():
+	noneless: NonelessDict[str, Union[str, int]] = NonelessDict(hello="world", key=42)
+
+	assert noneless.getmany(["hello", "missing"]) == ["world", None]
+	assert noneless.contains_many(["key", "missing"]) == [True, False]
+
+	picked = noneless.pick(["key"])
+	assert type(picked) is NonelessDict
+	assert picked == {"key": 42}
+	picked["other"] = 1
+	assert "other" not in noneless
+
+
+def test_ordered():
+	nod = NonelessOrderedDict([('b', 1), ('c', 3)])
+	nod['d'] = None
+	assert type(nod._dict) is dict
+	assert list(nod.items()) == [('b', 1), ('c', 3)]
+
+	new = nod.copy([('a', 2)])
+	assert type(new) is NonelessOrderedDict
+	assert list(new) == ['b', 'c', 'a']
+	assert list(nod) == ['b', 'c']
+
+
+@pytest.mark.parametrize("cls", [NonelessDict, NonelessOrderedDict])
+def test_constructor_filters(cls):
+	noneless = cls({"a": 1, "b": None, "c": [], "d": False}, e=0, f="f")
+	assert dict(noneless) == {"a": 1, "f": "f"}
+
+	noneless = cls([("a", 1), ("a", None), ("b", None), ("b", 2)])
+	assert dict(noneless) == {"a": 1, "b": 2}
+
+	assert not cls.fromkeys(["a", "b"])
+
+	with pytest.raises(TypeError, match="can only be initialised once"):
+		noneless.__init__()
+
+
+@pytest.mark.parametrize("cls", [NonelessDict, NonelessOrderedDict])
+def test_update(cls):
+	noneless = cls(a=1)
+
+	noneless.update({"b": 2, "c": None, "d": []}, e=0, f=3)
+	assert dict(noneless) == {"a": 1, "b": 2, "f": 3}
+
+	noneless.update([("g", 4), ("h", "")])
+	assert dict(noneless) == {"a": 1, "b": 2, "f": 3, "g": 4}
+
+	noneless.update_with_strict_none_check([("h", ""), ("i", None)], j=0)
+	assert dict(noneless) == {"a": 1, "b": 2, "f": 3, "g": 4, "h": "", "j": 0}
+
+	with pytest.raises(TypeError, match="expected at most 1 positional argument, got 2"):
+		noneless.update({}, {})
+
+
+@pytest.mark.parametrize("cls", [NonelessDict, NonelessOrderedDict])
+def test_from_items(cls):
+	items = {"a": 1, "b": None, "c": [], "d": 0}
+
+	noneless = cls.from_items(items)
+	assert type(noneless) is cls
+	assert dict(noneless) == {"a": 1}
+
+	noneless = cls.from_items(items.items(), strict_none=True)
+	assert dict(noneless) == {"a": 1, "c": [], "d": 0}
+
+
+@pytest.mark.parametrize("cls", [NonelessDict, NonelessOrderedDict])
+def test_copy_keeps_strict_values(cls):
+	noneless = cls(a=1)
+	noneless.set_with_strict_none_check("empty", [])
+
+	assert noneless.copy() == {"a": 1, "empty": []}
+	assert noneless.copy(b=None, c=2) == {"a": 1, "empty": [], "c": 2}
+	assert noneless.pick(["empty"]) == {"empty": []}
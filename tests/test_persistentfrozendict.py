@@ -0,0 +1,246 @@
+# stdlib
+import copy
+import pickle
+from typing import Any, List
+
+# 3rd party
+import pytest
+
+# this package
+from cawdrey import FrozenBase, PersistentFrozenDict, frozendict
+
+
+class BadHash:
+	"""
+	Key class where every instance has the same hash, to force collisions.
+	"""
+
+	def __init__(self, name: str):
+		self.name = name
+
+	def __hash__(self) -> int:
+		return 42
+
+	def __eq__(self, other: Any) -> bool:
+		return isinstance(other, BadHash) and self.name == other.name
+
+	def __repr__(self) -> str:
+		return f"BadHash({self.name!r})"
+
+
+class LabelledPersistentFrozenDict(PersistentFrozenDict):
+	__slots__ = ("label", "__dict__")
+
+
+@pytest.fixture()
+def pd_dict() -> dict:
+	return {f"key{i}": i for i in range(1000)}
+
+
+@pytest.fixture()
+def pd(pd_dict: dict) -> PersistentFrozenDict:
+	return PersistentFrozenDict(pd_dict)
+
+
+def test_mapping(pd: PersistentFrozenDict, pd_dict: dict):
+	assert isinstance(pd, FrozenBase)
+	assert len(pd) == len(pd_dict)
+	assert pd == pd_dict
+	assert dict(pd) == pd_dict
+	assert set(pd) == set(pd_dict)
+	assert pd["key500"] == 500
+	assert "key999" in pd
+	assert "key1000" not in pd
+	assert pd.get("key1000") is None
+	assert pd.get("key1000", -1) == -1
+
+	with pytest.raises(KeyError, match="key1000"):
+		pd["key1000"]  # pylint: disable=pointless-statement
+
+
+def test_constructor():
+	assert PersistentFrozenDict(a=1, b=2) == {'a': 1, 'b': 2}
+	assert PersistentFrozenDict([('a', 1), ('b', 2)], b=3) == {'a': 1, 'b': 3}
+	assert PersistentFrozenDict.fromkeys("ab", 0) == {'a': 0, 'b': 0}
+	assert len(PersistentFrozenDict()) == 0
+	assert not PersistentFrozenDict()
+
+
+def test_constructor_shares_root(pd: PersistentFrozenDict):
+	assert PersistentFrozenDict(pd)._root is pd._root
+
+
+def test_hash(pd: PersistentFrozenDict, pd_dict: dict):
+	assert hash(pd) == hash(frozendict(pd_dict))
+	assert hash(pd.set("key1", 1)) == hash(pd)
+
+	for new in (pd.set("new", 1), pd.set("key1", 2), pd.delete("key1"), pd.update(key1=2, new=1)):
+		assert new._hash is not None
+		assert new._hash == hash(frozendict(new))
+
+	with pytest.raises(TypeError):
+		hash(PersistentFrozenDict({1: []}))
+
+
+def test_set(pd: PersistentFrozenDict, pd_dict: dict):
+	new = pd.set("new", -1)
+
+	assert new["new"] == -1
+	assert len(new) == len(pd) + 1
+	assert "new" not in pd
+	assert pd == pd_dict
+
+	replaced = new.set("key0", "zero")
+	assert replaced["key0"] == "zero"
+	assert len(replaced) == len(new)
+	assert new["key0"] == 0
+
+	assert pd.set("key0", pd["key0"]) is pd
+
+
+def test_set_keeps_key():
+	# As with dict, replacing the value of an equal key keeps the original key object.
+	new = PersistentFrozenDict().set(1, 'x').set(True, 'y')
+	assert new == {1: 'y'}
+	assert type(next(iter(new))) is int
+
+	# hash(-1) == hash(-2), so these keys share a collision node.
+	collided = PersistentFrozenDict().set(-1, 'a').set(-2, 'b').set(-2.0, 'c')
+	assert collided == {-1: 'a', -2: 'c'}
+	assert [type(key) for key in collided] == [int, int]
+
+
+def test_delete(pd: PersistentFrozenDict, pd_dict: dict):
+	new = pd.delete("key0")
+
+	assert "key0" not in new
+	assert len(new) == len(pd) - 1
+	assert pd == pd_dict
+
+	with pytest.raises(KeyError, match="key0"):
+		new.delete("key0")
+
+	empty = PersistentFrozenDict(a=1).delete('a')
+	assert empty == {}
+	assert len(empty) == 0
+
+	for key in pd_dict:
+		pd = pd.delete(key)
+
+	assert pd == {}
+	assert len(pd) == 0
+
+
+def test_update(pd: PersistentFrozenDict, pd_dict: dict):
+	new = pd.update({"key0": 'a', "new": 'b'}, other='c')
+
+	expected = dict(pd_dict)
+	expected.update({"key0": 'a', "new": 'b'}, other='c')
+	assert new == expected
+	assert pd == pd_dict
+
+	assert pd.update() is pd
+	assert pd.copy(key0='a') == pd.update(key0='a')
+
+
+def test_evolver(pd: PersistentFrozenDict, pd_dict: dict):
+	evolver = pd.evolver()
+	assert evolver.persistent() is pd
+
+	evolver["new"] = -1
+	del evolver["key0"]
+	evolver.update(key1='a')
+
+	assert "new" in evolver
+	assert evolver["key1"] == 'a'
+	assert len(evolver) == len(pd_dict)
+
+	new = evolver.persistent()
+	assert isinstance(new, PersistentFrozenDict)
+	assert new == pd.set("new", -1).delete("key0").set("key1", 'a')
+	assert pd == pd_dict
+
+	evolver.clear()
+	assert evolver.persistent() == {}
+
+
+def test_collisions():
+	a, b, c = BadHash('a'), BadHash('b'), BadHash('c')
+
+	pd = PersistentFrozenDict({a: 1, b: 2, "other": 3})
+	assert pd[a] == 1
+	assert pd[b] == 2
+	assert c not in pd
+
+	pd = pd.set(c, 3).set(a, 10)
+	assert pd == {a: 10, b: 2, c: 3, "other": 3}
+
+	pd = pd.delete(b).delete(a)
+	assert pd == {c: 3, "other": 3}
+	assert len(pd) == 2
+
+	with pytest.raises(KeyError):
+		pd.delete(a)
+
+
+def test_immutable(pd: PersistentFrozenDict):
+	with pytest.raises(TypeError):
+		pd["key0"] = 1  # type: ignore[index]
+
+	with pytest.raises(TypeError):
+		del pd["key0"]  # type: ignore[attr-defined]
+
+	with pytest.raises(TypeError):
+		pd.__init__({"key0": 1})  # type: ignore[misc]
+
+
+def test_repr():
+	assert repr(PersistentFrozenDict(a=1)) == "<PersistentFrozenDict {'a': 1}>"
+
+
+def test_bulk_lookups(pd: PersistentFrozenDict):
+	assert pd.getmany(["key1", "missing", "key2"], -1) == [1, -1, 2]
+	assert pd.contains_many(["key1", "missing"]) == [True, False]
+
+	picked = pd.pick(["key2", "key1", "missing"])
+	assert type(picked) is PersistentFrozenDict
+	assert picked == {"key1": 1, "key2": 2}
+
+	evolver = pd.evolver()
+	evolver["new"] = 0
+	assert evolver.getmany(["new", "key1"]) == [0, 1]
+	assert evolver.contains_many(["new", "missing"]) == [True, False]
+	assert evolver.pick(["new"]) == {"new": 0}
+
+
+def test_proxy(pd: PersistentFrozenDict, pd_dict: dict):
+	assert pd.proxy() == pd_dict
+	assert "key1" in pd.proxy()
+
+
+def test_subclass_state():
+	tags: List[str] = []
+
+	pd = LabelledPersistentFrozenDict(a=1, b=[2])
+	pd.label = "defaults"
+	pd.tags = tags
+
+	new = copy.deepcopy(pd)
+	assert type(new) is LabelledPersistentFrozenDict
+	assert new == pd
+	assert new['b'] is not pd['b']
+	assert new.label == "defaults"
+	assert new.tags == tags
+	assert new.tags is not tags
+
+	atomic = LabelledPersistentFrozenDict(a=1)
+	atomic.label = "atomic"
+	new = copy.deepcopy(atomic)
+	assert new is not atomic
+	assert new.label == "atomic"
+
+	new = pickle.loads(pickle.dumps(pd))
+	assert type(new) is LabelledPersistentFrozenDict
+	assert new == pd
+	assert new.label == "defaults"
+	assert new.tags == tags
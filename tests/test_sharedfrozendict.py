@@ -0,0 +1,89 @@
+# stdlib
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List
+
+# 3rd party
+import pytest
+
+# this package
+from cawdrey import FrozenBase, SharedFrozenDict, frozendict
+
+
+def lookup(shared: SharedFrozenDict, keys: List[str]) -> List[str]:
+	return [shared[key] for key in keys]
+
+
+@pytest.fixture()
+def sd_dict() -> Dict[str, str]:
+	return {f"key{i}": f"value{i}" for i in range(1000)}
+
+
+@pytest.fixture()
+def sd(sd_dict: Dict[str, str]):
+	with frozendict(sd_dict).to_shared() as sd:
+		yield sd
+
+
+def test_mapping(sd: SharedFrozenDict, sd_dict: Dict[str, str]):
+	assert isinstance(sd, FrozenBase)
+	assert sd.owner
+	assert len(sd) == len(sd_dict)
+	assert sd == sd_dict
+	assert list(sd.items()) == list(sd_dict.items())
+	assert sd["key500"] == "value500"
+	assert "key1000" not in sd
+	assert sd.get("key1000") is None
+	assert hash(sd) == hash(frozendict(sd_dict))
+	assert sd.copy(a='b') == {**sd_dict, 'a': 'b'}
+	assert repr(sd) == f"<SharedFrozenDict {sd.name!r}>"
+
+	with pytest.raises(KeyError, match="key1000"):
+		sd["key1000"]  # pylint: disable=pointless-statement
+
+
+def test_read_only(sd: SharedFrozenDict):
+	with pytest.raises(TypeError):
+		sd["key0"] = 'a'  # type: ignore[index]
+
+	with pytest.raises(TypeError):
+		sd._buffer[0] = 0
+
+
+def test_attach(sd: SharedFrozenDict, sd_dict: Dict[str, str]):
+	with SharedFrozenDict(sd.name) as attached:
+		assert not attached.owner
+		assert attached == sd_dict
+
+	# Closing another instance does not destroy the block.
+	assert sd["key0"] == "value0"
+
+	unpickled = pickle.loads(pickle.dumps(sd))
+	assert not unpickled.owner
+	assert unpickled.name == sd.name
+	assert unpickled == sd_dict
+	unpickled.close()
+
+
+def test_pickle_size(sd: SharedFrozenDict, sd_dict: Dict[str, str]):
+	assert len(pickle.dumps(sd)) < 200 < len(pickle.dumps(frozendict(sd_dict)))
+
+
+def test_process_pool(sd: SharedFrozenDict):
+	with ProcessPoolExecutor(max_workers=1) as executor:
+		assert executor.submit(lookup, sd, ["key1", "key999"]).result() == ["value1", "value999"]
+
+
+def test_close(sd_dict: Dict[str, str]):
+	sd = frozendict(sd_dict).to_shared()
+	name = sd.name
+	sd.close()
+	sd.close()
+
+	with pytest.raises(FileNotFoundError):
+		SharedFrozenDict(name)
+
+
+def test_non_strings():
+	with pytest.raises(TypeError, match="must be strings"):
+		frozendict(a=1).to_shared()